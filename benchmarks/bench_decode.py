@@ -0,0 +1,81 @@
+"""전종목시세(12001) 응답 디코딩 비교
+
+응답 bytes에서 타입이 변환된 DataFrame까지의 시간과 최대 메모리를 비교한다.
+
+- legacy  : json.loads -> DataFrame(행 dict 목록) -> Schema.parse
+- rows    : pykrx 디코더 -> DataFrame(행 dict 목록) -> Schema.parse
+- columnar: pykrx 디코더 -> Schema.frame (필요한 필드만) -> Schema.parse
+
+pykrx 디코더는 orjson이 설치되어 있으면 orjson, 아니면 json이다. legacy와
+rows의 차이는 디코더 교체, rows와 columnar의 차이는 컬럼 단위 생성의
+효과이다.
+
+    python benchmarks/bench_decode.py [recorded.json ...]
+
+녹화된 응답 본문(JSON) 파일을 입력하지 않으면 KRX 응답 형식의 전종목
+데이터를 생성해서 사용한다.
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+import pandas as pd
+
+# 설치하지 않은 저장소에서도 pykrx를 불러올 수 있게 한다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pykrx.website.krx.krxio import _loads
+from pykrx.website.krx.market.core import 전종목시세
+from bench_parser import make_payload
+
+schema = 전종목시세.schema
+
+
+def legacy(content: bytes):
+    result = json.loads(content)
+    return schema.parse(pd.DataFrame(result[schema.block]))
+
+
+def rows(content: bytes):
+    result = _loads(content)
+    return schema.parse(pd.DataFrame(result[schema.block]))
+
+
+def columnar(content: bytes):
+    return schema.parse(schema.frame(_loads(content)))
+
+
+def peak_memory(func, content: bytes) -> int:
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    if len(sys.argv) > 1:
+        payloads = []
+        for path in sys.argv[1:]:
+            with open(path, "rb") as f:
+                payloads.append((path, f.read()))
+    else:
+        payloads = [("synthetic", json.dumps(make_payload()).encode())]
+
+    print(f"decoder: {_loads.__module__}")
+    for name, content in payloads:
+        pd.testing.assert_frame_equal(legacy(content), columnar(content))
+        pd.testing.assert_frame_equal(rows(content), columnar(content))
+        print(f"{name} ({len(content) / 1024:.0f} KiB)")
+        for label, func in (("legacy", legacy), ("rows", rows),
+                            ("columnar", columnar)):
+            elapsed = min(timeit.repeat(lambda: func(content), number=10,
+                                        repeat=5)) / 10
+            peak = peak_memory(func, content)
+            print(f"{label:>10}: {elapsed * 1000:8.2f} ms "
+                  f"{peak / 1024 / 1024:8.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
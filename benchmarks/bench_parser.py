@@ -0,0 +1,97 @@
+"""전종목시세(12001) 응답의 문자열 변환 시간 비교
+
+기존의 DataFrame 전체 정규식 replace 방식과 parse_frame을 비교한다.
+
+    python benchmarks/bench_parser.py [recorded.json]
+
+녹화된 응답(JSON) 파일을 입력하지 않으면 KRX 응답 형식의 전종목 데이터를
+생성해서 사용한다.
+"""
+import json
+import os
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+
+# 설치하지 않은 저장소에서도 pykrx를 불러올 수 있게 한다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pykrx.website.comm.parser import parse_frame
+
+COLUMNS = ['ISU_SRT_CD', 'TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC', 'TDD_CLSPRC',
+           'ACC_TRDVOL', 'ACC_TRDVAL', 'FLUC_RT']
+NAMES = ['티커', '시가', '고가', '저가', '종가', '거래량', '거래대금', '등락률']
+DTYPES = {"시가": np.int32, "고가": np.int32, "저가": np.int32,
+          "종가": np.int32, "거래량": np.int32, "거래대금": np.int64,
+          "등락률": np.float32}
+
+
+def make_payload(rows: int = 2800, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    close = rng.integers(100, 1_000_000, rows)
+    volume = rng.integers(0, 50_000_000, rows)
+
+    def fmt(values):
+        return [f"{v:,}" for v in values]
+
+    block = {
+        'ISU_SRT_CD': [f"{i:06d}" for i in range(rows)],
+        'ISU_ABBRV': [f"종목{i}" for i in range(rows)],
+        'MKT_NM': ["KOSPI"] * rows,
+        'SECT_TP_NM': [""] * rows,
+        'TDD_CLSPRC': fmt(close),
+        'FLUC_TP_CD': ["1"] * rows,
+        'CMPPREVDD_PRC': fmt(rng.integers(-1000, 1000, rows)),
+        'FLUC_RT': [f"{v:.2f}" for v in rng.normal(0, 2, rows)],
+        'TDD_OPNPRC': fmt(close),
+        'TDD_HGPRC': fmt(close + 10),
+        'TDD_LWPRC': fmt(close - 10),
+        'ACC_TRDVOL': fmt(volume),
+        'ACC_TRDVAL': fmt(volume * close),
+        'MKTCAP': fmt(close * 10_000_000),
+        'LIST_SHRS': fmt(rng.integers(1_000_000, 6_000_000_000, rows)),
+        'MKT_ID': ["STK"] * rows,
+    }
+    # 거래정지 종목은 가격이 '-'로 내려온다.
+    for key in ('TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC', 'FLUC_RT'):
+        for i in range(0, rows, 97):
+            block[key][i] = "-"
+    records = [dict(zip(block, values)) for values in zip(*block.values())]
+    return {'OutBlock_1': records, 'CURRENT_DATETIME': "2021.01.04 PM 04:00:00"}
+
+
+def legacy(df):
+    df = df[COLUMNS]
+    df.columns = NAMES
+    df = df.replace(r'[^-\w\.]', '', regex=True)
+    df = df.replace(r'\-$', '0', regex=True)
+    df = df.replace('', '0')
+    df = df.set_index('티커')
+    return df.astype(DTYPES)
+
+
+def vectorized(df):
+    df = df[COLUMNS]
+    df.columns = NAMES
+    df = df.set_index('티커')
+    return parse_frame(df, DTYPES)
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            payload = json.load(f)
+    else:
+        payload = make_payload()
+    df = pd.DataFrame(payload['OutBlock_1'])
+
+    pd.testing.assert_frame_equal(legacy(df), vectorized(df))
+    print(f"rows: {len(df)}")
+    for name, func in (("legacy", legacy), ("parse_frame", vectorized)):
+        elapsed = min(timeit.repeat(lambda: func(df), number=10, repeat=5))
+        print(f"{name:>12}: {elapsed / 10 * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
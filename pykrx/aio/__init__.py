@@ -0,0 +1 @@
+from .stock_api import *
@@ -0,0 +1,119 @@
+"""pykrx.stock의 asyncio 버전
+
+조회 함수는 pykrx.stock의 함수를 그대로 실행하되, KRX 요청은 보내지 않고
+필요한 요청 목록만 수집한다. 수집한 요청을 이벤트 루프에서 동시에 받은 뒤
+함수를 다시 실행하므로 응답 파싱은 동기 API와 같은 코드(wrap.py)를 사용한다.
+
+    >>> from pykrx import aio
+    >>> df = await aio.get_market_ohlcv("20210104", "20210108", "005930")
+"""
+from pykrx import stock
+from pykrx.website.comm.webio import async_session_pool
+from pykrx.website.krx.krxio import (AsyncKrxWebIo, KrxWebIo,
+                                     PendingRequests, deferred_requests)
+from pandas import DataFrame
+import asyncio
+
+
+async def run(func, *args, **kwargs):
+    """동기 조회 함수를 실행하고, 필요한 KRX 요청은 이벤트 루프에서 받는다.
+
+    Args:
+        func (callable): pykrx.stock의 조회 함수 (또는 이를 호출하는 함수)
+
+    Returns:
+        func의 반환 값
+    """
+    memo = {}
+    io = AsyncKrxWebIo()
+    while True:
+        with deferred_requests(memo):
+            try:
+                return func(*args, **kwargs)
+            except PendingRequests as e:
+                pending = e.requests
+
+        keys = [KrxWebIo._cache_key(params) for params in pending]
+        if all(key in memo for key in keys):
+            raise RuntimeError("KRX requests could not be resolved")
+        contents = await asyncio.gather(
+            *(io.read(**params) for params in pending))
+        memo.update(zip(keys, contents))
+
+
+async def close():
+    """현재 이벤트 루프에서 사용한 HTTP 세션을 닫는다."""
+    await async_session_pool.close()
+
+
+async def get_nearest_business_day_in_a_week(date: str = None,
+                                             prev: bool = True) -> str:
+    """stock.get_nearest_business_day_in_a_week 참고"""
+    return await run(stock.get_nearest_business_day_in_a_week, date, prev)
+
+
+async def get_market_ticker_list(date: str = None, market: str = "KOSPI",
+                                 use_universe: bool = False) -> list:
+    """stock.get_market_ticker_list 참고"""
+    return await run(stock.get_market_ticker_list, date, market,
+                     use_universe)
+
+
+async def get_market_ohlcv(*args, **kwargs) -> DataFrame:
+    """stock.get_market_ohlcv 참고"""
+    return await run(stock.get_market_ohlcv, *args, **kwargs)
+
+
+async def get_market_ohlcv_by_date(*args, **kwargs) -> DataFrame:
+    """stock.get_market_ohlcv_by_date 참고"""
+    return await run(stock.get_market_ohlcv_by_date, *args, **kwargs)
+
+
+async def get_market_ohlcv_by_ticker(*args, **kwargs) -> DataFrame:
+    """stock.get_market_ohlcv_by_ticker 참고"""
+    return await run(stock.get_market_ohlcv_by_ticker, *args, **kwargs)
+
+
+async def get_market_cap(*args, **kwargs) -> DataFrame:
+    """stock.get_market_cap 참고"""
+    return await run(stock.get_market_cap, *args, **kwargs)
+
+
+async def get_market_cap_by_date(*args, **kwargs) -> DataFrame:
+    """stock.get_market_cap_by_date 참고"""
+    return await run(stock.get_market_cap_by_date, *args, **kwargs)
+
+
+async def get_market_cap_by_ticker(*args, **kwargs) -> DataFrame:
+    """stock.get_market_cap_by_ticker 참고"""
+    return await run(stock.get_market_cap_by_ticker, *args, **kwargs)
+
+
+async def get_market_fundamental(*args, **kwargs) -> DataFrame:
+    """stock.get_market_fundamental 참고"""
+    return await run(stock.get_market_fundamental, *args, **kwargs)
+
+
+async def get_market_fundamental_by_date(*args, **kwargs) -> DataFrame:
+    """stock.get_market_fundamental_by_date 참고"""
+    return await run(stock.get_market_fundamental_by_date, *args, **kwargs)
+
+
+async def get_market_fundamental_by_ticker(*args, **kwargs) -> DataFrame:
+    """stock.get_market_fundamental_by_ticker 참고"""
+    return await run(stock.get_market_fundamental_by_ticker, *args, **kwargs)
+
+
+async def get_index_ohlcv(*args, **kwargs) -> DataFrame:
+    """stock.get_index_ohlcv 참고"""
+    return await run(stock.get_index_ohlcv, *args, **kwargs)
+
+
+async def get_index_ohlcv_by_date(*args, **kwargs) -> DataFrame:
+    """stock.get_index_ohlcv_by_date 참고"""
+    return await run(stock.get_index_ohlcv_by_date, *args, **kwargs)
+
+
+async def get_index_ohlcv_by_ticker(*args, **kwargs) -> DataFrame:
+    """stock.get_index_ohlcv_by_ticker 참고"""
+    return await run(stock.get_index_ohlcv_by_ticker, *args, **kwargs)
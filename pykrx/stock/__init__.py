@@ -1,2 +1,3 @@
 from .stock_api import *
 from .future_api import *
+from .panel_api import *
@@ -0,0 +1,162 @@
+from pykrx.website import krx
+from pykrx.website.krx.krxio import KrxWebIo
+from pykrx.stock.stock_api import get_market_ohlcv_batch
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import pandas as pd
+from pandas import DataFrame
+
+_FIELDS = pd.Index(['시가', '고가', '저가', '종가', '거래량', '거래대금', '등락률'])
+
+
+def plan_market_ohlcv_panel(fromdate: str, todate: str, tickers: list,
+                            adjusted: bool = False) -> dict:
+    """여러 종목 x 기간의 OHLCV를 조회할 때 필요한 KRX 요청 수를 추정하고
+    요청이 적은 조회 방식을 선택한다.
+
+    - snapshot: 일자별 전종목시세 (영업일 수 만큼 요청, 휴장일 제외)
+    - history : 종목별 개별종목시세 (종목 수 x 기간 분할 수 만큼 요청)
+
+    전종목시세는 수정 주가를 제공하지 않으므로 adjusted가 True이면 항상
+    history를 선택한다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list          ): 조회할 종목의 티커 목록
+        adjusted (bool, optional): 수정 종가 여부 (True/False)
+
+    Returns:
+        dict:
+
+            >> plan_market_ohlcv_panel("20210104", "20210129", ["005930", "000660"])
+
+            {'strategy': 'history', 'snapshot': 20, 'history': 2}
+    """  # pylint: disable=line-too-long # noqa: E501
+    fromdate = _to_yyyymmdd(fromdate)
+    todate = _to_yyyymmdd(todate)
+
+    snapshot = len(krx.TradingCalendar().business_days(fromdate, todate))
+    windows = len(KrxWebIo._split_period(fromdate, todate))
+    history = len(set(tickers)) * windows
+
+    if adjusted or history <= snapshot:
+        strategy = "history"
+    else:
+        strategy = "snapshot"
+    return {"strategy": strategy, "snapshot": snapshot, "history": history}
+
+
+def get_market_ohlcv_panel(
+    fromdate: str, todate: str, tickers: list, adjusted: bool = False,
+        strategy: str = "auto", max_workers: int = 8) -> DataFrame:
+    """여러 종목의 지정된 기간 OHLCV를 날짜 x (항목, 티커) 패널로 조회
+
+    plan_market_ohlcv_panel로 요청 수가 적은 방식을 선택한다. snapshot
+    방식에서 전종목시세에 없는 종목 (ETF 등)은 종목별로 다시 조회한다.
+    선택된 방식은 df.attrs['strategy'], 조회에 실패한 종목은
+    df.attrs['failed']에 기록된다.
+
+    Args:
+        fromdate    (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate      (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers     (list          ): 조회할 종목의 티커 목록
+        adjusted    (bool, optional): 수정 종가 여부 (True/False)
+        strategy    (str,  optional): auto / snapshot / history
+        max_workers (int,  optional): 동시에 보낼 요청의 수
+
+    Returns:
+        DataFrame:
+
+            >> df = get_market_ohlcv_panel("20210118", "20210119", ["005930"])
+            >> df['종가']
+
+            티커        005930
+            날짜
+            2021-01-18   85000
+            2021-01-19   87000
+    """  # pylint: disable=line-too-long # noqa: E501
+    fromdate = _to_yyyymmdd(fromdate)
+    todate = _to_yyyymmdd(todate)
+    tickers = list(dict.fromkeys(tickers))
+
+    if strategy == "auto":
+        strategy = plan_market_ohlcv_panel(
+            fromdate, todate, tickers, adjusted)['strategy']
+    if strategy not in ("snapshot", "history"):
+        raise ValueError("strategy must be 'auto', 'snapshot' or 'history'")
+    if strategy == "snapshot" and adjusted:
+        raise ValueError("snapshot strategy does not support adjusted prices")
+
+    failed = {}
+    if strategy == "snapshot":
+        df = _fetch_snapshots(fromdate, todate, tickers, max_workers)
+        found = set(df.columns.get_level_values(1)) \
+            if len(df.columns) > 0 else set()
+        missing = [t for t in tickers if t not in found]
+        if len(missing) > 0:
+            strategy = "mixed"
+            rest, failed = _fetch_histories(
+                fromdate, todate, missing, adjusted, max_workers)
+            df = rest if len(df.columns) == 0 else \
+                pd.concat([df, rest], axis=1)
+    else:
+        df, failed = _fetch_histories(
+            fromdate, todate, tickers, adjusted, max_workers)
+
+    if len(df.columns) > 0:
+        order = [t for t in tickers if t in set(df.columns.get_level_values(1))]
+        fields = _FIELDS.intersection(df.columns.get_level_values(0),
+                                      sort=False)
+        df = df.reindex(columns=pd.MultiIndex.from_product(
+            [fields, order], names=['항목', '티커']))
+        df = df.sort_index()
+    df.attrs['strategy'] = strategy
+    df.attrs['failed'] = failed
+    return df
+
+
+def _to_yyyymmdd(date) -> str:
+    if isinstance(date, datetime.datetime):
+        date = krx.datetime2string(date)
+    return date.replace("-", "")
+
+
+def _fetch_snapshots(fromdate, todate, tickers, max_workers) -> DataFrame:
+    days = krx.TradingCalendar().business_days(fromdate, todate)
+    dates = [d.strftime("%Y%m%d") for d in days]
+
+    def _fetch(date):
+        return krx.get_market_ohlcv_by_ticker(date, "ALL")
+
+    workers = max(1, min(max_workers, len(dates)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        snapshots = list(executor.map(_fetch, dates))
+
+    frames = []
+    for date, df in zip(dates, snapshots):
+        if len(df) == 0:
+            continue
+        # 달력에 없는 휴장일은 모든 종목의 시가/고가/저가/종가가 0으로
+        # 채워진다.
+        if (df[['시가', '고가', '저가', '종가']] == 0).all(axis=None):
+            continue
+        df = df[df.index.isin(tickers)].reset_index()
+        df['날짜'] = pd.Timestamp(date)
+        frames.append(df)
+
+    if len(frames) == 0:
+        return DataFrame()
+    df = pd.concat(frames).pivot(index='날짜', columns='티커')
+    df.columns.names = ['항목', '티커']
+    return df
+
+
+def _fetch_histories(fromdate, todate, tickers, adjusted, max_workers):
+    df = get_market_ohlcv_batch(fromdate, todate, tickers, adjusted=adjusted,
+                                max_workers=max_workers, layout="wide")
+    failed = df.attrs.get('failed', {})
+    if len(df.columns) > 0:
+        df = df.swaplevel(axis=1)
+        df.columns.names = ['항목', '티커']
+    return df, failed
@@ -1,12 +1,15 @@
 from multipledispatch import dispatch
 from typing import overload
 from pykrx.website import krx
+import collections
 import datetime
 import inspect
+import itertools
 import functools
 import pandas as pd
 from deprecated import deprecated
 from pandas import DataFrame
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 regex_yymmdd = re.compile(r"\d{4}[-/]?\d{2}[-/]?\d{2}")
@@ -66,12 +69,73 @@ def get_nearest_business_day_in_a_week(date: str = None, prev: bool = True) \
     return krx.get_nearest_business_day_in_a_week(date, prev)
 
 
-def get_market_ticker_list(date: str = None, market: str = "KOSPI") -> list:
+def warmup(max_workers: int = 4):
+    """종목/지수/ETF·ETN·ELW 마스터와 영업일 달력을 미리 읽어둔다.
+
+    Args:
+        max_workers (int, optional): 동시에 조회할 마스터의 수
+    """
+    krx.warmup(max_workers)
+
+
+def enable_cache(path: str = None, max_bytes: int = 512 * 1024 * 1024,
+                 ttl: float = 600):
+    """KRX 조회 결과를 디스크에 캐싱
+
+    Args:
+        path      (str, optional): 캐시 파일 경로 (기본값: ~/.pykrx)
+        max_bytes (int, optional): 캐시의 최대 크기
+        ttl     (float, optional): 오늘을 포함하는 조회 결과의 유지 시간 (초)
+    """
+    krx.enable_cache(path, max_bytes, ttl)
+
+
+def disable_cache():
+    """KRX 조회 결과 캐싱 중지"""
+    krx.disable_cache()
+
+
+def batch_requests():
+    """블록 안의 조회에 요청 속도 제한을 적용
+
+    단건 조회는 속도 제한 없이 바로 요청한다. 반복문으로 많은 종목/일자를
+    조회할 때 블록으로 감싸면 KRX 서버에 보내는 요청이 공용 스케줄러의
+    속도(configure_request_scheduler)로 제한된다.
+
+        >> with stock.batch_requests():
+        >>     for ticker in tickers:
+        >>         df = stock.get_market_ohlcv("20210104", "20210108", ticker)
+    """
+    return krx.batch_requests()
+
+
+def configure_snapshot_cache(max_bytes: int = None,
+                             intraday_ttl: float = None):
+    """전종목시세 메모리 캐시 설정
+
+    같은 일자/시장의 OHLCV, 시가총액, 티커 목록 조회는 한 번 받은
+    전종목시세를 함께 사용한다. 오늘의 (장중) 시세는 기본적으로 캐싱하지
+    않으므로 항상 새로 조회한다.
+
+    Args:
+        max_bytes    (int  , optional): 최대 크기. 0이면 캐싱하지 않는다.
+        intraday_ttl (float, optional): 오늘의 시세를 캐싱할 시간(초).
+                                        기본값 0은 캐싱하지 않음
+    """
+    krx.configure_snapshot_cache(max_bytes, intraday_ttl)
+
+
+def get_market_ticker_list(date: str = None, market: str = "KOSPI",
+                           use_universe: bool = False) -> list:
     """티커 목록 조회
 
     Args:
-        date   (str, optional): 조회 일자 (YYYYMMDD)
-        market (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        date         (str, optional): 조회 일자 (YYYYMMDD)
+        market       (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        use_universe (bool, optional): get_market_ticker_universe로 만들어 둔
+                                       색인이 date를 포함하면 색인에서 조회.
+                                       색인은 아주 짧게 상장된 종목을 놓칠 수
+                                       있다.
 
     Returns:
         list: 티커가 담긴 리스트
@@ -79,10 +143,43 @@ def get_market_ticker_list(date: str = None, market: str = "KOSPI") -> list:
     if date is None:
         date = get_nearest_business_day_in_a_week()
 
+    if use_universe:
+        index = krx.get_universe_index(market)
+        if index.covers(date.replace("-", ""), date.replace("-", "")):
+            return index.get_tickers(date)
+
     s = krx.get_market_ticker_and_name(date, market)
     return s.index.to_list()
 
 
+def get_market_ticker_universe(fromdate: str, todate: str,
+                               market: str = "KOSPI") -> DataFrame:
+    """기간 중 영업일별 종목 구성 (생존 편향 없는 백테스트용)
+
+    시장별 종목의 상장 구간 색인(UniverseIndex)을 만들어 디스크에 저장하고,
+    이후의 조회는 색인에서 처리한다. get_market_ticker_list에
+    use_universe=True를 입력하면 같은 색인을 사용한다.
+
+    Args:
+        fromdate (str): 조회 시작 일자 (YYYYMMDD)
+        todate   (str): 조회 종료 일자 (YYYYMMDD)
+        market   (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+    Returns:
+        DataFrame: 날짜 x 티커의 상장 여부 (bool)
+
+            >> get_market_ticker_universe("20210104", "20210108")
+
+            티커        000020  000040  000050  ...
+            날짜
+            2021-01-04    True    True    True  ...
+            2021-01-05    True    True    True  ...
+    """
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    return krx.get_universe_index(market).membership(fromdate, todate)
+
+
 def get_market_ticker_name(ticker: str) -> str:
     """티커에 대응되는 종목 이름 반환
 
@@ -96,19 +193,55 @@ def get_market_ticker_name(ticker: str) -> str:
 
 
 def __get_business_days_0(year: int, month: int):
-    strt = f"{year}{month:02}01"
-    if month == 12:
-        last = f"{year+1}0101"
-    else:
-        last = f"{year}{month+1:02}01"
-    df = krx.get_market_ohlcv_by_date(strt, last, "000020")
-    cond = df.index.month[0] == df.index.month
-    return df.index[cond].to_list()
+    strt = pd.Timestamp(year=year, month=month, day=1)
+    last = strt + pd.offsets.MonthEnd(0)
+    return get_business_days_index(strt, last).to_list()
 
 
 def __get_business_days_1(strt: str, last: str):
-    df = krx.get_market_ohlcv_by_date(strt, last, "000020")
-    return df.index.to_list()
+    return get_business_days_index(strt, last).to_list()
+
+
+def get_business_days_index(fromdate: str, todate: str) -> pd.DatetimeIndex:
+    """기간 중의 영업일 (양 끝 포함)
+
+    영업일 달력(TradingCalendar)에서 조회하므로 수십 년 기간도 KRX 요청 없이
+    바로 반환한다.
+
+    Args:
+        fromdate (str): 조회 시작 일자 (YYYYMMDD)
+        todate   (str): 조회 종료 일자 (YYYYMMDD)
+
+    Returns:
+        DatetimeIndex:
+
+            >> get_business_days_index("20210101", "20210108")
+
+            DatetimeIndex(['2021-01-04', '2021-01-05', '2021-01-06',
+                           '2021-01-07', '2021-01-08'],
+                          dtype='datetime64[ns]', name='날짜', freq=None)
+    """
+    return krx.TradingCalendar().business_days(fromdate, todate)
+
+
+def get_nearest_business_days(dates, prev: bool = True) -> pd.DatetimeIndex:
+    """여러 날짜의 인접 영업일을 한 번에 조회
+    (get_nearest_business_day_in_a_week의 벡터 버전)
+
+    Args:
+        dates (list-like): 조회할 날짜 목록
+        prev  (bool, optional): 이전 영업일을 조회할지 이후 영업일을 조회할지
+                                조정하는 flag
+
+    Returns:
+        DatetimeIndex:
+
+            >> get_nearest_business_days(["20210101", "20210104"])
+
+            DatetimeIndex(['2020-12-30', '2021-01-04'],
+                          dtype='datetime64[ns]', name='날짜', freq=None)
+    """
+    return krx.TradingCalendar().nearest_many(dates, prev)
 
 
 def get_previous_business_days(**kwargs) -> list:
@@ -291,6 +424,153 @@ def get_market_ohlcv_by_ticker(
     return df
 
 
+def get_market_ohlcv_batch(
+    fromdate: str, todate: str, tickers: list, freq: str = 'd',
+        adjusted: bool = True, max_workers: int = 8,
+        layout: str = "long") -> DataFrame:
+    """여러 종목의 지정된 기간 OHLCV를 동시에 조회
+
+    get_market_ohlcv_by_date를 종목별로 최대 max_workers개씩 동시에 실행한다.
+    요청 속도는 공용 스케줄러(configure_request_scheduler)로 제한된다.
+    조회에 실패한 종목은 결과에서 제외되고 df.attrs['failed']에 기록된다.
+
+    Args:
+        fromdate    (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate      (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers     (list          ): 조회할 종목의 티커 목록
+        freq        (str,  optional): d - 일 / m - 월 / y - 년
+        adjusted    (bool, optional): 수정 종가 여부 (True/False)
+        max_workers (int,  optional): 동시에 조회할 종목의 수
+        layout      (str,  optional): long - (티커, 날짜) MultiIndex 행
+                                      wide - 날짜 행, (티커, 항목) MultiIndex 열
+
+    Returns:
+        DataFrame:
+
+            >> df = get_market_ohlcv_batch("20210118", "20210119", ["005930", "999999"])
+
+                                시가   고가   저가   종가    거래량
+            티커   날짜
+            005930 2021-01-18  86600  87300  84100  85000  43227951
+                   2021-01-19  84500  88000  83600  87000  39895044
+
+            >> df.attrs['failed']
+
+            {'999999': 'unknown ticker'}
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    if layout not in ("long", "wide"):
+        raise ValueError("layout must be 'long' or 'wide'")
+
+    tickers = list(dict.fromkeys(tickers))
+    # 종목 마스터에 없는 종목은 요청하지 않는다.
+    isins = krx.get_stock_ticker_isins(tickers)
+    failed = {t: "unknown ticker" for t, isin in zip(tickers, isins)
+              if isin is None}
+    tickers = [t for t in tickers if t not in failed]
+
+    def _fetch(ticker):
+        try:
+            with krx.batch_requests():
+                return get_market_ohlcv_by_date(fromdate, todate, ticker,
+                                                freq, adjusted), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+
+    workers = max(1, min(max_workers, len(tickers)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_fetch, tickers))
+
+    frames = {}
+    for ticker, (df, error) in zip(tickers, results):
+        if error is not None:
+            failed[ticker] = error
+        elif df is None or len(df) == 0:
+            failed[ticker] = "empty result"
+        else:
+            frames[ticker] = df
+
+    if len(frames) == 0:
+        df = DataFrame()
+    elif layout == "long":
+        df = pd.concat(frames, names=['티커', '날짜'])
+    else:
+        df = pd.concat(frames, axis=1, names=['티커', '항목'])
+    df.attrs['failed'] = failed
+    return df
+
+
+def iter_market_snapshots(
+    fromdate: str, todate: str, kind: str = "ohlcv", market: str = "KOSPI",
+        prefetch: int = 4, **kwargs):
+    """기간 중 영업일별 전종목 조회 결과를 날짜 순서대로 하나씩 반환
+
+    소비하는 동안 다음 영업일 prefetch개를 미리 조회한다. 조회가 끝나고
+    아직 소비되지 않은 결과는 최대 prefetch개까지만 메모리에 남는다.
+    조회에 실패한 날짜는 그 날짜를 꺼낼 때 예외가 발생한다.
+
+    Args:
+        fromdate (str          ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str          ): 조회 종료 일자 (YYYYMMDD)
+        kind     (str, optional): ohlcv - get_market_ohlcv_by_ticker
+                                  cap - get_market_cap_by_ticker
+                                  fundamental - get_market_fundamental_by_ticker
+                                  shorting_balance - get_shorting_balance_by_ticker
+        market   (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        prefetch (int, optional): 미리 조회할 영업일의 수. 0이면 꺼낼 때 조회
+        kwargs                  : 조회 함수에 그대로 전달할 인자
+
+    Returns:
+        generator: (날짜 Timestamp, DataFrame)
+
+            >> for date, df in iter_market_snapshots("20210104", "20210105"):
+            >>     df.to_parquet(f"{date:%Y%m%d}.parquet")
+    """  # pylint: disable=line-too-long # noqa: E501
+    snapshots = {
+        "ohlcv": get_market_ohlcv_by_ticker,
+        "cap": get_market_cap_by_ticker,
+        "fundamental": get_market_fundamental_by_ticker,
+        "shorting_balance": get_shorting_balance_by_ticker,
+    }
+    if kind not in snapshots:
+        raise ValueError(f"kind must be one of {list(snapshots)}")
+    if prefetch < 0:
+        raise ValueError("prefetch must be zero or positive")
+
+    func = snapshots[kind]
+    days = get_business_days_index(fromdate, todate)
+
+    def _fetch(day):
+        with krx.batch_requests():
+            return func(day.strftime("%Y%m%d"), market, **kwargs)
+
+    if prefetch == 0:
+        for day in days:
+            yield day, _fetch(day)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    days = iter(days)
+    pending = collections.deque(
+        (day, executor.submit(_fetch, day))
+        for day in itertools.islice(days, prefetch))
+    try:
+        while len(pending) > 0:
+            day, future = pending.popleft()
+            yield day, future.result()
+            # 꺼낸 결과를 소비한 뒤에 다음 날짜를 조회해서 조회 중이거나
+            # 남아 있는 결과가 prefetch개를 넘지 않게 한다.
+            del future
+            day = next(days, None)
+            if day is not None:
+                pending.append((day, executor.submit(_fetch, day)))
+    finally:
+        # 소비를 중단하면 시작하지 않은 조회는 취소한다.
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 def get_market_cap(*args, **kwargs):
     """시가총액 조회
 
@@ -385,6 +665,60 @@ def get_market_cap_by_date(
     return resample_ohlcv(df, freq, how)
 
 
+def get_market_history_by_date(
+        fromdate: str, todate: str, ticker: str, freq: str = 'd',
+        adjusted: bool = True) -> DataFrame:
+    """특정 종목의 지정된 기간 OHLCV와 시가총액을 한 번에 조회
+
+    get_market_ohlcv_by_date와 get_market_cap_by_date를 합친 결과로 KRX에
+    한 번만 요청한다. 같은 기간을 두 함수로 각각 조회해도 이 결과를 함께
+    사용한다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str           ): 조회할 종목의 티커
+        freq     (str,  optional): d - 일 / m - 월 / y - 년
+        adjusted (bool, optional): 수정 종가 여부 (True/False)
+
+    Returns:
+        DataFrame:
+
+            >> get_market_history_by_date("20150720", "20150721", "005930")
+
+                           시가     고가     저가     종가  거래량      거래대금    등락률         시가총액 상장주식수
+            날짜
+            2015-07-20  1291000  1304000  1273000  1275000  128928  165366199000 -2.300781  187806654675000  147299337
+            2015-07-21  1275000  1277000  1247000  1263000  194055  244129106000 -0.939941  186039062631000  147299337
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+
+    df = krx.get_market_history_by_date(fromdate, todate, ticker, adjusted)
+    if freq == 'd' or len(df) == 0:
+        # 캐시와 공유하는 DataFrame을 그대로 반환하지 않는다.
+        return df.copy()
+
+    how = {
+        '시가': 'first',
+        '고가': 'max',
+        '저가': 'min',
+        '종가': 'last',
+        '거래량': 'sum',
+        '거래대금': 'sum',
+        '시가총액': 'last',
+        '상장주식수': 'last'
+    }
+    return resample_ohlcv(df[list(how)], freq, how)
+
+
 @market_valid_check()
 def get_market_cap_by_ticker(
         date, market: str = "ALL", acending: bool = False,
@@ -0,0 +1,2 @@
+from .market import *
+from .panel import *
@@ -0,0 +1,267 @@
+from pykrx import stock
+from pykrx.website.comm.util import get_cache_dir
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import json
+import os
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class MarketStore:
+    """일자별 전종목 조회 결과를 일자 단위로 분할해 저장하는 컬럼 저장소
+
+    데이터셋/일자 디렉터리에 티커(_index.npy)와 컬럼별 .npy 파일을 저장하며,
+    조회 시에는 필요한 컬럼만 memory map으로 읽는다.
+
+        {root}/ohlcv/20210104/_index.npy
+                             /_meta.json
+                             /시가.npy
+                             /...
+
+    한 번 연 일자의 티커 index와 컬럼 memory map은 max_partitions개까지
+    보관해서, 종목별 조회가 일자마다 파일을 다시 열지 않는다.
+
+    Args:
+        root (str, optional): 저장 경로. 기본값은 ~/.pykrx/store
+    """
+
+    # 데이터셋 이름: 일자별 전종목 조회 함수 (date, market) -> DataFrame
+    datasets = {
+        "ohlcv": stock.get_market_ohlcv_by_ticker,
+        "cap": stock.get_market_cap_by_ticker,
+        "fundamental": stock.get_market_fundamental_by_ticker,
+    }
+
+    # 열어둔 일자 (티커 index, 컬럼 memory map)의 최대 개수
+    max_partitions = 512
+
+    def __init__(self, root: str = None):
+        if root is None:
+            root = os.path.join(get_cache_dir(), "store")
+        self.root = root
+        self._lock = threading.Lock()
+        # {일자 경로: _Partition}
+        self._partitions = OrderedDict()
+
+    def dates(self, dataset: str = "ohlcv") -> list:
+        """저장된 일자 목록 (Timestamp, 오름차순)"""
+        path = self._dataset_path(dataset)
+        if not os.path.isdir(path):
+            return []
+        return [pd.Timestamp(name) for name in sorted(os.listdir(path))
+                if len(name) == 8 and name.isdigit()]
+
+    def update(self, fromdate: str = None, todate: str = None,
+               datasets: list = None, market: str = "ALL",
+               max_workers: int = 4) -> list:
+        """저장되지 않은 영업일의 데이터만 조회해서 저장한다.
+
+        Args:
+            fromdate    (str , optional): 시작 일자 (YYYYMMDD). 입력하지 않으면
+                                          마지막으로 저장된 일자의 다음 날
+            todate      (str , optional): 종료 일자 (YYYYMMDD). 기본값은 어제.
+                                          장중에 바뀌는 오늘 이후의 데이터는
+                                          저장하지 않는다.
+            datasets    (list, optional): 저장할 데이터셋. 기본값은 전체
+            market      (str , optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+            max_workers (int , optional): 동시에 조회할 일자의 수
+
+        Returns:
+            list: 새로 저장한 (데이터셋, 일자) 목록
+        """
+        datasets = list(self.datasets) if datasets is None else datasets
+        for dataset in datasets:
+            self._dataset_path(dataset)
+
+        # 저장된 일자는 다시 조회하지 않으므로 마감된 일자까지만 저장한다.
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        yesterday = yesterday.strftime("%Y%m%d")
+        if todate is not None:
+            todate = str(todate).replace("-", "")
+        if todate is None or todate > yesterday:
+            todate = yesterday
+        if fromdate is None:
+            stored = [self.dates(dataset) for dataset in datasets]
+            if any(len(dates) == 0 for dates in stored):
+                raise ValueError("fromdate is required for an empty store")
+            last = min(dates[-1] for dates in stored)
+            fromdate = (last + pd.Timedelta(days=1)).strftime("%Y%m%d")
+        if fromdate > todate:
+            return []
+
+        days = stock.get_previous_business_days(fromdate=fromdate,
+                                                todate=todate)
+        jobs = []
+        for dataset in datasets:
+            stored = set(self.dates(dataset))
+            jobs += [(dataset, day) for day in days if day not in stored]
+
+        def _fetch(job):
+            dataset, day = job
+            with stock.batch_requests():
+                df = self.datasets[dataset](day.strftime("%Y%m%d"), market)
+            if len(df) == 0:
+                return None
+            self.write(dataset, day, df)
+            return job
+
+        workers = max(1, min(max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [job for job in executor.map(_fetch, jobs)
+                    if job is not None]
+
+    def write(self, dataset: str, date, df: DataFrame):
+        """하나의 일자 데이터를 저장한다. 이미 있으면 교체한다."""
+        path = self._partition_path(dataset, date)
+        tmp = path + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+
+        df = df.sort_index()
+        np.save(os.path.join(tmp, "_index.npy"),
+                np.asarray(df.index, dtype=str))
+        for column in df.columns:
+            values = df[column].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(os.path.join(tmp, f"{column}.npy"), values)
+        with open(os.path.join(tmp, "_meta.json"), "w",
+                  encoding="utf-8") as f:
+            json.dump({"columns": list(df.columns),
+                       "index": df.index.name}, f, ensure_ascii=False)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+        with self._lock:
+            self._partitions.pop(path, None)
+
+    def read_date(self, date, dataset: str = "ohlcv", columns: list = None,
+                  tickers: list = None) -> DataFrame:
+        """특정 일자의 전종목 데이터를 조회
+
+        Args:
+            date    (str ): 조회 일자 (YYYYMMDD)
+            dataset (str , optional): 데이터셋 이름
+            columns (list, optional): 읽을 컬럼. 기본값은 전체
+            tickers (list, optional): 읽을 종목. 기본값은 전체
+
+        Returns:
+            DataFrame: 티커를 index로 하는 DataFrame. 저장되지 않은 일자는
+                       빈 DataFrame
+        """
+        part = self._partition(dataset, date)
+        if part is None:
+            return DataFrame()
+        columns = part.meta['columns'] if columns is None else columns
+
+        index = part.index
+        rows = slice(None)
+        if tickers is not None:
+            tickers = np.asarray(tickers, dtype=str)
+            rows = np.flatnonzero(np.isin(index, tickers))
+        df = DataFrame({column: part.column(column)[rows]
+                        for column in columns},
+                       index=pd.Index(np.asarray(index[rows]),
+                                      name=part.meta['index']))
+        return df
+
+    def read_ticker(self, ticker: str, dataset: str = "ohlcv",
+                    fromdate: str = None, todate: str = None,
+                    columns: list = None) -> DataFrame:
+        """특정 종목의 일자별 데이터를 조회. 일자별로 해당 행만 읽는다.
+
+        Args:
+            ticker   (str ): 조회할 종목의 티커
+            dataset  (str , optional): 데이터셋 이름
+            fromdate (str , optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str , optional): 조회 종료 일자 (YYYYMMDD)
+            columns  (list, optional): 읽을 컬럼. 기본값은 전체
+
+        Returns:
+            DataFrame: 날짜를 index로 하는 DataFrame
+        """
+        dates = self.dates(dataset)
+        if fromdate is not None:
+            dates = [d for d in dates if d >= pd.Timestamp(fromdate)]
+        if todate is not None:
+            dates = [d for d in dates if d <= pd.Timestamp(todate)]
+
+        index, rows = [], []
+        for date in dates:
+            part = self._partition(dataset, date)
+            if part is None:
+                continue
+            pos = part.find(ticker)
+            if pos is None:
+                continue
+            names = part.meta['columns'] if columns is None else columns
+            rows.append({column: part.column(column)[pos]
+                         for column in names})
+            index.append(date)
+
+        return DataFrame(rows, index=pd.DatetimeIndex(index, name='날짜'))
+
+    def _dataset_path(self, dataset: str) -> str:
+        if dataset not in self.datasets:
+            raise ValueError(f"unknown dataset: {dataset}")
+        return os.path.join(self.root, dataset)
+
+    def _partition_path(self, dataset: str, date) -> str:
+        date = pd.Timestamp(date).strftime("%Y%m%d")
+        return os.path.join(self._dataset_path(dataset), date)
+
+    def _partition(self, dataset: str, date):
+        """일자의 _Partition. 저장되지 않은 일자는 None"""
+        path = self._partition_path(dataset, date)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        mtime = (stat.st_ino, stat.st_mtime_ns)
+
+        with self._lock:
+            part = self._partitions.get(path)
+            if part is not None and part.mtime == mtime:
+                self._partitions.move_to_end(path)
+                return part
+
+        # 다른 프로세스가 다시 저장한 일자는 수정 시각으로 확인한다.
+        part = _Partition(path, mtime)
+        with self._lock:
+            self._partitions[path] = part
+            self._partitions.move_to_end(path)
+            while len(self._partitions) > self.max_partitions:
+                self._partitions.popitem(last=False)
+        return part
+
+
+class _Partition:
+    """한 일자 디렉터리의 메타 정보, 티커 index와 컬럼 memory map"""
+
+    def __init__(self, path: str, mtime: tuple):
+        self.path = path
+        self.mtime = mtime
+        with open(os.path.join(path, "_meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.index = np.load(os.path.join(path, "_index.npy"), mmap_mode="r")
+        self._columns = {}
+
+    def find(self, ticker: str):
+        """티커의 행 번호. 없으면 None"""
+        pos = np.searchsorted(self.index, ticker)
+        if pos == len(self.index) or self.index[pos] != ticker:
+            return None
+        return pos
+
+    def column(self, column: str) -> np.ndarray:
+        values = self._columns.get(column)
+        if values is None:
+            values = np.load(os.path.join(self.path, f"{column}.npy"),
+                             mmap_mode="r")
+            self._columns[column] = values
+        return values
@@ -0,0 +1,201 @@
+from pykrx import stock
+from pykrx.website import krx
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class MemmapPanel:
+    """날짜 x 티커 x 항목 패널을 항목별 numpy.memmap 파일로 저장
+
+    항목별로 (날짜, 티커) 모양의 float64 배열을 .npy 파일로 저장하고 읽기
+    전용 memory map으로 연다. 여러 프로세스가 같은 파일을 열면 OS 페이지
+    캐시의 한 복사본을 공유하며, 날짜 구간 조회는 복사 없이 view를 반환한다.
+    값이 없는 칸은 NaN이다.
+
+        {path}/meta.json
+              /시가.npy
+              /...
+
+    Args:
+        path (str): 패널 디렉터리
+        mode (str, optional): r - 읽기 전용 / r+ - 읽기 쓰기
+    """
+
+    fields = ['시가', '고가', '저가', '종가', '거래량', '거래대금', '시가총액']
+
+    def __init__(self, path: str, mode: str = "r"):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.dates = pd.DatetimeIndex(pd.to_datetime(meta['dates']),
+                                      name='날짜')
+        self.tickers = pd.Index(meta['tickers'], name='티커')
+        self.fields = meta['fields']
+        self._arrays = {
+            field: np.load(os.path.join(path, f"{field}.npy"), mmap_mode=mode)
+            for field in self.fields
+        }
+
+    @classmethod
+    def create(cls, path: str, dates, tickers: list, fields: list = None):
+        """NaN으로 채워진 빈 패널 파일을 만든다.
+
+        Args:
+            path    (str ): 패널 디렉터리
+            dates   (list): 날짜 축 (오름차순)
+            tickers (list): 티커 축
+            fields  (list, optional): 항목. 기본값은 MemmapPanel.fields
+
+        Returns:
+            MemmapPanel: 쓰기 가능한 패널
+        """
+        fields = list(cls.fields if fields is None else fields)
+        dates = pd.DatetimeIndex(dates).sort_values()
+        os.makedirs(path, exist_ok=True)
+        for field in fields:
+            array = np.lib.format.open_memmap(
+                os.path.join(path, f"{field}.npy"), mode="w+",
+                dtype=np.float64, shape=(len(dates), len(tickers)))
+            array[:] = np.nan
+            array.flush()
+            del array
+        with open(os.path.join(path, "meta.json"), "w",
+                  encoding="utf-8") as f:
+            json.dump({"dates": dates.strftime("%Y%m%d").tolist(),
+                       "tickers": list(tickers), "fields": fields},
+                      f, ensure_ascii=False)
+        return cls(path, mode="r+")
+
+    @classmethod
+    def build(cls, path: str, fromdate: str, todate: str,
+              market: str = "ALL", tickers: list = None,
+              max_workers: int = 4):
+        """전종목 OHLCV/시가총액을 조회해서 패널을 만든다.
+
+        Args:
+            path        (str ): 패널 디렉터리
+            fromdate    (str ): 시작 일자 (YYYYMMDD)
+            todate      (str ): 종료 일자 (YYYYMMDD)
+            market      (str , optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+            tickers     (list, optional): 티커 축. 기본값은 기간 중 조회된
+                                          모든 종목이며, 축이 정해질 때까지
+                                          조회한 일자를 path 아래 임시
+                                          파일에 둔다.
+            max_workers (int , optional): 동시에 조회할 일자의 수
+
+        Returns:
+            MemmapPanel: 읽기 전용 패널
+        """
+        days = stock.get_previous_business_days(fromdate=fromdate,
+                                                todate=todate)
+
+        def _fetch(day):
+            date = day.strftime("%Y%m%d")
+            ohlcv = krx.get_market_ohlcv_by_ticker(date, market)
+            cap = krx.get_market_cap_by_ticker(date, market)
+            if len(cap) > 0:
+                ohlcv = ohlcv.join(cap[['시가총액']], how="outer")
+            return ohlcv
+
+        rows = _completed(_fetch, days, max_workers)
+        if tickers is not None:
+            panel = cls.create(path, days, tickers)
+            for row, df in rows:
+                panel.write(row, df)
+            panel.flush()
+            return cls(path)
+
+        # 티커 축은 모든 일자를 조회해야 정해지므로, 조회한 일자는 축이
+        # 정해질 때까지 메모리 대신 임시 파일에 둔다.
+        spill = os.path.join(path, ".rows")
+        shutil.rmtree(spill, ignore_errors=True)
+        os.makedirs(spill)
+        try:
+            found = set()
+            for row, df in rows:
+                found.update(df.index)
+                np.save(os.path.join(spill, f"{row}_index.npy"),
+                        np.asarray(df.index, dtype=str))
+                np.save(os.path.join(spill, f"{row}.npy"),
+                        df.reindex(columns=cls.fields)
+                          .to_numpy(dtype=np.float64))
+
+            panel = cls.create(path, days, sorted(found))
+            for row in range(len(days)):
+                index = np.load(os.path.join(spill, f"{row}_index.npy"))
+                values = np.load(os.path.join(spill, f"{row}.npy"))
+                panel.write(row, DataFrame(values, index=index,
+                                           columns=cls.fields))
+            panel.flush()
+        finally:
+            shutil.rmtree(spill, ignore_errors=True)
+        return cls(path)
+
+    def write(self, row: int, df: DataFrame):
+        """하나의 날짜(row)에 티커를 index로 하는 DataFrame을 기록한다."""
+        cols = self.tickers.get_indexer(df.index)
+        found = cols >= 0
+        for field in self.fields:
+            if field in df.columns:
+                values = df[field].to_numpy(dtype=np.float64)
+                self._arrays[field][row, cols[found]] = values[found]
+
+    def flush(self):
+        for array in self._arrays.values():
+            array.flush()
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """항목의 (날짜, 티커) 배열 (memory map)"""
+        return self._arrays[field]
+
+    def date_slice(self, fromdate: str = None, todate: str = None) -> slice:
+        """날짜 구간에 해당하는 행 범위"""
+        start = 0 if fromdate is None else \
+            self.dates.searchsorted(pd.Timestamp(fromdate), side="left")
+        stop = len(self.dates) if todate is None else \
+            self.dates.searchsorted(pd.Timestamp(todate), side="right")
+        return slice(start, stop)
+
+    def get(self, field: str, fromdate: str = None, todate: str = None,
+            tickers: list = None) -> np.ndarray:
+        """날짜 구간/종목의 배열. 종목을 지정하지 않으면 복사 없는 view"""
+        array = self._arrays[field][self.date_slice(fromdate, todate)]
+        if tickers is not None:
+            cols = self.tickers.get_indexer(tickers)
+            if (cols < 0).any():
+                raise KeyError(
+                    [t for t, c in zip(tickers, cols) if c < 0])
+            array = array[:, cols]
+        return array
+
+    def to_frame(self, field: str, fromdate: str = None, todate: str = None,
+                 tickers: list = None) -> DataFrame:
+        """날짜 x 티커 DataFrame으로 변환"""
+        rows = self.date_slice(fromdate, todate)
+        columns = self.tickers if tickers is None else \
+            pd.Index(tickers, name='티커')
+        return DataFrame(self.get(field, fromdate, todate, tickers),
+                         index=self.dates[rows], columns=columns)
+
+
+def _completed(func, items: list, max_workers: int):
+    """func(item)을 최대 max_workers개씩 동시에 실행하고, 끝나는 순서대로
+    (items에서의 위치, 결과)를 반환한다. 끝나지 않은 결과는 max_workers개
+    까지만 만들어진다.
+    """
+    workers = max(1, min(max_workers, len(items)))
+    queue = list(enumerate(items))[::-1]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
+        while len(queue) > 0 or len(running) > 0:
+            while len(queue) > 0 and len(running) < workers:
+                pos, item = queue.pop()
+                running[executor.submit(func, item)] = pos
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield running.pop(future), future.result()
@@ -1,3 +1,8 @@
 from pykrx.website.comm.util import dataframe_empty_handler, singleton
+from pykrx.website.comm.webio import (
+    configure_session_pool, get_session_pool_stats
+)
+from pykrx.website.comm.ratelimit import configure_request_scheduler
 
-__all__ = ['dataframe_empty_handler', 'singleton']
+__all__ = ['dataframe_empty_handler', 'singleton', 'configure_session_pool',
+           'get_session_pool_stats', 'configure_request_scheduler']
@@ -0,0 +1,101 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class DiskCache:
+    """SQLite 파일에 zlib으로 압축한 응답을 저장하는 LRU 캐시
+
+    Args:
+        path      (str): SQLite 파일 경로
+        max_bytes (int, optional): 저장할 최대 크기 (압축 후 기준). 초과하면
+                                   가장 오래 사용하지 않은 항목부터 삭제
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires REAL,"
+            " accessed REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+        # 저장된 항목의 크기 합. set마다 전체를 합산하지 않도록 따로 관리한다.
+        self._bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        """저장된 값을 반환. 없거나 만료된 경우 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM cache WHERE key = ?",
+                (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] < now):
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float = None):
+        """값을 저장. ttl(초)이 None이면 만료되지 않는다."""
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        blob = zlib.compress(value)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires, now))
+            self._bytes += len(blob) - (0 if row is None else row[0])
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """최대 크기를 넘었을 때만 호출된다. 오래 사용하지 않은 항목부터
+        (만료된 항목 포함) accessed 색인 순서로 필요한 만큼만 읽어서 삭제한다.
+        """
+        victims = []
+        for key, size in self._conn.execute(
+                "SELECT key, size FROM cache ORDER BY accessed"):
+            if self._bytes <= self.max_bytes:
+                break
+            victims.append((key,))
+            self._bytes -= size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+        self._bytes = max(self._bytes, 0)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count,
+                "bytes": size}
@@ -0,0 +1,94 @@
+from pykrx.website.comm.singleflight import SingleFlight
+from collections import OrderedDict
+from pandas import DataFrame
+import threading
+import time
+
+
+class FrameCache:
+    """프로세스 안에서 DataFrame을 공유하는 크기 제한 LRU 캐시
+
+    저장된 DataFrame은 여러 호출이 함께 사용하므로 수정하지 않고 필요한
+    부분만 복사해서 사용해야 한다. 같은 키로 동시에 들어온 조회는 한 번만
+    실행된다.
+
+    Args:
+        max_bytes (int): 저장할 DataFrame들의 최대 크기 (memory_usage 기준).
+                         0이면 저장하지 않는다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+        # {key: (DataFrame, 크기, 만료 시각)}
+        self._entries = OrderedDict()
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, load, ttl: float = None) -> DataFrame:
+        """key의 DataFrame을 반환한다. 없거나 만료되었으면 load()의 결과를
+        저장하고 반환한다.
+
+        Args:
+            key  (hashable): 캐시 키
+            load (callable): DataFrame을 만드는 함수. 예외가 발생하면 저장하지
+                             않는다.
+            ttl (float, optional): 유지 시간 (초). None이면 만료되지 않는다.
+
+        Returns:
+            DataFrame: 저장된 DataFrame (공유 객체)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and \
+                    (entry[2] is None or entry[2] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        df, _ = self._single_flight.do(key, lambda: self._load(key, load, ttl))
+        return df
+
+    def _load(self, key, load, ttl: float) -> DataFrame:
+        df = load()
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._discard(key)
+            if nbytes <= self.max_bytes:
+                self._entries[key] = (df, nbytes, expires)
+                self.nbytes += nbytes
+                self._evict()
+        return df
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self._entries) > 0:
+            _, (_, nbytes, _) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+
+    def configure(self, max_bytes: int):
+        """최대 크기를 바꾼다. 넘치는 항목은 오래 사용하지 않은 것부터
+        삭제된다.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self.nbytes,
+                    "max_bytes": self.max_bytes}
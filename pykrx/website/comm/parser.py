@@ -0,0 +1,144 @@
+"""KRX가 문자열로 내려주는 값("1,234", "-", "", "2021/01/04")을 컬럼 단위로
+변환한다.
+
+DataFrame 전체에 정규식 replace를 여러 번 적용하는 대신, 변환할 컬럼만
+모아서 pandas의 C 파서(read_csv)로 한 번에 변환한다. C 파서가 처리하지
+못하는 값이 있는 컬럼만 문자열 연산과 정규식으로 정리한다.
+"""
+from pandas import DataFrame
+import csv
+import io
+import re
+import numpy as np
+import pandas as pd
+
+# 숫자에 포함될 수 없는 문자 (쉼표, 공백, % 등)
+_NON_NUMERIC = re.compile(r'[^-\d.]')
+# 값이 없음을 뜻하는 문자열. 0으로 변환한다.
+_EMPTY = ['', '-']
+# float64로 읽은 정수가 정확하게 표현되는 범위
+_EXACT_INT = 2 ** 53
+
+
+def parse_numeric(values, dtype=np.float64) -> np.ndarray:
+    """KRX 숫자 문자열을 dtype 배열로 변환
+
+    - 천 단위 쉼표와 공백 등은 제거한다.
+    - "", "-" 그리고 값이 없는 경우는 0으로 변환한다.
+
+    Args:
+        values (array-like): 변환할 값
+        dtype  (dtype, optional): 변환할 타입
+
+    Returns:
+        ndarray: 변환된 배열
+
+    Raises:
+        ValueError: 숫자로 변환할 수 없는 값이 있거나, dtype이 부호 없는
+                    정수인데 음수가 있는 경우
+    """
+    s = pd.Series(values, copy=False)
+    if s.dtype.kind in "iufb":
+        return _cast(s, dtype)
+
+    s = s.fillna('').astype(str)
+    s = s.str.replace(',', '', regex=False)
+    s = s.mask(s.isin(_EMPTY), '0')
+    num = pd.to_numeric(s, errors='coerce')
+
+    bad = num.isna()
+    if bad.any():
+        # 쉼표 외의 문자가 섞인 값만 정규식으로 정리한다.
+        cleaned = s[bad].str.replace(_NON_NUMERIC, '', regex=True)
+        s = s.copy()
+        s[bad] = cleaned.mask(cleaned.isin(_EMPTY), '0')
+        num = pd.to_numeric(s)
+    return _cast(num, dtype)
+
+
+def _cast(s: pd.Series, dtype) -> np.ndarray:
+    """s를 dtype 배열로 변환. 부호 없는 정수로 바꿀 때 음수가 있으면
+    값이 조용히 바뀌지 않도록 예외를 발생시킨다.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == "u" and s.dtype.kind in "if" and (s < 0).any():
+        raise ValueError(f"negative value cannot be converted to {dtype}: "
+                         f"{s[s < 0].iloc[0]}")
+    return s.to_numpy(dtype=dtype)
+
+
+def parse_date(values) -> pd.DatetimeIndex:
+    """KRX 날짜 문자열 (2021/01/04, 2021.01.04, 2021-01-04, 20210104)을
+    DatetimeIndex로 변환
+    """
+    s = pd.Index(values)
+    if s.dtype.kind == "M" or len(s) == 0:
+        return pd.DatetimeIndex(s)
+    digits = s.astype(str).str.replace(r'\D', '', regex=True)
+    return pd.DatetimeIndex(pd.to_datetime(digits, format='%Y%m%d'))
+
+
+def _parse_block(df: DataFrame, dtypes: dict) -> dict:
+    """숫자 컬럼들을 하나의 텍스트로 이어서 read_csv로 한 번에 변환
+
+    Returns:
+        dict: {컬럼: ndarray}. 변환하지 못한 컬럼은 포함되지 않는다.
+    """
+    columns = list(dtypes)
+    values = [df[column].tolist() for column in columns]
+    if len(df) == 0 or \
+            not all(isinstance(v, str) for col in values for v in col[:1]):
+        return {}
+
+    try:
+        text = "\n".join("\t".join(row) for row in zip(*values))
+        block = pd.read_csv(io.StringIO(text), sep='\t', header=None,
+                            thousands=',', na_values=_EMPTY,
+                            keep_default_na=False, quoting=csv.QUOTE_NONE)
+    except (TypeError, ValueError):
+        return {}
+    if block.shape != (len(df), len(columns)):
+        return {}
+
+    result = {}
+    for i, column in enumerate(columns):
+        dtype = np.dtype(dtypes[column])
+        s = block[i]
+        if s.dtype.kind not in "iuf":
+            continue
+        if s.dtype.kind == "f" and dtype.kind in "iu" and \
+                s.abs().max() >= _EXACT_INT:
+            continue
+        result[column] = _cast(s.fillna(0), dtype)
+    return result
+
+
+def parse_frame(df: DataFrame, dtypes) -> DataFrame:
+    """DataFrame.astype처럼 컬럼별 타입을 지정해서 KRX 문자열을 변환한다.
+    지정하지 않은 컬럼은 그대로 둔다.
+
+    Args:
+        df     (DataFrame): 변환할 DataFrame
+        dtypes (dtype or dict): 전체 컬럼의 타입 또는 {컬럼: 타입}.
+                                타입이 "datetime"이면 날짜로 변환한다.
+
+    Returns:
+        DataFrame: 변환된 DataFrame (새 객체)
+    """
+    if not isinstance(dtypes, dict):
+        dtypes = {column: dtypes for column in df.columns}
+    numeric = {column: dtype for column, dtype in dtypes.items()
+               if dtype is not str and not isinstance(dtype, str)}
+    parsed = _parse_block(df, numeric)
+
+    df = df.copy()
+    for column, dtype in dtypes.items():
+        if column in parsed:
+            df[column] = parsed[column]
+        elif dtype == "datetime":
+            df[column] = parse_date(df[column])
+        elif dtype is str:
+            df[column] = df[column].astype(str)
+        else:
+            df[column] = parse_numeric(df[column], dtype)
+    return df
@@ -0,0 +1,234 @@
+from collections import OrderedDict, deque
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 토큰 버킷
+
+    Args:
+        rate     (float): 초당 허용 요청 수. None 또는 0이면 제한하지 않는다.
+        capacity (float, optional): 한 번에 몰아서 보낼 수 있는 최대 요청 수.
+                                    입력하지 않으면 rate와 같다.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self._lock = threading.Lock()
+        self.configure(rate, capacity)
+
+    def configure(self, rate: float, capacity: float = None):
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity if capacity is not None else (rate or 1)
+            self._tokens = self.capacity
+            self._stamp = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity,
+                           self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def peek(self, tokens: float = 1) -> float:
+        """토큰을 소비하지 않고 사용 가능해질 때까지 남은 시간(초)을 반환"""
+        if not self.rate:
+            return 0
+        with self._lock:
+            self._refill()
+            return max(tokens - self._tokens, 0) / self.rate
+
+    def reserve(self, tokens: float = 1) -> float:
+        """토큰을 즉시 사용할 수 있으면 소비하고 0을 반환한다. 부족하면
+        소비하지 않고 토큰이 채워질 때까지 남은 시간(초)을 반환한다.
+        """
+        if not self.rate:
+            return 0
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """토큰을 얻을 때까지 대기한다."""
+        while True:
+            wait = self.reserve(tokens)
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+
+class _Ticket:
+    def __init__(self, buckets, is_async: bool = False):
+        self.buckets = buckets
+        # asyncio 호출자의 티켓은 Condition으로 깨울 수 없으므로 스스로
+        # 차례를 확인한다.
+        self.is_async = is_async
+
+    def wait_time(self) -> float:
+        return max(bucket.peek() for bucket in self.buckets)
+
+    def consume(self):
+        for bucket in self.buckets:
+            bucket.reserve()
+
+
+class RequestScheduler:
+    """호스트별 (선택적으로 bld별) 토큰 버킷으로 요청 속도를 제한하는 스케줄러
+
+    - 대기 중인 요청은 호출자(caller) 단위로 라운드 로빈 처리되어, 많은
+      요청을 쌓아둔 호출자가 다른 호출자를 굶기지 않는다.
+    - 호출자를 지정하지 않으면 요청한 스레드를 호출자로 본다.
+    - asyncio 요청(acquire_async)도 같은 큐에서 차례를 기다리며, 기본적으로
+      이벤트 루프 하나를 하나의 호출자로 본다.
+
+    Args:
+        rate      (float, optional): 호스트별 초당 요청 수. 0이면 제한하지
+                                     않는다.
+        capacity  (float, optional): 호스트별 최대 연속 요청 수
+        bld_rates  (dict, optional): bld별 초당 요청 수 {bld: rate}
+    """
+
+    # asyncio 호출자가 자기 차례를 다시 확인하는 간격 (초)
+    poll_interval = 0.01
+
+    def __init__(self, rate: float = 4, capacity: float = 8,
+                 bld_rates: dict = None):
+        self._cond = threading.Condition()
+        self._waiting = OrderedDict()
+        self._host_buckets = {}
+        self._bld_buckets = {}
+        self.rate = rate
+        self.capacity = capacity
+        self.bld_rates = dict(bld_rates or {})
+
+    def configure(self, rate: float = None, capacity: float = None,
+                  bld_rates: dict = None):
+        """요청 속도 설정 변경. 기존 버킷은 초기화된다."""
+        with self._cond:
+            if rate is not None:
+                self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+            if bld_rates is not None:
+                self.bld_rates = dict(bld_rates)
+            self._host_buckets.clear()
+            self._bld_buckets.clear()
+            self._cond.notify_all()
+
+    def _get_buckets(self, host, bld) -> list:
+        bucket = self._host_buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+            self._host_buckets[host] = bucket
+        buckets = [bucket]
+
+        if bld is not None and bld in self.bld_rates:
+            bucket = self._bld_buckets.get(bld)
+            if bucket is None:
+                bucket = TokenBucket(self.bld_rates[bld])
+                self._bld_buckets[bld] = bucket
+            buckets.append(bucket)
+        return buckets
+
+    def _next_ready(self):
+        """라운드 로빈 순서로 즉시 처리 가능한 티켓과 최소 대기 시간을 반환"""
+        min_wait = None
+        for tickets in self._waiting.values():
+            wait = tickets[0].wait_time()
+            if wait == 0:
+                return tickets[0], 0
+            min_wait = wait if min_wait is None else min(min_wait, wait)
+        return None, min_wait
+
+    def acquire(self, host: str, bld: str = None, caller=None):
+        """요청을 보내도 될 때까지 대기한다.
+
+        Args:
+            host   (str): 요청 대상 호스트
+            bld    (str, optional): KRX bld
+            caller (hashable, optional): 공정 큐잉에 사용할 호출자 구분자
+        """
+        caller = threading.get_ident() if caller is None else caller
+        with self._cond:
+            ticket = self._enqueue(caller, host, bld)
+            try:
+                while True:
+                    ready, wait = self._next_ready()
+                    if ready is ticket:
+                        ticket.consume()
+                        return
+                    if ready is not None:
+                        if ready.is_async:
+                            # asyncio 호출자의 차례 - 스스로 확인할 때까지 대기
+                            wait = self.poll_interval
+                        else:
+                            # 다른 호출자의 차례 - 깨워서 처리하게 하고 대기
+                            self._cond.notify_all()
+                            wait = None
+                    self._cond.wait(wait)
+            finally:
+                self._dequeue(caller, ticket)
+
+    async def acquire_async(self, host: str, bld: str = None, caller=None):
+        """acquire의 asyncio 버전. 스레드 호출자와 같은 라운드 로빈 큐에서
+        차례를 기다린다.
+
+        Args:
+            host   (str): 요청 대상 호스트
+            bld    (str, optional): KRX bld
+            caller (hashable, optional): 공정 큐잉에 사용할 호출자 구분자.
+                                         기본값은 실행 중인 이벤트 루프
+        """
+        if caller is None:
+            caller = asyncio.get_running_loop()
+        with self._cond:
+            ticket = self._enqueue(caller, host, bld, is_async=True)
+        try:
+            while True:
+                with self._cond:
+                    ready, wait = self._next_ready()
+                    if ready is ticket:
+                        ticket.consume()
+                        return
+                    if ready is not None:
+                        if not ready.is_async:
+                            self._cond.notify_all()
+                        wait = self.poll_interval
+                await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                self._dequeue(caller, ticket)
+
+    def _enqueue(self, caller, host, bld, is_async: bool = False) -> _Ticket:
+        ticket = _Ticket(self._get_buckets(host, bld), is_async)
+        self._waiting.setdefault(caller, deque()).append(ticket)
+        return ticket
+
+    def _dequeue(self, caller, ticket: _Ticket):
+        tickets = self._waiting[caller]
+        tickets.remove(ticket)
+        if len(tickets) == 0:
+            del self._waiting[caller]
+        else:
+            self._waiting.move_to_end(caller)
+        self._cond.notify_all()
+
+
+request_scheduler = RequestScheduler()
+
+
+def configure_request_scheduler(**kwargs):
+    """KRX 요청에 공통으로 적용되는 스케줄러의 설정 변경
+    (RequestScheduler.configure 참고)
+
+    기본값은 호스트별 초당 4회, 최대 8회 연속 요청이다. 단건 조회에는
+    적용되지 않으며, 기간 분할 조회, asyncio 조회와 일괄 조회
+    (batch_requests)의 요청만 제한한다.
+
+        >> configure_request_scheduler(rate=10, capacity=20)  # 속도 상향
+        >> configure_request_scheduler(rate=0)                # 제한 해제
+    """
+    request_scheduler.configure(**kwargs)
@@ -0,0 +1,60 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합친다.
+
+    먼저 들어온 호출(leader)만 함수를 실행하고, 실행 중에 같은 키로 들어온
+    호출은 그 결과(또는 예외)를 함께 받는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, func):
+        """func를 실행하거나 실행 중인 같은 키의 결과를 기다린다.
+
+        Returns:
+            tuple: (결과, 다른 호출의 결과를 공유했는지 여부)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if shared:
+                self.coalesced += 1
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+
+        if shared:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.value, False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced,
+                    "in_flight": len(self._calls)}
@@ -0,0 +1,52 @@
+from pykrx.website.comm.util import get_cache_dir
+from pandas import DataFrame
+import json
+import os
+import time
+
+
+def _snapshot_path(name: str) -> str:
+    return os.path.join(get_cache_dir(), "master", f"{name}.json")
+
+
+def load_snapshot(name: str, ttl: float = None):
+    """디스크에 저장된 DataFrame을 읽는다.
+
+    Args:
+        name  (str): 스냅샷 이름
+        ttl (float, optional): 유효 시간 (초). None이면 만료되지 않는다.
+
+    Returns:
+        DataFrame: 저장된 DataFrame. 없거나 만료되었으면 None
+    """
+    try:
+        with open(_snapshot_path(name), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if ttl is not None and time.time() - data['saved'] > ttl:
+        return None
+    df = DataFrame(data['data'], columns=data['columns'],
+                   index=data['index'])
+    df.index.name = data['index_name']
+    df.attrs.update(data.get('attrs', {}))
+    return df
+
+
+def save_snapshot(name: str, df: DataFrame):
+    """DataFrame을 디스크에 저장한다. df.attrs도 함께 저장된다. 저장에
+    실패해도 예외를 발생시키지 않는다.
+    """
+    data = json.loads(df.to_json(orient="split", force_ascii=False))
+    data['index_name'] = df.index.name
+    data['attrs'] = dict(df.attrs)
+    data['saved'] = time.time()
+    path = _snapshot_path(name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -1,5 +1,16 @@
 from pandas import DataFrame
 import logging
+import os
+import threading
+
+
+def get_cache_dir() -> str:
+    """pykrx가 디스크에 데이터를 저장하는 디렉터리
+
+    PYKRX_CACHE_DIR 환경 변수로 변경할 수 있으며 기본값은 ~/.pykrx
+    """
+    return os.environ.get("PYKRX_CACHE_DIR",
+                          os.path.join(os.path.expanduser("~"), ".pykrx"))
 
 
 def dataframe_empty_handler(func):
@@ -14,20 +25,32 @@ def dataframe_empty_handler(func):
 
 
 def singleton(class_):
+    """클래스의 인스턴스를 하나만 만든다.
+
+    여러 스레드가 동시에 처음 생성하더라도 __init__은 한 번만 실행되며,
+    나머지 스레드는 초기화가 끝날 때까지 기다린다. __init__에서 예외가
+    발생하면 다음 호출에서 다시 초기화한다.
+    """
+    lock = threading.RLock()
+
     class class_w(class_):
         _instance = None
 
         def __new__(class_, *args, **kwargs):
-            if class_w._instance is None:
-                class_w._instance = super(class_w, class_).__new__(
-                    class_, *args, **kwargs)
-                class_w._instance._sealed = False
-            return class_w._instance
+            with lock:
+                if class_w._instance is None:
+                    class_w._instance = super(class_w, class_).__new__(
+                        class_, *args, **kwargs)
+                    class_w._instance._sealed = False
+                return class_w._instance
 
         def __init__(self, *args, **kwargs):
             if self._sealed:
                 return
-            super(class_w, self).__init__(*args, **kwargs)
-            self._sealed = True
+            with lock:
+                if self._sealed:
+                    return
+                super(class_w, self).__init__(*args, **kwargs)
+                self._sealed = True
     class_w.__name__ = class_.__name__
     return class_w
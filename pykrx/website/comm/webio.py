@@ -1,13 +1,190 @@
+import asyncio
+import threading
+import weakref
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib.parse import urlsplit
 from abc import abstractmethod
 
 
+class _PoolCounter:
+    """호스트별 요청 수와 실제 TCP 연결 수를 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.connections = {}
+
+    def add_request(self, host):
+        with self._lock:
+            self.requests[host] = self.requests.get(host, 0) + 1
+
+    def add_connection(self, host):
+        with self._lock:
+            self.connections[host] = self.connections.get(host, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {host: (count, self.connections.get(host, 0))
+                    for host, count in self.requests.items()}
+
+
+class _CountingAdapter(HTTPAdapter):
+    """커넥션이 새로 맺어질 때마다 _PoolCounter에 기록하는 어댑터"""
+
+    def __init__(self, counter, **kwargs):
+        self.counter = counter
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        classes = {}
+        for scheme, pool_cls in (("http", HTTPConnectionPool),
+                                 ("https", HTTPSConnectionPool)):
+            counter = self.counter
+
+            class CountingConnection(pool_cls.ConnectionCls):
+                def connect(self):
+                    counter.add_connection(self.host)
+                    return super().connect()
+
+            classes[scheme] = type(pool_cls.__name__, (pool_cls,),
+                                   {"ConnectionCls": CountingConnection})
+        self.poolmanager.pool_classes_by_scheme = classes
+
+
+class SessionPool:
+    """스레드 간에 공유되는 keep-alive HTTP 커넥션 풀
+
+    - 커넥션은 하나의 HTTPAdapter(urllib3 PoolManager)에 보관되어 모든
+      스레드가 재사용한다.
+    - requests.Session은 thread-safe하지 않으므로 세션 객체는 스레드별로
+      생성하되, 같은 어댑터를 마운트해 커넥션을 공유한다.
+
+    Args:
+        pool_connections (int, optional): 커넥션 풀을 유지할 호스트의 수
+        pool_maxsize     (int, optional): 호스트별 최대 커넥션 수
+        pool_block      (bool, optional): 호스트별 커넥션 수가 pool_maxsize에
+                                          도달하면 대기할지 여부
+        keep_alive      (bool, optional): 응답 후 커넥션 유지 여부
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, keep_alive: bool = True):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._adapter = None
+        self._counter = _PoolCounter()
+        self._generation = 0
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+    def configure(self, pool_connections: int = None, pool_maxsize: int = None,
+                  pool_block: bool = None, keep_alive: bool = None):
+        """풀 설정을 변경한다. 기존 커넥션은 닫히고 다음 요청부터 적용된다."""
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if pool_block is not None:
+                self.pool_block = pool_block
+            if keep_alive is not None:
+                self.keep_alive = keep_alive
+            self._close_adapter()
+
+    def close(self):
+        with self._lock:
+            self._close_adapter()
+
+    def _close_adapter(self):
+        if self._adapter is not None:
+            self._adapter.close()
+        self._adapter = None
+        self._counter = _PoolCounter()
+        self._generation += 1
+
+    def _get_adapter(self):
+        with self._lock:
+            if self._adapter is None:
+                self._adapter = _CountingAdapter(
+                    self._counter,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block)
+            return self._adapter, self._counter, self._generation
+
+    @property
+    def session(self) -> requests.Session:
+        adapter, _, generation = self._get_adapter()
+        session = getattr(self._local, "session", None)
+        if session is None or self._local.generation != generation:
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            self._local.generation = generation
+        return session
+
+    def request(self, method: str, url: str, headers: dict = None, **kwargs):
+        headers = dict(headers or {})
+        if not self.keep_alive:
+            headers["Connection"] = "close"
+        session = self.session
+        with self._lock:
+            counter = self._counter
+        counter.add_request(urlsplit(url).hostname)
+        return session.request(method, url, headers=headers, **kwargs)
+
+    def stats(self) -> dict:
+        """커넥션 재사용 통계
+
+        Returns:
+            dict: 전체 및 호스트별 요청 수, 생성된 커넥션 수, 재사용 수(hits)
+
+                {'requests': 12, 'connections': 2, 'hits': 10,
+                 'hosts': {'data.krx.co.kr': {'requests': 12, ...}}}
+        """
+        with self._lock:
+            counter = self._counter
+        result = {"requests": 0, "connections": 0, "hits": 0, "hosts": {}}
+        for host, (requests_, connections) in counter.snapshot().items():
+            result["hosts"][host] = {
+                "requests": requests_,
+                "connections": connections,
+                "hits": max(requests_ - connections, 0)
+            }
+            result["requests"] += requests_
+            result["connections"] += connections
+            result["hits"] += result["hosts"][host]["hits"]
+        return result
+
+
+session_pool = SessionPool()
+
+
+def configure_session_pool(**kwargs):
+    """공유 커넥션 풀의 설정 변경 (SessionPool.configure 참고)"""
+    session_pool.configure(**kwargs)
+
+
+def get_session_pool_stats() -> dict:
+    """공유 커넥션 풀의 재사용 통계 (SessionPool.stats 참고)"""
+    return session_pool.stats()
+
+
 class Get:
+    pool = session_pool
+
     def __init__(self):
         self.headers = {"User-Agent": "Mozilla/5.0"}
 
     def read(self, **params):
-        resp = requests.get(self.url, headers=self.headers, params=params)
+        resp = self.pool.request("GET", self.url, headers=self.headers,
+                                 params=params)
         return resp
 
     @property
@@ -17,16 +194,105 @@ class Get:
 
 
 class Post:
+    pool = session_pool
+
     def __init__(self, headers=None):
         self.headers = {"User-Agent": "Mozilla/5.0"}
         if headers is not None:
             self.headers.update(headers)
 
     def read(self, **params):
-        resp = requests.post(self.url, headers=self.headers, data=params)
+        resp = self.pool.request("POST", self.url, headers=self.headers,
+                                 data=params)
         return resp
 
     @property
     @abstractmethod
     def url(self):
         return NotImplementedError
+
+
+class AsyncSessionPool:
+    """이벤트 루프별로 공유되는 keep-alive aiohttp 커넥션 풀
+
+    aiohttp 패키지가 필요하다. (pip install pykrx[aio])
+
+    Args:
+        limit          (int, optional): 전체 최대 커넥션 수
+        limit_per_host (int, optional): 호스트별 최대 커넥션 수
+        keep_alive    (bool, optional): 응답 후 커넥션 유지 여부
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10,
+                 keep_alive: bool = True):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self._sessions = weakref.WeakKeyDictionary()
+
+    @property
+    def session(self):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "pykrx.aio requires aiohttp: pip install aiohttp") from e
+
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host,
+                force_close=not self.keep_alive)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    async def request(self, method: str, url: str, headers: dict = None,
+                      **kwargs) -> bytes:
+        async with self.session.request(method, url, headers=headers,
+                                        **kwargs) as resp:
+            return await resp.read()
+
+    async def close(self):
+        """현재 이벤트 루프의 세션을 닫는다."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+async_session_pool = AsyncSessionPool()
+
+
+class AsyncGet:
+    pool = async_session_pool
+
+    def __init__(self):
+        self.headers = {"User-Agent": "Mozilla/5.0"}
+
+    async def read(self, **params) -> bytes:
+        return await self.pool.request("GET", self.url, headers=self.headers,
+                                       params=params)
+
+    @property
+    @abstractmethod
+    def url(self):
+        return NotImplementedError
+
+
+class AsyncPost:
+    pool = async_session_pool
+
+    def __init__(self, headers=None):
+        self.headers = {"User-Agent": "Mozilla/5.0"}
+        if headers is not None:
+            self.headers.update(headers)
+
+    async def read(self, **params) -> bytes:
+        return await self.pool.request("POST", self.url, headers=self.headers,
+                                       data=params)
+
+    @property
+    @abstractmethod
+    def url(self):
+        return NotImplementedError
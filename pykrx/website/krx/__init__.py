@@ -2,6 +2,14 @@ from .market import *
 from .etx import *
 from .bond import *
 from .future import *
+from .calendar import TradingCalendar
+from .market.universe import UniverseIndex, get_universe_index
+from .krxio import (
+    enable_cache, disable_cache, get_cache_stats, get_single_flight_stats,
+    gather_results, batch_requests
+)
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import datetime
 
 def datetime2string(dt, freq='d'):
@@ -16,6 +24,9 @@ def get_nearest_business_day_in_a_week(date: str = None, prev: bool = True) \
         -> str:
     """인접한 영업일을 조회한다.
 
+    저장된 영업일 달력(TradingCalendar)에서 찾으며, 달력 범위 밖의 날짜는
+    일주일 구간의 KOSPI 지수를 조회해서 찾는다.
+
     Args:
         date (str , optional): 조회할 날짜로 입력하지 않으면 현재 시간으로 대체
         prev (bool, optional): 이전 영업일을 조회할지 이후 영업일을 조회할지
@@ -24,20 +35,26 @@ def get_nearest_business_day_in_a_week(date: str = None, prev: bool = True) \
     Returns:
         str: 날짜 (YYMMDD)
     """
-    if date is None:
-        curr = datetime.datetime.now()
-    else:
-        curr = datetime.datetime.strptime(date, "%Y%m%d")
-
-    if prev:
-        prev = curr - datetime.timedelta(days=7)
-        curr = curr.strftime("%Y%m%d")
-        prev = prev.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(prev, curr, "1001")
-        return df.index[-1].strftime("%Y%m%d")
-    else:
-        next = curr + datetime.timedelta(days=7)
-        next = next.strftime("%Y%m%d")
-        curr = curr.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(curr, next, "1001")
-        return df.index[0].strftime("%Y%m%d")
+    return TradingCalendar().nearest(date, prev)
+
+
+def warmup(max_workers: int = 4):
+    """종목/지수/ETF·ETN·ELW 마스터와 영업일 달력을 미리 읽어둔다.
+
+    서버가 요청을 받기 전에 호출하면 첫 조회가 마스터 조회를 기다리지
+    않는다. 각 마스터는 동시에 조회된다.
+    """
+    jobs = [
+        lambda: StockTicker().listed,
+        lambda: StockTicker().delisted,
+        IndexTicker,
+        lambda: EtxTicker().get_table("ETF"),
+        lambda: EtxTicker().get_table("ETN"),
+        lambda: EtxTicker().get_table("ELW"),
+        lambda: TradingCalendar().nearest(),
+    ]
+    with batch_requests(), \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, job)
+                   for job in jobs]
+        gather_results(futures)
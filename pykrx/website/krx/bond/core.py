@@ -1,5 +1,7 @@
 from pykrx.website.krx.krxio import KrxWebIo
+from pykrx.website.krx.schema import Schema
 from pandas import DataFrame
+import numpy as np
 
 
 class MKD40038(KrxWebIo):
@@ -32,6 +34,12 @@ class MKD40038(KrxWebIo):
 
 
 class 전종목_장외채권수익률(KrxWebIo):
+    schema = Schema("output", {
+        "ITM_TP_NM": ("채권종류", str),
+        "LST_ORD_BAS_YD": ("수익률", np.float32),
+        "CMP_YD": ("대비", np.float32),
+    }, index="채권종류")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT11401"
@@ -58,10 +66,16 @@ class 전종목_장외채권수익률(KrxWebIo):
 
         """
         result = self.read(inqTpCd="T", trdDd=trdDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 개별추이_장외채권수익률(KrxWebIo):
+    schema = Schema("output", {
+        "DISCLS_DD": ("일자", "datetime"),
+        "LST_ORD_BAS_YD": ("수익률", np.float32),
+        "CMP_YD": ("대비", np.float32),
+    }, index="일자")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT11402"
@@ -101,7 +115,7 @@ class 개별추이_장외채권수익률(KrxWebIo):
         """
         result = self.read(inqTpCd="E", strtDd=strtDd, endDd=endDd,
                            bndKindTpCd=bndKindTpCd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 if __name__ == "__main__":
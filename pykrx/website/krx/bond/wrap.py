@@ -4,7 +4,6 @@ from pykrx.website.krx.bond.core import (
 )
 from pandas import DataFrame
 import pandas as pd
-import numpy as np
 
 
 @dataframe_empty_handler
@@ -34,11 +33,7 @@ def get_otc_treasury_yields_by_ticker(date: str) -> DataFrame:
             CD(91일)                1.500  0.000
     """
     df = 전종목_장외채권수익률().fetch(date)
-    if not df.empty:
-        df.columns = ['채권종류', '수익률', '대비']
-        df = df.astype({"수익률": np.float32, "대비": np.float32})
-        df = df.set_index('채권종류')
-    return df
+    return 전종목_장외채권수익률.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -90,11 +85,7 @@ def get_otc_treasury_yields_by_date(fromdate: str, todate: str, ticker: str) \
     }
 
     df = 개별추이_장외채권수익률().fetch(fromdate, todate, ticker2code[ticker])
-    df.columns = ['일자', '수익률', '대비']
-    df = df.astype({"수익률": np.float32, "대비": np.float32})
-    df = df.set_index('일자')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    return df.sort_index()
+    return 개별추이_장외채권수익률.schema.parse(df).sort_index()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+from pykrx.website.comm import singleton
+from pykrx.website.comm.util import get_cache_dir
+from pykrx.website.krx.market.wrap import get_index_ohlcv_by_date
+import bisect
+import datetime
+import json
+import os
+import threading
+import time
+import pandas as pd
+
+
+@singleton
+class TradingCalendar:
+    """KOSPI 지수(1001)의 거래일로 만든 영업일 달력
+
+    - 처음 사용할 때 전체 기간의 거래일을 한 번에 조회해서 디스크에 저장하고,
+      이후에는 저장된 파일을 읽는다.
+    - 저장된 마지막 날짜 이후를 조회하면 ttl(초)마다 새로운 거래일만 추가로
+      조회한다.
+    - 조회는 정렬된 날짜 목록에 대한 이진 탐색으로 메모리에서 처리한다.
+    """
+
+    # 달력이 시작하는 일자
+    start = "19900101"
+    # 새로운 거래일을 확인하는 주기 (초)
+    ttl = 6 * 60 * 60
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._days = []
+        self._index = None
+        # _days가 빠짐없이 포함하고 있는 마지막 날짜
+        self._until = None
+        # 마지막으로 거래일을 조회한 날 (그 날의 조회 결과를 ttl 동안 사용)
+        self._fetched = None
+        self._refreshed = 0
+        self.path = os.path.join(get_cache_dir(), "trading_days.json")
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._days = data['days']
+            self._until = data['until']
+            self._refreshed = data['refreshed']
+            self._fetched = data.get('fetched')
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _save(self):
+        data = {"days": self._days, "until": self._until,
+                "fetched": self._fetched, "refreshed": self._refreshed}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def refresh(self, force: bool = False):
+        """저장된 마지막 날짜 이후의 거래일을 조회해서 추가한다."""
+        with self._lock:
+            if not force and time.time() - self._refreshed < self.ttl:
+                return
+            today = _today()
+            fromdate = self.start if self._until is None else self._until
+            df = get_index_ohlcv_by_date(fromdate, today, "1001")
+            if len(df) == 0:
+                return
+            days = df.index.strftime("%Y%m%d").tolist()
+            pos = bisect.bisect_left(self._days, fromdate)
+            self._days = self._days[:pos] + days
+            # 오늘 장이 시작하기 전에는 오늘이 영업일인지 알 수 없다.
+            yesterday = datetime.datetime.strptime(today, "%Y%m%d") - \
+                datetime.timedelta(days=1)
+            self._until = max(days[-1], yesterday.strftime("%Y%m%d"))
+            self._fetched = today
+            self._refreshed = time.time()
+            self._index = None
+            self._save()
+
+    def _covers(self, date: str) -> bool:
+        today = _today()
+        if self._until is None or date > self._until:
+            # 날짜가 바뀌었으면 ttl이 지나지 않았어도 오늘까지 다시 조회한다.
+            self.refresh(force=self._fetched != today)
+        if self._until is None or date < self.start:
+            return False
+        if date <= self._until:
+            return True
+        # 오늘 조회한 결과는 ttl 동안 오늘과 그 이후의 날짜에도 사용한다.
+        # 오늘 이후의 거래일은 아직 없으므로 지수를 조회해도 결과가 같다.
+        # 장 시작 전이면 일주일 구간을 조회하는 것과 같이 전 영업일이 된다.
+        return self._fetched == today and \
+            time.time() - self._refreshed < self.ttl
+
+    def is_business_day(self, date) -> bool:
+        """영업일 여부"""
+        date = _to_yyyymmdd(date)
+        if not self._covers(date):
+            return _probe(date, True) == date
+        pos = bisect.bisect_left(self._days, date)
+        return pos < len(self._days) and self._days[pos] == date
+
+    def nearest(self, date=None, prev: bool = True) -> str:
+        """date를 포함해서 가장 가까운 이전(prev=True) 또는 이후 영업일
+
+        Returns:
+            str: 날짜 (YYYYMMDD)
+        """
+        date = _to_yyyymmdd(date)
+        if self._covers(date):
+            if prev:
+                pos = bisect.bisect_right(self._days, date)
+                if pos > 0:
+                    return self._days[pos - 1]
+            else:
+                pos = bisect.bisect_left(self._days, date)
+                if pos < len(self._days):
+                    return self._days[pos]
+        return _probe(date, prev)
+
+    def business_days(self, fromdate, todate) -> pd.DatetimeIndex:
+        """기간 중의 영업일 (양 끝 포함)"""
+        fromdate = _to_yyyymmdd(fromdate)
+        todate = _to_yyyymmdd(todate)
+        # 오늘 이후까지의 기간도 달력에서 자른다 (_covers 참고). 달력을
+        # 만들지 못했거나 달력이 시작하기 전의 기간만 지수를 조회한다.
+        if fromdate < self.start or not self._covers(todate):
+            df = get_index_ohlcv_by_date(fromdate, todate, "1001")
+            return pd.DatetimeIndex(df.index, name='날짜')
+        lo = bisect.bisect_left(self._days, fromdate)
+        hi = bisect.bisect_right(self._days, todate)
+        return self.index[lo:hi]
+
+    def nearest_many(self, dates, prev: bool = True) -> pd.DatetimeIndex:
+        """nearest의 벡터 버전. 여러 날짜의 인접 영업일을 한 번에 찾는다.
+
+        Args:
+            dates (list-like): 날짜 목록
+            prev  (bool, optional): 이전 영업일(True) / 이후 영업일(False)
+
+        Returns:
+            DatetimeIndex: dates와 같은 순서의 영업일
+        """
+        dates = pd.DatetimeIndex(pd.to_datetime(dates))
+        if len(dates) == 0:
+            return pd.DatetimeIndex([], name='날짜')
+        covered = self._covers(dates.max().strftime("%Y%m%d"))
+        index = self.index
+        if prev:
+            pos = index.searchsorted(dates, side="right") - 1
+            valid = pos >= 0
+        else:
+            pos = index.searchsorted(dates, side="left")
+            valid = pos < len(index)
+        if covered:
+            until = dates.max()
+        elif self._until is not None:
+            until = pd.Timestamp(self._until)
+        else:
+            until = pd.Timestamp.min
+        valid &= (dates >= pd.Timestamp(self.start)) & (dates <= until)
+
+        result = index[pos.clip(0, max(len(index) - 1, 0))] \
+            if len(index) > 0 else dates
+        result = result.where(valid, pd.NaT)
+        # 달력 범위 밖의 날짜는 하나씩 조회한다.
+        if not valid.all():
+            values = result.to_numpy(copy=True)
+            for i in (~valid).nonzero()[0]:
+                values[i] = pd.Timestamp(self.nearest(dates[i], prev))
+            result = pd.DatetimeIndex(values)
+        return result.rename('날짜')
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """전체 영업일"""
+        with self._lock:
+            if self._index is None:
+                self._index = pd.DatetimeIndex(
+                    pd.to_datetime(self._days, format="%Y%m%d"), name='날짜')
+            return self._index
+
+
+def _today() -> str:
+    return datetime.date.today().strftime("%Y%m%d")
+
+
+def _to_yyyymmdd(date) -> str:
+    if date is None:
+        return _today()
+    if isinstance(date, (datetime.date, pd.Timestamp)):
+        return date.strftime("%Y%m%d")
+    return str(date).replace("-", "")
+
+
+def _probe(date: str, prev: bool) -> str:
+    """달력 범위 밖의 날짜는 일주일 구간의 지수를 조회해서 찾는다."""
+    curr = datetime.datetime.strptime(date, "%Y%m%d")
+    if prev:
+        fromdate = (curr - datetime.timedelta(days=7)).strftime("%Y%m%d")
+        df = get_index_ohlcv_by_date(fromdate, date, "1001")
+        return df.index[-1].strftime("%Y%m%d")
+    else:
+        todate = (curr + datetime.timedelta(days=7)).strftime("%Y%m%d")
+        df = get_index_ohlcv_by_date(date, todate, "1001")
+        return df.index[0].strftime("%Y%m%d")
@@ -1,5 +1,7 @@
 from pykrx.website.krx.krxio import KrxWebIo
+from pykrx.website.krx.schema import Schema
 from pandas import DataFrame
+import numpy as np
 
 
 class 상장종목검색(KrxWebIo):
@@ -96,6 +98,18 @@ class ELW_전종목기본종목(KrxWebIo):
 
 
 class 개별종목시세_ETF(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "LST_NAV": ("NAV", np.float64),
+        "TDD_OPNPRC": ("시가", np.uint32),
+        "TDD_HGPRC": ("고가", np.uint32),
+        "TDD_LWPRC": ("저가", np.uint32),
+        "TDD_CLSPRC": ("종가", np.uint32),
+        "ACC_TRDVOL": ("거래량", np.uint64),
+        "ACC_TRDVAL": ("거래대금", np.uint64),
+        "OBJ_STKPRC_IDX": ("기초지수", np.float64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT04501"
@@ -110,17 +124,29 @@ class 개별종목시세_ETF(KrxWebIo):
 
         Returns:
             DataFrame:
-                       TRD_DD TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC FLUC_RT    LST_NAV TDD_OPNPRC TDD_HGPRC TDD_LWPRC ACC_TRDVOL      ACC_TRDVAL           MKTCAP INVSTASST_NETASST_TOTAMT   LIST_SHRS    IDX_IND_NM OBJ_STKPRC_IDX FLUC_TP_CD1 CMPPREVDD_IDX IDX_FLUC_RT
-                0  2021/01/19     42,965          1         1,080    2.58  43,079.14     42,075    43,250    41,900    192,061   8,222,510,755  850,707,000,000                        0  19,800,000    코스피 200         421.35           1         10.85        2.64
-                1  2021/01/18     41,885          2           975   -2.27  41,970.16     42,505    42,795    41,755    443,478  18,658,324,445  831,417,250,000          831,009,080,773  19,850,000    코스피 200         410.50           2          9.93       -2.36
-                2  2021/01/15     42,860          2           975   -2.22  42,987.78     44,095    44,550    42,840    418,224  18,200,519,245  825,055,000,000          853,307,406,018  19,250,000    코스피 200         420.43           2          9.42       -2.19
-                3  2021/01/14     43,835          2            30   -0.07  43,942.97     43,725    43,995    43,585    196,552   8,602,863,505  861,357,750,000          845,902,227,451  19,650,000    코스피 200         429.85           2          0.53       -0.12
+                       TRD_DD  TDD_CLSPRC    LST_NAV  TDD_OPNPRC  TDD_HGPRC  TDD_LWPRC  ACC_TRDVOL      ACC_TRDVAL  OBJ_STKPRC_IDX
+                0  2021/01/19      42,965  43,079.14      42,075     43,250     41,900     192,061   8,222,510,755          421.35
+                1  2021/01/18      41,885  41,970.16      42,505     42,795     41,755     443,478  18,658,324,445          410.50
+                2  2021/01/15      42,860  42,987.78      44,095     44,550     42,840     418,224  18,200,519,245          420.43
+                3  2021/01/14      43,835  43,942.97      43,725     43,995     43,585     196,552   8,602,863,505          429.85
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(isuCd=isin, strtDd=strtDd, endDd=endDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전종목시세_ETF(KrxWebIo):
+    schema = Schema("output", {
+        "ISU_SRT_CD": ("티커", str),
+        "NAV": ("NAV", np.float64),
+        "TDD_OPNPRC": ("시가", np.uint32),
+        "TDD_HGPRC": ("고가", np.uint32),
+        "TDD_LWPRC": ("저가", np.uint32),
+        "TDD_CLSPRC": ("종가", np.uint32),
+        "ACC_TRDVOL": ("거래량", np.uint64),
+        "ACC_TRDVAL": ("거래대금", np.uint64),
+        "OBJ_STKPRC_IDX": ("기초지수", np.float64),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT04301"
@@ -134,18 +160,28 @@ class 전종목시세_ETF(KrxWebIo):
         Returns:
             DataFrame: 전종목의 가격 정보
 
-                    ISU_SRT_CD                ISU_ABBRV TDD_CLSPRC CMPPREVDD_PRC FLUC_TP_CD FLUC_RT         NAV TDD_OPNPRC TDD_HGPRC TDD_LWPRC ACC_TRDVOL     ACC_TRDVAL           MKTCAP INVSTASST_NETASST_TOTAMT   LIST_SHRS               IDX_IND_NM OBJ_STKPRC_IDX CMPPREVDD_IDX FLUC_TP_CD1 FLUC_RT1
-                0       152100              ARIRANG 200     42,965         1,080          1    2.58   43,079.14     42,075    43,250    41,900    192,061  8,222,510,755  850,707,000,000                        0  19,800,000               코스피 200         421.35         10.85           1     2.64
-                1       295820      ARIRANG 200동일가중     10,710           260          1    2.49   10,701.72     10,590    10,710    10,590         31        331,690    6,426,000,000                        0     600,000  코스피 200 동일가중지수       2,311.52         57.41           1     2.55
-                2       253150  ARIRANG 200선물레버리지     49,560         2,605          1    5.55   49,687.23     47,205    50,030    47,000      7,237    353,452,240   14,868,000,000                        0     300,000      코스피 200 선물지수       2,112.71         67.25           1     3.29
-                3       253160  ARIRANG 200선물인버스2X      4,220          -240          2   -5.38    4,193.34      4,430     4,455     4,175    485,817  2,095,171,435   16,036,000,000                        0   3,800,000      코스피 200 선물지수       2,112.71         67.25           1     3.29
-                4       278420      ARIRANG ESG우수기업      8,950           145          1    1.65    8,952.56      8,815     8,975     8,810     39,513    352,947,304    4,027,500,000                        0     450,000    WISE ESG우수기업 지수       1,210.07         19.83           1     1.67
+                   ISU_SRT_CD  TDD_CLSPRC        NAV  TDD_OPNPRC  TDD_HGPRC  TDD_LWPRC  ACC_TRDVOL     ACC_TRDVAL  OBJ_STKPRC_IDX
+                0      152100      42,965  43,079.14      42,075     43,250     41,900     192,061  8,222,510,755          421.35
+                1      295820      10,710  10,701.72      10,590     10,710     10,590          31        331,690        2,311.52
+                2      253150      49,560  49,687.23      47,205     50,030     47,000       7,237    353,452,240        2,112.71
+                3      253160       4,220   4,193.34       4,430      4,455      4,175     485,817  2,095,171,435        2,112.71
+                4      278420       8,950   8,952.56       8,815      8,975      8,810      39,513    352,947,304        1,210.07
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=date)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전종목등락률_ETF(KrxWebIo):
+    schema = Schema("output", {
+        "ISU_SRT_CD": ("티커", str),
+        "BAS_PRC": ("시가", np.uint32),
+        "CLSPRC": ("종가", np.uint32),
+        "CMP_PRC": ("변동폭", np.int32),
+        "FLUC_RT": ("등락률", np.float32),
+        "ACC_TRDVOL": ("거래량", np.uint64),
+        "ACC_TRDVAL": ("거래대금", np.uint64),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT04401"
@@ -162,15 +198,15 @@ class 전종목등락률_ETF(KrxWebIo):
 
                 >> 전종목등락률_ETF().fetch("20210325", "20210402")
 
-                        ISU_SRT_CD                 ISU_ABBRV  BAS_PRC   CLSPRC FLUC_TP_CD CMP_PRC FLUC_RT ACC_TRDVOL      ACC_TRDVAL
-                    0       152100               ARIRANG 200   41,715   43,405          1   1,690    4.05  1,002,296  42,802,174,550
-                    1       295820       ARIRANG 200동일가중   10,855   11,185          1     330    3.04      1,244      13,820,930
-                    2       253150   ARIRANG 200선물레버리지   45,770   49,735          1   3,965    8.66     13,603     650,641,700
-                    3       253160   ARIRANG 200선물인버스2X    4,380    4,015          2    -365   -8.33    488,304   2,040,509,925
-                    4       278420       ARIRANG ESG우수기업    9,095    9,385          1     290    3.19      9,114      84,463,155
+                       ISU_SRT_CD  BAS_PRC  CLSPRC  CMP_PRC  FLUC_RT  ACC_TRDVOL      ACC_TRDVAL
+                    0      152100   41,715  43,405    1,690     4.05   1,002,296  42,802,174,550
+                    1      295820   10,855  11,185      330     3.04       1,244      13,820,930
+                    2      253150   45,770  49,735    3,965     8.66      13,603     650,641,700
+                    3      253160    4,380   4,015     -365    -8.33     488,304   2,040,509,925
+                    4      278420    9,095   9,385      290     3.19       9,114      84,463,155
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(strtDd=strtDd, endDd=endDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class PDF(KrxWebIo):
@@ -201,6 +237,13 @@ class PDF(KrxWebIo):
 
 
 class 추적오차율추이(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "LST_NAV": ("NAV", np.float64),
+        "OBJ_STKPRC_IDX": ("지수", np.float64),
+        "TRACE_ERR_RT": ("추적오차율", np.float32),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT05901"
@@ -215,19 +258,26 @@ class 추적오차율추이(KrxWebIo):
 
         Returns:
             DataFrame:
-                        TRD_DD    LST_NAV NAV_CHG_RT OBJ_STKPRC_IDX IDX_CHG_RTO TRACE_YD_MULT TRACE_ERR_RT
-                0   2021/01/18  41,970.16      -2.40         410.50       -2.39           1.0         0.44
-                1   2021/01/15  42,987.78      -2.20         420.43       -2.22           1.0         0.44
-                2   2021/01/14  43,942.97      -0.12         429.85       -0.12           1.0         0.44
-                3   2021/01/13  43,994.16       0.58         430.38        0.58           1.0         0.44
-                4   2021/01/12  43,740.55      -0.77         427.87       -0.76           1.0         0.44
+                       TRD_DD    LST_NAV  OBJ_STKPRC_IDX  TRACE_ERR_RT
+                0  2021/01/18  41,970.16          410.50          0.44
+                1  2021/01/15  42,987.78          420.43          0.44
+                2  2021/01/14  43,942.97          429.85          0.44
+                3  2021/01/13  43,994.16          430.38          0.44
+                4  2021/01/12  43,740.55          427.87          0.44
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isin)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 괴리율추이(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "CLSPRC": ("종가", np.uint32),
+        "LST_NAV": ("NAV", np.float64),
+        "DIVRG_RT": ("괴리율", np.float32),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT06001"
@@ -242,16 +292,16 @@ class 괴리율추이(KrxWebIo):
 
         Returns:
             DataFrame:
-                        TRD_DD FLUC_TP_CD  CLSPRC    LST_NAV DIVRG_RT
-                0   2020/12/21          1  37,410  37,477.27    -0.18
-                1   2020/12/22          2  36,825  36,899.05    -0.20
-                2   2020/12/23          1  37,325  37,391.69    -0.18
-                3   2020/12/24          1  38,060  38,182.05    -0.32
-                4   2020/12/28          1  38,240  38,259.11    -0.05
+                       TRD_DD  CLSPRC    LST_NAV  DIVRG_RT
+                0  2020/12/21  37,410  37,477.27     -0.18
+                1  2020/12/22  36,825  36,899.05     -0.20
+                2  2020/12/23  37,325  37,391.69     -0.18
+                3  2020/12/24  38,060  38,182.05     -0.32
+                4  2020/12/28  38,240  38,259.11     -0.05
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class ETF_투자자별거래실적_기간합계(KrxWebIo):
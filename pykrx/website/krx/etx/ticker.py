@@ -1,46 +1,98 @@
 from pykrx.website.comm import dataframe_empty_handler, singleton
+from pykrx.website.comm.snapshot import load_snapshot, save_snapshot
 from pykrx.website.krx.etx.core import (
     ETF_전종목기본종목, ETN_전종목기본종목, ELW_전종목기본종목
 )
+from pandas import DataFrame
 import pandas as pd
+import threading
 
 
 @singleton
 class EtxTicker:
-    def __init__(self):
-        self.df = self._get_tickers()
+    """ETF/ETN/ELW 종목 마스터
 
-    @dataframe_empty_handler
-    def _get_tickers(self):
-        df_etf = ETF_전종목기본종목().fetch()
-        df_etf = df_etf[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etf['CATEGORY'] = "ETF"
+    분류(ETF/ETN/ELW)별로 필요할 때만 조회하며, 조회 결과는 디스크에
+    저장해서 ttl(초) 동안 재사용한다. 분류를 알 수 없는 티커는 ETF, ETN,
+    ELW 순서로 찾는다.
+    """
 
-        df_etn = ETN_전종목기본종목().fetch()
-        df_etn = df_etn[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etn['CATEGORY'] = "ETN"
+    # 디스크에 저장된 마스터의 유효 시간 (초)
+    ttl = 24 * 60 * 60
+    _sources = {
+        "ETF": ETF_전종목기본종목,
+        "ETN": ETN_전종목기본종목,
+        "ELW": ELW_전종목기본종목,
+    }
 
-        df_elw = ELW_전종목기본종목().fetch()
-        df_elw = df_elw[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_elw['CATEGORY'] = "ELW"
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables = {}
+
+    @property
+    def df(self) -> DataFrame:
+        """전체 분류의 마스터"""
+        return pd.concat([self.get_table(c) for c in self._sources])
+
+    def get_table(self, category: str) -> DataFrame:
+        """분류(ETF/ETN/ELW)별 마스터"""
+        df = self._tables.get(category)
+        if df is not None:
+            return df
+        with self._lock:
+            df = self._tables.get(category)
+            if df is None:
+                name = f"etx_{category.lower()}"
+                df = load_snapshot(name, self.ttl)
+                if df is None:
+                    df = self._get_tickers(category)
+                    if len(df) > 0:
+                        save_snapshot(name, df)
+                    else:
+                        df = load_snapshot(name)
+                        if df is None:
+                            return DataFrame()
+                self._tables[category] = df
+            return df
 
-        df = pd.concat([df_etf, df_etn, df_elw])
+    @dataframe_empty_handler
+    def _get_tickers(self, category):
+        df = self._sources[category]().fetch()
+        df = df[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
+        df['CATEGORY'] = category
         df.columns = ["isin", "ticker", "종목명", "상장일", "시장"]
         df = df.replace('/', '', regex=True)
         return df.set_index('ticker')
 
+    def _find(self, ticker) -> DataFrame:
+        """ticker가 있는 분류의 마스터"""
+        for category in self._sources:
+            df = self.get_table(category)
+            if ticker in df.index:
+                return df
+        raise KeyError(ticker)
+
     def get_ticker(self, market, date) -> list:
         if market == "ALL":
             return self.df.index.to_list()
-        cond1 = self.df['시장'] == market
-        cond2 = self.df['상장일'] <= date
-        return self.df[cond1 & cond2].index.to_list()
+        if market not in self._sources:
+            return []
+        df = self.get_table(market)
+        if len(df) == 0:
+            return []
+        return df[df['상장일'] <= date].index.to_list()
 
     def get_name(self, ticker) -> str:
-        return self.df.loc[ticker, '종목명']
+        return self._find(ticker).loc[ticker, '종목명']
 
     def get_market(self, ticker) -> str:
-        return self.df.loc[ticker].index['시장']
+        return self._find(ticker).loc[ticker, '시장']
+
+    def get_isin(self, ticker) -> str:
+        return self._find(ticker).loc[ticker, 'isin']
+
+    def contains(self, category, ticker) -> bool:
+        return ticker in self.get_table(category).index
 
 
 def get_etx_name(ticker):
@@ -61,19 +113,19 @@ def get_etx_ticker_list(date: str, market: str) -> list:
 
 
 def is_etf(ticker):
-    return EtxTicker().df.loc[ticker, '시장'] == 'ETF'
+    return EtxTicker().contains("ETF", ticker)
 
 
 def is_etn(ticker):
-    return EtxTicker().df.loc[ticker, '시장'] == 'ETN'
+    return EtxTicker().contains("ETN", ticker)
 
 
 def is_elw(ticker):
-    return EtxTicker().df.loc[ticker, '시장'] == 'ELW'
+    return EtxTicker().contains("ELW", ticker)
 
 
 def get_etx_isin(ticker):
-    return EtxTicker().df.loc[ticker, 'isin']
+    return EtxTicker().get_isin(ticker)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm.parser import parse_frame, parse_date
 from pykrx.website.krx.etx.core import (
     개별종목시세_ETF, 전종목시세_ETF, 전종목등락률_ETF, PDF, 추적오차율추이,
     괴리율추이, ETF_투자자별거래실적_기간합계, ETF_투자자별거래실적_일별추이,
@@ -36,26 +37,7 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) \
 
     isin = get_etx_isin(ticker)
     df = 개별종목시세_ETF().fetch(fromdate, todate, isin)
-
-    df = df[['TRD_DD', 'LST_NAV', 'TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC',
-             'TDD_CLSPRC', 'ACC_TRDVOL', 'ACC_TRDVAL', 'OBJ_STKPRC_IDX']]
-    df.columns = ['날짜', 'NAV', '시가', '고가', '저가', '종가', '거래량',
-                  '거래대금', '기초지수']
-    df = df.replace(r'^-$', '0', regex=True)
-    df = df.replace(r',', '', regex=True)
-    df = df.set_index('날짜')
-    df = df.astype({
-        "NAV": np.float64,
-        "시가": np.uint32,
-        "고가": np.uint32,
-        "저가": np.uint32,
-        "종가": np.uint32,
-        "거래량": np.uint64,
-        "거래대금": np.uint64,
-        "기초지수": np.float64
-    })
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    return df.sort_index()
+    return 개별종목시세_ETF.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -80,24 +62,7 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
     """  # pylint: disable=line-too-long # noqa: E501
 
     df = 전종목시세_ETF().fetch(date)
-    df = df[['ISU_SRT_CD', 'NAV', 'TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC',
-             'TDD_CLSPRC', 'ACC_TRDVOL',  'ACC_TRDVAL', 'OBJ_STKPRC_IDX']]
-    df.columns = ['티커', 'NAV', '시가', '고가', '저가', '종가', '거래량',
-                  '거래대금', '기초지수']
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.set_index('티커')
-    df = df.astype({
-        "NAV": np.float64,
-        "시가": np.uint32,
-        "고가": np.uint32,
-        "저가": np.uint32,
-        "종가": np.uint32,
-        "거래량": np.uint64,
-        "거래대금": np.uint64,
-        "기초지수": np.float64
-    })
-    return df
+    return 전종목시세_ETF.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -123,22 +88,7 @@ def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
     """
 
     df = 전종목등락률_ETF().fetch(fromdate, todate)
-    df = df[['ISU_SRT_CD', 'BAS_PRC', 'CLSPRC', 'CMP_PRC', 'FLUC_RT',
-             'ACC_TRDVOL', 'ACC_TRDVAL']]
-    df.columns = ['티커', '시가', '종가', '변동폭', '등락률', '거래량',
-                  '거래대금']
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.set_index('티커')
-    df = df.astype({
-        "시가": np.uint32,
-        "종가": np.uint32,
-        "변동폭": np.int32,
-        "등락률": np.float32,
-        "거래량": np.uint64,
-        "거래대금": np.uint64
-    })
-    return df
+    return 전종목등락률_ETF.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -168,11 +118,8 @@ def get_etf_portfolio_deposit_file(date: str, ticker: str) -> DataFrame:
     df['티커'] = df['티커'].apply(lambda x: x[3:9] if len(x) > 6 else x)
     df = df.set_index('티커')
 
-    df = df.replace(',', '', regex=True)
-    # - empty string은 int, float로 형변환 불가
-    #  -> 이 문제를 해결하기 위해 '-' 문자는 0으로 치환
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.astype({
+    # '-'와 empty string은 0으로 변환된다.
+    df = parse_frame(df, {
         "계약수": np.float64,
         "금액": np.uint64,
         "비중": np.float32
@@ -205,18 +152,7 @@ def get_etf_price_deviation(fromdate: str, todate: str, ticker: str) \
 
     isin = get_etx_isin(ticker)
     df = 괴리율추이().fetch(fromdate, todate, isin)
-    df = df[['TRD_DD', 'CLSPRC', 'LST_NAV', 'DIVRG_RT']]
-    df.columns = ['날짜', '종가', 'NAV', '괴리율']
-    df = df.set_index('날짜')
-    df = df.replace(',', '', regex=True)
-
-    df = df.astype({
-        "종가": np.uint32,
-        "NAV": np.float64,
-        "괴리율": np.float32
-    })
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    return df.sort_index()
+    return 괴리율추이.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -242,17 +178,7 @@ def get_etf_tracking_error(fromdate: str, todate: str, ticker: str) \
 
     isin = get_etx_isin(ticker)
     df = 추적오차율추이().fetch(fromdate, todate, isin)
-    df = df[['TRD_DD', 'LST_NAV', 'OBJ_STKPRC_IDX', 'TRACE_ERR_RT']]
-    df.columns = ['날짜', 'NAV', '지수', '추적오차율']
-    df = df.set_index('날짜')
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
-        "NAV": np.float64,
-        "지수": np.float64,
-        "추적오차율": np.float32
-    })
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    return df.sort_index()
+    return 추적오차율추이.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -287,8 +213,7 @@ def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) \
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]])
 
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
+    df = parse_frame(df, {
         ("거래량", "매도"): np.uint64,
         ("거래량", "매수"): np.uint64,
         ("거래량", "순매수"): np.int64,
@@ -333,10 +258,9 @@ def get_trading_volume_and_value_by_date(
     df.columns = ['날짜', '기관', '기타법인', '개인', '외국인', "전체"]
 
     df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
+    df.index = parse_date(df.index)
 
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
+    df = parse_frame(df, {
         "기관": np.int64,
         "기타법인": np.int64,
         "개인": np.int64,
@@ -391,8 +315,7 @@ def get_indivisual_trading_volume_and_value_by_investor(
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]])
 
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
+    df = parse_frame(df, {
         ("거래량", "매도"): np.uint64,
         ("거래량", "매수"): np.uint64,
         ("거래량", "순매수"): np.int64,
@@ -446,10 +369,9 @@ def get_indivisual_trading_volume_and_value_by_date(
     df.columns = ['날짜', '기관', '기타법인', '개인', '외국인', "전체"]
 
     df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
+    df.index = parse_date(df.index)
 
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
+    df = parse_frame(df, {
         "기관": np.int64,
         "기타법인": np.int64,
         "개인": np.int64,
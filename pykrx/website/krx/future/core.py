@@ -1,6 +1,8 @@
 from pykrx.website.krx.krxio import KrxFutureIo, KrxWebIo
+from pykrx.website.krx.schema import Schema
 import pandas as pd
 from pandas import DataFrame
+import numpy as np
 
 
 class 파생상품검색(KrxWebIo):
@@ -77,6 +79,19 @@ class 전종목기본정보(KrxWebIo):
 
 
 class 전종목시세(KrxWebIo):
+    schema = Schema("output", {
+        "ISU_SRT_CD": ("종목코드", str),
+        "ISU_NM": ("종목명", str),
+        "TDD_CLSPRC": ("종가", np.float64),
+        "CMPPREVDD_PRC": ("대비", np.float64),
+        "TDD_OPNPRC": ("시가", np.float64),
+        "TDD_HGPRC": ("고가", np.float64),
+        "TDD_LWPRC": ("저가", np.float64),
+        "SETL_PRC": ("현물가", np.float64),
+        "ACC_TRDVOL": ("거래량", np.int32),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+    }, index="종목코드")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT12501"
@@ -92,23 +107,23 @@ class 전종목시세(KrxWebIo):
             DataFrame:
 
                 >> 전종목시세().fetch("20220902", "KRDRVFUK2I")
-                              ISU_CD ISU_SRT_CD                         ISU_NM TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC TDD_OPNPRC TDD_HGPRC TDD_LWPRC SPOT_PRC SETL_PRC ACC_TRDVOL          ACC_TRDVAL ACC_OPNINT_QTY SECUGRP_ID
-                    0   KR4101S90005   101S9000      코스피200 F 202209 (주간)     313.85          2         -0.65     315.70    315.85    311.15   312.92   313.85    307,202  24,105,144,800,000        333,028         FU
-                    1   KR4101SC0009   101SC000      코스피200 F 202212 (주간)     314.75          2         -0.75     316.60    316.75    312.15   312.92   314.75     14,474   1,139,311,725,000         54,796         FU
-                    2   KR4101T30009   101T3000      코스피200 F 202303 (주간)     311.25          2         -1.45     312.70    313.50    310.75   312.92   311.25        274      21,450,150,000          3,948         FU
-                    3   KR4101T60006   101T6000      코스피200 F 202306 (주간)     311.40          2         -3.55     313.60    313.60    311.40   312.92   311.40          4         313,050,000         10,554         FU
-                    4   KR4101TC0008   101TC000      코스피200 F 202312 (주간)     316.65          2         -2.35     316.65    316.65    316.65   312.92   316.65          1          79,162,500         10,156         FU
-                    5   KR4101V60002   101V6000      코스피200 F 202406 (주간)     320.55          2         -1.45     320.55    320.55    320.55   312.92   320.55          3         240,412,500            304         FU
-                    6   KR4101VC0004   101VC000      코스피200 F 202412 (주간)          -          0             -          -         -         -   312.92   318.45          0                   0          3,355         FU
-                    7   KR4401S9SCS8   401S9SCS  코스피200 SP 2209-2212 (주간)       0.90          1          0.90       1.00      1.00      0.90   312.92     0.00     17,618   2,767,660,050,000              -         FU
-                    8   KR4401S9T3S1   401S9T3S  코스피200 SP 2209-2303 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
-                    9   KR4401S9T6S4   401S9T6S  코스피200 SP 2209-2306 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
-                    10  KR4401S9TCS6   401S9TCS  코스피200 SP 2209-2312 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
-                    11  KR4401S9V6S0   401S9V6S  코스피200 SP 2209-2406 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
-                    12  KR4401S9VCS2   401S9VCS  코스피200 SP 2209-2412 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
+                        ISU_SRT_CD                         ISU_NM  TDD_CLSPRC  CMPPREVDD_PRC  TDD_OPNPRC  TDD_HGPRC  TDD_LWPRC  SETL_PRC  ACC_TRDVOL          ACC_TRDVAL
+                     0    101S9000      코스피200 F 202209 (주간)      313.85          -0.65      315.70     315.85     311.15    313.85     307,202  24,105,144,800,000
+                     1    101SC000      코스피200 F 202212 (주간)      314.75          -0.75      316.60     316.75     312.15    314.75      14,474   1,139,311,725,000
+                     2    101T3000      코스피200 F 202303 (주간)      311.25          -1.45      312.70     313.50     310.75    311.25         274      21,450,150,000
+                     3    101T6000      코스피200 F 202306 (주간)      311.40          -3.55      313.60     313.60     311.40    311.40           4         313,050,000
+                     4    101TC000      코스피200 F 202312 (주간)      316.65          -2.35      316.65     316.65     316.65    316.65           1          79,162,500
+                     5    101V6000      코스피200 F 202406 (주간)      320.55          -1.45      320.55     320.55     320.55    320.55           3         240,412,500
+                     6    101VC000      코스피200 F 202412 (주간)           -              -           -          -          -    318.45           0                   0
+                     7    401S9SCS  코스피200 SP 2209-2212 (주간)        0.90           0.90        1.00       1.00       0.90      0.00      17,618   2,767,660,050,000
+                     8    401S9T3S  코스피200 SP 2209-2303 (주간)           -              -           -          -          -      0.00           0                   0
+                     9    401S9T6S  코스피200 SP 2209-2306 (주간)           -              -           -          -          -      0.00           0                   0
+                    10    401S9TCS  코스피200 SP 2209-2312 (주간)           -              -           -          -          -      0.00           0                   0
+                    11    401S9V6S  코스피200 SP 2209-2406 (주간)           -              -           -          -          -      0.00           0                   0
+                    12    401S9VCS  코스피200 SP 2209-2412 (주간)           -              -           -          -          -      0.00           0                   0
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=trdDd, prodId=prodId, mktTpCd="T", rghtTpCd="T")
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 
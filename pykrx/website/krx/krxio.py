@@ -1,15 +1,125 @@
 from abc import abstractmethod
-from pykrx.website.comm.webio import Get, Post
+from pykrx.website.comm.webio import Get, Post, AsyncPost
+from pykrx.website.comm.ratelimit import request_scheduler
+from pykrx.website.comm.cache import DiskCache
+from pykrx.website.comm.singleflight import SingleFlight
+from pykrx.website.comm.util import get_cache_dir
+from pykrx.website.krx.schema import register_schema
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import asyncio
+import contextvars
+import datetime
+import json
+import os
+import threading
 import pandas as pd
-import time
+
+try:
+    # 설치되어 있으면 더 빠른 JSON 디코더를 사용한다. (pip install orjson)
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+# asyncio 조회 시 미리 받아둔 응답 {cache key: bytes}. (deferred_requests 참고)
+_deferred = contextvars.ContextVar("krx_deferred", default=None)
+# 일괄 조회 중인지 여부 (batch_requests 참고)
+_batch = contextvars.ContextVar("krx_batch", default=False)
+
+
+def _has_rows(result) -> bool:
+    """응답에 비어 있지 않은 데이터 블록(list)이 있는지 여부"""
+    return isinstance(result, dict) and \
+        any(isinstance(v, list) and len(v) > 0 for v in result.values())
+
+
+class PendingRequests(Exception):
+    """deferred_requests 안에서 아직 받지 않은 KRX 요청이 있을 때 발생
+
+    Attributes:
+        requests (list): 받아야 할 요청 파라미터 목록
+    """
+
+    def __init__(self, requests: list):
+        super().__init__(f"{len(requests)} pending KRX requests")
+        self.requests = requests
+
+
+@contextmanager
+def deferred_requests(memo: dict):
+    """블록 안의 KrxWebIo 조회는 HTTP 요청을 보내지 않고 memo(또는 디스크
+    캐시)에 있는 응답만 사용한다. 없는 응답이 있으면 PendingRequests가
+    발생하며, 호출자가 응답을 받아 memo에 채운 뒤 다시 실행한다.
+
+    Args:
+        memo (dict): {cache key: 응답 bytes}
+    """
+    token = _deferred.set(memo)
+    try:
+        yield memo
+    finally:
+        _deferred.reset(token)
+
+
+@contextmanager
+def batch_requests():
+    """블록 안의 KRX 요청은 일괄 조회로 보고 공용 스케줄러의 속도 제한을
+    적용한다.
+
+    단건 조회는 속도 제한 없이 바로 요청하며, 기간 분할 조회, asyncio 조회와
+    일괄 조회 함수(get_market_ohlcv_batch, iter_market_snapshots 등)의 요청만
+    스케줄러를 거친다. 직접 반복문으로 많은 요청을 보낼 때 사용한다.
+
+        >> with batch_requests():
+        >>     for ticker in tickers:
+        >>         get_market_ohlcv("20210104", "20210108", ticker)
+    """
+    token = _batch.set(True)
+    try:
+        yield
+    finally:
+        _batch.reset(token)
+
+
+def gather_results(futures) -> list:
+    """futures의 결과를 순서대로 반환한다.
+
+    deferred_requests 안에서 여러 작업 스레드가 PendingRequests를 발생시키면
+    모든 작업이 끝난 뒤 요청을 모아 한 번에 발생시킨다. 그래서 asyncio
+    조회가 한 번에 모든 요청을 받을 수 있다.
+
+    Args:
+        futures (list): concurrent.futures.Future 목록
+
+    Returns:
+        list: 각 future의 결과
+    """
+    results = []
+    pending = {}
+    for future in futures:
+        try:
+            results.append(future.result())
+        except PendingRequests as e:
+            for params in e.requests:
+                pending.setdefault(KrxWebIo._cache_key(params), params)
+    if len(pending) > 0:
+        raise PendingRequests(list(pending.values()))
+    return results
 
 
 class KrxFutureIo(Get):
+    # 일괄 조회 요청이 거쳐가는 프로세스 공용 스케줄러 (batch_requests 참고)
+    scheduler = request_scheduler
+
     @property
     def url(self):
         return "http://data.krx.co.kr/comm/bldAttendant/executeForResourceBundle.cmd"
 
     def read(self, **params):
+        if _batch.get():
+            self.scheduler.acquire(urlsplit(self.url).hostname)
         resp = super().read(**params)
         return resp.json()
 
@@ -20,41 +130,181 @@ class KrxFutureIo(Get):
 
 
 class KrxWebIo(Post):
+    # KRX 웹 서버가 한 번에 조회를 허용하는 최대 기간
+    period = pd.to_timedelta('730 days')
+    # 기간 분할 조회 시 동시에 요청하는 구간의 수
+    max_workers = 4
+    # 일괄 조회 요청이 거쳐가는 프로세스 공용 스케줄러 (batch_requests 참고)
+    scheduler = request_scheduler
+    # 응답 캐시 (enable_cache로 활성화)
+    cache = None
+    # 최근 날짜를 포함하거나 날짜가 없는 조회 결과의 캐시 유지 시간(초)
+    cache_ttl = 600
+    # 조회 일자로부터 이 일수(달력 기준)가 지난 결과만 확정된 것으로 보고
+    # 만료시키지 않는다. 공매도 잔고처럼 며칠 늦게 집계되는 데이터가 있다.
+    settle_days = 7
+    # 동시에 들어온 같은 요청을 하나의 HTTP 요청으로 합친다.
+    single_flight = SingleFlight()
+    # 응답 스키마 (schema.Schema). 하위 클래스에서 선언하면 bld로 등록된다.
+    schema = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('schema') is not None:
+            register_schema(cls.bld.fget(cls), cls.schema)
+
     def read(self, **params):
+        results = self._collect(self._plan(params))
+        if len(results) == 0:
+            return None
+        if len(results) == 1:
+            return results[0]
+        return self._merge(results)
+
+    def read_frame(self, **params) -> pd.DataFrame:
+        """read와 같은 조회를 하되, 구간별 응답을 받는 즉시 schema의 타입으로
+        변환(Schema.chunk)하고 원본 응답은 버린다. 변환된 구간들은 마지막에
+        한 번만 이어붙인다.
+
+        여러 구간으로 나뉘는 긴 기간 조회에서 메모리에 남는 원본 응답은
+        동시에 받는 구간(max_workers)의 것뿐이다.
+
+        Returns:
+            DataFrame: KRX 필드명을 컬럼으로 갖는 타입이 변환된 DataFrame.
+                       데이터가 없으면 빈 DataFrame
+        """
+        chunks = self._collect(self._plan(params), self.schema.chunk)
+        chunks = [chunk for chunk in chunks if len(chunk) > 0]
+        if len(chunks) == 0:
+            return pd.DataFrame()
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def _collect(self, requests: list, convert=None) -> list:
+        """요청 목록의 응답을 요청 순서대로 반환한다. convert를 입력하면
+        각 응답을 받는 즉시 convert를 적용한 결과를 담는다.
+        """
+        if len(requests) == 0:
+            return []
+        if convert is None:
+            def convert(result):
+                return result
+
+        memo = _deferred.get()
+        if memo is not None:
+            return self._replay(memo, requests, convert)
+
+        caller = threading.get_ident()
+        if len(requests) == 1:
+            return [convert(self._request(caller, requests[0], _batch.get()))]
+
+        # 분할 조회 구간들은 요청한 스레드 하나의 요청으로 스케줄링한다.
+        workers = max(1, min(self.max_workers, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda p: convert(self._request(caller, p, True)), requests))
+
+    def _plan(self, params: dict) -> list:
+        """조회 파라미터를 실제로 보낼 요청 목록으로 변환 (기간 분할)"""
         params.update(bld=self.bld)
         if 'strtDd' in params and 'endDd' in params:
-            dt_s = pd.to_datetime(params['strtDd'])
-            dt_e = pd.to_datetime(params['endDd'])
-            delta = pd.to_timedelta('730 days')
-
-            result = None
-            while dt_s + delta < dt_e:
-                dt_tmp = dt_s + delta
-                params['strtDd'] = dt_s.strftime("%Y%m%d")
-                params['endDd'] = dt_tmp.strftime("%Y%m%d")
-                dt_s += delta + pd.to_timedelta('1 days')
-                resp = super().read(**params)
-                if result is None:
-                    result = resp.json()
-                else:
-                    result['output'] += resp.json()['output']
-
-                # 초당 2년 데이터 조회
-                time.sleep(1)
-
-            if dt_s <= dt_e:
-                params['strtDd'] = dt_s.strftime("%Y%m%d")
-                params['endDd'] = dt_e.strftime("%Y%m%d")
-                resp = super().read(**params)
-
-                if result is not None:
-                    result['output'] += resp.json()['output']
-                else:
-                    result = resp.json()
-            return result
-        else:
-            resp = super().read(**params)
-            return resp.json()
+            windows = self._split_period(params['strtDd'], params['endDd'])
+            return [dict(params, strtDd=strtDd, endDd=endDd)
+                    for strtDd, endDd in windows]
+        return [params]
+
+    def _replay(self, memo: dict, requests: list, convert) -> list:
+        results, pending = [], []
+        for params in requests:
+            key = self._cache_key(params)
+            content = memo.get(key)
+            if content is None and self.cache is not None:
+                content = self.cache.get(key)
+            if content is None:
+                pending.append(params)
+            elif len(pending) == 0:
+                results.append(convert(_loads(content)))
+        if len(pending) > 0:
+            raise PendingRequests(pending)
+        return results
+
+    def _request(self, caller, params: dict, throttle: bool) -> dict:
+        key = self._cache_key(params)
+        cache = self.cache
+        if cache is not None:
+            data = cache.get(key)
+            if data is not None:
+                return _loads(data)
+
+        (content, result), shared = self.single_flight.do(
+            key, lambda: self._download(caller, params, key, throttle))
+        # 결과를 공유받은 호출은 원본 bytes에서 각자의 객체를 만든다.
+        return _loads(content) if shared else result
+
+    def _download(self, caller, params: dict, key: str,
+                  throttle: bool) -> tuple:
+        if throttle:
+            self.scheduler.acquire(urlsplit(self.url).hostname,
+                                   params['bld'], caller)
+        resp = super().read(**params)
+        result = _loads(resp.content)
+
+        cache = self.cache
+        if cache is not None:
+            cache.set(key, resp.content, self._cache_ttl(params, result))
+        return resp.content, result
+
+    @staticmethod
+    def _cache_key(params: dict) -> str:
+        return json.dumps(params, sort_keys=True, ensure_ascii=False,
+                          separators=(',', ':'), default=str)
+
+    @classmethod
+    def _cache_ttl(cls, params: dict, result: dict = None):
+        """집계가 끝난 과거 일자(settle_days 이전)만 조회한 결과는 변하지
+        않으므로 만료시키지 않는다 (None). 그 외의 결과와 데이터 블록이
+        비어 있는 응답은 cache_ttl 동안만 유지한다.
+        """
+        if result is not None and not _has_rows(result):
+            return cls.cache_ttl
+        dates = [str(params[k]).replace("-", "") for k in ('endDd', 'trdDd')
+                 if k in params]
+        settled = datetime.date.today() - \
+            datetime.timedelta(days=cls.settle_days)
+        if len(dates) > 0 and max(dates) < settled.strftime("%Y%m%d"):
+            return None
+        return cls.cache_ttl
+
+    @classmethod
+    def _split_period(cls, strtDd: str, endDd: str) -> list:
+        """조회 기간을 KRX가 허용하는 최대 기간 단위로 분할
+
+        Returns:
+            list: [(strtDd, endDd), ...] 날짜 순으로 정렬된 조회 구간
+        """
+        dt_s = pd.to_datetime(strtDd)
+        dt_e = pd.to_datetime(endDd)
+
+        windows = []
+        while dt_s + cls.period < dt_e:
+            dt_tmp = dt_s + cls.period
+            windows.append((dt_s.strftime("%Y%m%d"), dt_tmp.strftime("%Y%m%d")))
+            dt_s += cls.period + pd.to_timedelta('1 days')
+
+        if dt_s <= dt_e:
+            windows.append((dt_s.strftime("%Y%m%d"), dt_e.strftime("%Y%m%d")))
+        return windows
+
+    @staticmethod
+    def _merge(results: list) -> dict:
+        """구간별 조회 결과의 데이터 블록(list)을 날짜 순서대로 병합"""
+        merged = dict(results[0])
+        for key, value in merged.items():
+            if isinstance(value, list):
+                merged[key] = [row for result in results
+                               for row in result.get(key, [])]
+        return merged
 
     @property
     def url(self):
@@ -73,3 +323,91 @@ class KrxWebIo(Post):
     @abstractmethod
     def fetch(self, **params):
         return NotImplementedError
+
+
+class AsyncKrxWebIo(AsyncPost):
+    """KrxWebIo의 asyncio 버전. 하나의 요청을 받아 응답 bytes를 반환한다.
+
+    KrxWebIo와 같은 스케줄러, 디스크 캐시를 사용하며, 같은 이벤트 루프에서
+    동시에 들어온 같은 요청은 하나의 HTTP 요청으로 합친다. 이벤트 루프에서는
+    동시 요청 수를 알 수 없으므로 모든 요청에 속도 제한을 적용한다.
+    """
+    _in_flight = {}
+
+    @property
+    def url(self):
+        return KrxWebIo.url.fget(self)
+
+    async def read(self, **params) -> bytes:
+        key = KrxWebIo._cache_key(params)
+        cache = KrxWebIo.cache
+        if cache is not None:
+            content = cache.get(key)
+            if content is not None:
+                return content
+
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get((loop, key))
+        if task is None:
+            task = loop.create_task(self._download(params, key))
+            self._in_flight[(loop, key)] = task
+            task.add_done_callback(
+                lambda _: self._in_flight.pop((loop, key), None))
+        return await asyncio.shield(task)
+
+    async def _download(self, params: dict, key: str) -> bytes:
+        await KrxWebIo.scheduler.acquire_async(urlsplit(self.url).hostname,
+                                               params.get('bld'))
+
+        content = await super().read(**params)
+        # 잘못된 응답은 캐시에 저장하기 전에 걸러낸다.
+        result = _loads(content)
+
+        cache = KrxWebIo.cache
+        if cache is not None:
+            cache.set(key, content, KrxWebIo._cache_ttl(params, result))
+        return content
+
+
+def enable_cache(path: str = None, max_bytes: int = 512 * 1024 * 1024,
+                 ttl: float = 600):
+    """KRX 응답을 디스크에 캐싱한다.
+
+    집계가 끝난 과거 영업일(KrxWebIo.settle_days 이전)의 조회 결과는 만료되지
+    않으며, 최근 날짜를 포함하는 조회 결과, 데이터가 비어 있는 응답, 종목
+    마스터처럼 날짜가 없는 조회 결과는 ttl(초) 동안만 유지된다.
+
+    Args:
+        path      (str, optional): SQLite 파일 경로. 기본값은
+                                   ~/.pykrx/krx_cache.sqlite3
+        max_bytes (int, optional): 캐시의 최대 크기 (압축 후 기준)
+        ttl     (float, optional): 변할 수 있는 조회 결과의 유지 시간 (초)
+    """
+    if path is None:
+        path = os.path.join(get_cache_dir(), "krx_cache.sqlite3")
+    disable_cache()
+    KrxWebIo.cache = DiskCache(path, max_bytes)
+    KrxWebIo.cache_ttl = ttl
+
+
+def disable_cache():
+    """KRX 응답 캐싱을 중지한다. 저장된 파일은 삭제하지 않는다."""
+    cache, KrxWebIo.cache = KrxWebIo.cache, None
+    if cache is not None:
+        cache.close()
+
+
+def get_single_flight_stats() -> dict:
+    """실제로 실행된 KRX 요청 수와 다른 요청에 합쳐진 요청 수
+
+    Returns:
+        dict: {'executed': 10, 'coalesced': 30, 'in_flight': 0}
+    """
+    return KrxWebIo.single_flight.stats()
+
+
+def get_cache_stats() -> dict:
+    """캐시 적중/실패 횟수와 저장된 항목 수, 크기"""
+    if KrxWebIo.cache is None:
+        return {}
+    return KrxWebIo.cache.stats()
@@ -1,6 +1,8 @@
 from pykrx.website.krx.krxio import KrxWebIo
+from pykrx.website.krx.schema import Schema
 import pandas as pd
 from pandas import DataFrame
+import numpy as np
 
 
 class 상장종목검색(KrxWebIo):
@@ -75,6 +77,19 @@ class 상폐종목검색(KrxWebIo):
 
 
 class 개별종목시세(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TDD_OPNPRC": ("시가", np.int32),
+        "TDD_HGPRC": ("고가", np.int32),
+        "TDD_LWPRC": ("저가", np.int32),
+        "TDD_CLSPRC": ("종가", np.int32),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+        "FLUC_RT": ("등락률", np.float32),
+        "MKTCAP": ("시가총액", np.int64),
+        "LIST_SHRS": ("상장주식수", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT01701"
@@ -90,32 +105,46 @@ class 개별종목시세(KrxWebIo):
 
         Returns:
             DataFrame: 일자별 시세 조회 결과
-                   TRD_DD TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC FLUC_RT
-            0  2021/01/15     88,000          2        -1,700   -1.90
-            1  2021/01/14     89,700          3             0    0.00
-            2  2021/01/13     89,700          2          -900   -0.99
-            3  2021/01/12     90,600          2          -400   -0.44
-            4  2021/01/11     91,000          1         2,200    2.48
-
-            TDD_OPNPRC TDD_HGPRC TDD_LWPRC  ACC_TRDVOL         ACC_TRDVAL
-                89,800    91,800    88,000  33,431,809  2,975,231,937,664
-                88,700    90,000    88,700  26,393,970  2,356,661,622,700
-                89,800    91,200    89,100  36,068,848  3,244,066,562,850
-                90,300    91,400    87,800  48,682,416  4,362,546,108,950
-                90,000    96,800    89,500  90,306,177  8,379,237,727,064
-
-                             MKTCAP      LIST_SHRS
-                525,340,864,400,000  5,969,782,550
-                535,489,494,735,000  5,969,782,550
-                535,489,494,735,000  5,969,782,550
-                540,862,299,030,000  5,969,782,550
-                543,250,212,050,000  5,969,782,550
+                   TRD_DD  TDD_CLSPRC  FLUC_RT  TDD_OPNPRC  TDD_HGPRC
+            0  2021/01/15      88,000    -1.90      89,800     91,800
+            1  2021/01/14      89,700     0.00      88,700     90,000
+            2  2021/01/13      89,700    -0.99      89,800     91,200
+            3  2021/01/12      90,600    -0.44      90,300     91,400
+            4  2021/01/11      91,000     2.48      90,000     96,800
+
+            TDD_LWPRC  ACC_TRDVOL         ACC_TRDVAL               MKTCAP
+               88,000  33,431,809  2,975,231,937,664  525,340,864,400,000
+               88,700  26,393,970  2,356,661,622,700  535,489,494,735,000
+               89,100  36,068,848  3,244,066,562,850  535,489,494,735,000
+               87,800  48,682,416  4,362,546,108,950  540,862,299,030,000
+               89,500  90,306,177  8,379,237,727,064  543,250,212,050,000
+
+                LIST_SHRS
+            5,969,782,550
+            5,969,782,550
+            5,969,782,550
+            5,969,782,550
+            5,969,782,550
         """
         result = self.read(isuCd=isuCd, strtDd=strtDd, endDd=endDd, adjStkPrc=adjStkPrc)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전종목시세(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "ISU_SRT_CD": ("티커", str),
+        "ISU_ABBRV": ("종목명", str),
+        "TDD_OPNPRC": ("시가", np.int32),
+        "TDD_HGPRC": ("고가", np.int32),
+        "TDD_LWPRC": ("저가", np.int32),
+        "TDD_CLSPRC": ("종가", np.int32),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+        "FLUC_RT": ("등락률", np.float32),
+        "MKTCAP": ("시가총액", np.int64),
+        "LIST_SHRS": ("상장주식수", np.int64),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT01501"
@@ -130,32 +159,42 @@ class 전종목시세(KrxWebIo):
         Returns:
             DataFrame: 전종목의 가격 정보
 
-                 ISU_SRT_CD    ISU_ABBRV  MKT_NM     SECT_TP_NM TDD_CLSPRC
-            0        060310           3S  KOSDAQ     중견기업부      2,365
-            1        095570   AJ네트웍스   KOSPI                     5,400
-            2        068400     AJ렌터카   KOSPI                    12,000
-            3        006840     AK홀딩스   KOSPI                    55,000
-            4        054620    APS홀딩스  KOSDAQ     우량기업부      4,475
-
-            FLUC_TP_CD CMPPREVDD_PRC FLUC_RT TDD_OPNPRC TDD_HGPRC TDD_LWPRC
-                     2            -5   -0.21      2,370     2,395     2,355
-                     1            70    1.31      5,330     5,470     5,260
-                     1           400    3.45     11,600    12,000    11,550
-                     1           800    1.48     54,700    55,300    53,600
-                     1            10    0.22      4,440     4,520     4,440
-
-            ACC_TRDVOL     ACC_TRDVAL           MKTCAP    LIST_SHRS MKT_ID
-               152,157    361,210,535  105,886,118,195   44,772,143    KSQ
-                90,129    485,098,680  252,840,393,000   46,822,295    STK
-               219,282  2,611,434,750  265,755,600,000   22,146,300    STK
-                16,541    901,619,600  728,615,855,000   13,247,561    STK
-                31,950    142,780,675   91,264,138,975   20,394,221    KSQ
+               ISU_SRT_CD   ISU_ABBRV  TDD_CLSPRC  FLUC_RT  TDD_OPNPRC
+            0      060310          3S       2,365    -0.21       2,370
+            1      095570  AJ네트웍스       5,400     1.31       5,330
+            2      068400    AJ렌터카      12,000     3.45      11,600
+            3      006840    AK홀딩스      55,000     1.48      54,700
+            4      054620   APS홀딩스       4,475     0.22       4,440
+
+            TDD_HGPRC  TDD_LWPRC  ACC_TRDVOL     ACC_TRDVAL           MKTCAP
+                2,395      2,355     152,157    361,210,535  105,886,118,195
+                5,470      5,260      90,129    485,098,680  252,840,393,000
+               12,000     11,550     219,282  2,611,434,750  265,755,600,000
+               55,300     53,600      16,541    901,619,600  728,615,855,000
+                4,520      4,440      31,950    142,780,675   91,264,138,975
+
+             LIST_SHRS
+            44,772,143
+            46,822,295
+            22,146,300
+            13,247,561
+            20,394,221
         """
         result = self.read(mktId=mktId, trdDd=trdDd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class PER_PBR_배당수익률_전종목(KrxWebIo):
+    schema = Schema("output", {
+        "ISU_SRT_CD": ("티커", str),
+        "BPS": ("BPS", np.int32),
+        "PER": ("PER", np.float64),
+        "PBR": ("PBR", np.float64),
+        "EPS": ("EPS", np.int32),
+        "DVD_YLD": ("DIV", np.float64),
+        "DPS": ("DPS", np.int32),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03501"
@@ -169,32 +208,28 @@ class PER_PBR_배당수익률_전종목(KrxWebIo):
 
         Returns:
             DataFrame:
-                     ISU_SRT_CD   ISU_ABBRV                      ISU_ABBRV_STR
-                0        060310         3S            3S <em class ="up"></em>
-                1        095570   AJ네트웍스  AJ네트웍스 <em class ="up"></em>
-                2        006840    AK홀딩스     AK홀딩스 <em class ="up"></em>
-                3        054620   APS홀딩스    APS홀딩스 <em class ="up"></em>
-                4        265520    AP시스템     AP시스템 <em class ="up"></em>
-
-                TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC FLUC_RT    EPS    PER
-                     2,195          1            20    0.92      -      -
-                     4,560          1            20    0.44    982   4.64
-                    27,550          1         2,150    8.46  2,168  12.71
-                     6,920          2          -250   -3.49      -      -
-                    25,600          1           600    2.40    671  38.15
-
-                    BPS   PBR  DPS DVD_YLD
-                    745  2.95    0    0.00
-                  6,802  0.67  300    6.58
-                 62,448  0.44  750    2.72
-                 10,530  0.66    0    0.00
-                  7,468  3.43   50    0.20
+                   ISU_SRT_CD    EPS    PER     BPS   PBR  DPS  DVD_YLD
+                0      060310      -      -     745  2.95    0     0.00
+                1      095570    982   4.64   6,802  0.67  300     6.58
+                2      006840  2,168  12.71  62,448  0.44  750     2.72
+                3      054620      -      -  10,530  0.66    0     0.00
+                4      265520    671  38.15   7,468  3.43   50     0.20
         """
         result = self.read(mktId=mktId, trdDd=trdDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class PER_PBR_배당수익률_개별(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "BPS": ("BPS", np.int32),
+        "PER": ("PER", np.float64),
+        "PBR": ("PBR", np.float32),
+        "EPS": ("EPS", np.int32),
+        "DVD_YLD": ("DIV", np.float32),
+        "DPS": ("DPS", np.int32),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03502"
@@ -211,26 +246,30 @@ class PER_PBR_배당수익률_개별(KrxWebIo):
 
         Returns:
             DataFrame:
-                       TRD_DD TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC FLUC_RT
-                0  2019/03/29     44,650          2          -200   -0.45
-                1  2019/03/28     44,850          2          -500   -1.10
-                2  2019/03/27     45,350          1           100    0.22
-                3  2019/03/26     45,250          2          -250   -0.55
-                4  2019/03/25     45,500          2        -1,050   -2.26
-
-                  EPS   PER     BPS   PBR  DPS DVD_YLD
-                5,997  7.45  28,126  1.59  850    1.90
-                5,997  7.48  28,126  1.59  850    1.90
-                5,997  7.56  28,126  1.61  850    1.87
-                5,997  7.55  28,126  1.61  850    1.88
-                5,997  7.59  28,126  1.62  850    1.87
+                       TRD_DD    EPS   PER     BPS   PBR  DPS  DVD_YLD
+                0  2019/03/29  5,997  7.45  28,126  1.59  850     1.90
+                1  2019/03/28  5,997  7.48  28,126  1.59  850     1.90
+                2  2019/03/27  5,997  7.56  28,126  1.61  850     1.87
+                3  2019/03/26  5,997  7.55  28,126  1.61  850     1.88
+                4  2019/03/25  5,997  7.59  28,126  1.62  850     1.87
         """
         result = self.read(mktId=mktId, strtDd=strtDd, endDd=endDd,
                            isuCd=isuCd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전종목등락률(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "ISU_ABBRV": ("종목명", str),
+        "ISU_SRT_CD": ("티커", str),
+        "BAS_PRC": ("시가", np.int32),
+        "TDD_CLSPRC": ("종가", np.int32),
+        "CMPPREVDD_PRC": ("변동폭", np.int32),
+        "FLUC_RT": ("등락률", np.float64),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT01602"
@@ -247,26 +286,35 @@ class 전종목등락률(KrxWebIo):
 
         Returns:
             DataFrame:
-                  ISU_SRT_CD    ISU_ABBRV BAS_PRC TDD_CLSPRC CMPPREVDD_PRC
-                0     060310           3S   2,420      3,290           870
-                1     095570   AJ네트웍스   6,360      5,430          -930
-                2     068400     AJ렌터카  13,550     11,500        -2,050
-                3     006840     AK홀딩스  73,000     77,100         4,100
-                4     054620    APS홀딩스   6,550      5,560          -990
-
-                FLUC_RT  ACC_TRDVOL       ACC_TRDVAL FLUC_TP
-                  35.95  40,746,975  132,272,050,410       1
-                 -14.62   3,972,269   23,943,953,170       2
-                 -15.13  14,046,987  166,188,922,890       2
-                   5.62   1,707,900  132,455,779,600       1
-                 -15.11   7,459,926   41,447,809,620       2
+                   ISU_SRT_CD   ISU_ABBRV  BAS_PRC  TDD_CLSPRC  CMPPREVDD_PRC
+                0      060310          3S    2,420       3,290            870
+                1      095570  AJ네트웍스    6,360       5,430           -930
+                2      068400    AJ렌터카   13,550      11,500         -2,050
+                3      006840    AK홀딩스   73,000      77,100          4,100
+                4      054620   APS홀딩스    6,550       5,560           -990
+
+                FLUC_RT  ACC_TRDVOL       ACC_TRDVAL
+                  35.95  40,746,975  132,272,050,410
+                 -14.62   3,972,269   23,943,953,170
+                 -15.13  14,046,987  166,188,922,890
+                   5.62   1,707,900  132,455,779,600
+                 -15.11   7,459,926   41,447,809,620
         """
         result = self.read(mktId=mktId, adjStkPrc=adjStkPrc, strtDd=strtDd,
                            endDd=endDd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class 외국인보유량_전종목(KrxWebIo):
+    schema = Schema("output", {
+        "ISU_SRT_CD": ("티커", str),
+        "LIST_SHRS": ("상장주식수", np.int64),
+        "FORN_HD_QTY": ("보유수량", np.int64),
+        "FORN_SHR_RT": ("지분율", np.float16),
+        "FORN_ORD_LMT_QTY": ("한도수량", np.int64),
+        "FORN_LMT_EXHST_RT": ("한도소진률", np.float16),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03701"
@@ -283,33 +331,35 @@ class 외국인보유량_전종목(KrxWebIo):
 
         Returns:
             DataFrame:
-                  ISU_SRT_CD   ISU_ABBRV TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC
-                0     060310          3S      2,185          2           -10
-                1     095570  AJ네트웍스      4,510          2           -50
-                2     006840    AK홀딩스     26,300          2        -1,250
-                3     054620   APS홀딩스      7,010          1            90
-                4     265520    AP시스템     25,150          2          -450
-
-                FLUC_RT   LIST_SHRS FORN_HD_QTY FORN_SHR_RT FORN_ORD_LMT_QTY
-                  -0.46  44,802,511     739,059        1.65       44,802,511
-                  -1.10  46,822,295   4,983,122       10.64       46,822,295
-                  -4.54  13,247,561   1,107,305        8.36       13,247,561
-                   1.30  20,394,221     461,683        2.26       20,394,221
-                  -1.76  14,480,227   1,564,312       10.80       14,480,227
-
-                  FORN_LMT_EXHST_RT
-                               1.65
-                              10.64
-                               8.36
-                               2.26
-                              10.80
+                   ISU_SRT_CD   LIST_SHRS  FORN_HD_QTY  FORN_SHR_RT
+                0      060310  44,802,511      739,059         1.65
+                1      095570  46,822,295    4,983,122        10.64
+                2      006840  13,247,561    1,107,305         8.36
+                3      054620  20,394,221      461,683         2.26
+                4      265520  14,480,227    1,564,312        10.80
+
+                FORN_ORD_LMT_QTY  FORN_LMT_EXHST_RT
+                      44,802,511               1.65
+                      46,822,295              10.64
+                      13,247,561               8.36
+                      20,394,221               2.26
+                      14,480,227              10.80
         """
         result = self.read(searchType=1, mktId=mktId, trdDd=trdDd,
                            isuLmtRto=isuLmtRto)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 외국인보유량_개별추이(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "LIST_SHRS": ("상장주식수", np.int64),
+        "FORN_HD_QTY": ("보유수량", np.int64),
+        "FORN_SHR_RT": ("지분율", np.float16),
+        "FORN_ORD_LMT_QTY": ("한도수량", np.int64),
+        "FORN_LMT_EXHST_RT": ("한도소진률", np.float16),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03702"
@@ -324,30 +374,23 @@ class 외국인보유량_개별추이(KrxWebIo):
 
         Returns:
             DataFrame:
-                       TRD_DD TDD_CLSPRC FLUC_TP_CD CMPPREVDD_PRC FLUC_RT
-                0  2021/01/15     88,000          2        -1,700   -1.90
-                1  2021/01/14     89,700          3             0    0.00
-                2  2021/01/13     89,700          2          -900   -0.99
-                3  2021/01/12     90,600          2          -400   -0.44
-                4  2021/01/11     91,000          1         2,200    2.48
-
-                     LIST_SHRS    FORN_HD_QTY FORN_SHR_RT FORN_ORD_LMT_QTY
-                 5,969,782,550  3,317,574,926       55.57    5,969,782,550
-                 5,969,782,550  3,314,652,740       55.52    5,969,782,550
-                 5,969,782,550  3,316,551,070       55.56    5,969,782,550
-                 5,969,782,550  3,318,676,206       55.59    5,969,782,550
-                 5,969,782,550  3,324,115,988       55.68    5,969,782,550
-
-                 FORN_LMT_EXHST_RT
-                             55.57
-                             55.52
-                             55.56
-                             55.59
-                             55.68
+                       TRD_DD      LIST_SHRS    FORN_HD_QTY  FORN_SHR_RT
+                0  2021/01/15  5,969,782,550  3,317,574,926        55.57
+                1  2021/01/14  5,969,782,550  3,314,652,740        55.52
+                2  2021/01/13  5,969,782,550  3,316,551,070        55.56
+                3  2021/01/12  5,969,782,550  3,318,676,206        55.59
+                4  2021/01/11  5,969,782,550  3,324,115,988        55.68
+
+                FORN_ORD_LMT_QTY  FORN_LMT_EXHST_RT
+                   5,969,782,550              55.57
+                   5,969,782,550              55.52
+                   5,969,782,550              55.56
+                   5,969,782,550              55.59
+                   5,969,782,550              55.68
         """
         result = self.read(searchType=2, strtDd=strtDd, endDd=endDd,
                            isuCd=isuCd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 투자자별_거래실적_전체시장_기간합계(KrxWebIo):
@@ -389,6 +432,15 @@ class 투자자별_거래실적_전체시장_기간합계(KrxWebIo):
 
 
 class 투자자별_거래실적_전체시장_일별추이_일반(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TRDVAL1": ("기관합계", np.int64),
+        "TRDVAL2": ("기타법인", np.int64),
+        "TRDVAL3": ("개인", np.int64),
+        "TRDVAL4": ("외국인합계", np.int64),
+        "TRDVAL_TOT": ("전체", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT02202"
@@ -408,7 +460,8 @@ class 투자자별_거래실적_전체시장_일별추이_일반(KrxWebIo):
             askBid     (int): 1: 매도 / 2: 매수 / 3: 순매수
 
         Returns:
-            DataFrame:
+            DataFrame: 응답 구간별로 TRD_DD는 날짜, TRDVAL은 int64로
+                       변환된다. (KrxWebIo.read_frame)
 
                 >> 투자자별_거래실적_전체시장_일별추이_일반().fetch(
                     "20210115", "20210122", "STK", "", "", "", 1, 1)
@@ -427,13 +480,28 @@ class 투자자별_거래실적_전체시장_일별추이_일반(KrxWebIo):
                    106,647,770  1,353,312,434
                    123,524,707  1,472,048,573
         """
-        result = self.read(strtDd=strtDd, endDd=endDd, mktId=mktId, etf=etf,
-                           etn=etn, elw=els, inqTpCd=2, trdVolVal=trdVolVal,
-                           askBid=askBid)
-        return DataFrame(result['output'])
+        return self.read_frame(strtDd=strtDd, endDd=endDd, mktId=mktId,
+                               etf=etf, etn=etn, elw=els, inqTpCd=2,
+                               trdVolVal=trdVolVal, askBid=askBid)
 
 
 class 투자자별_거래실적_전체시장_일별추이_상세(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TRDVAL1": ("금융투자", np.int64),
+        "TRDVAL2": ("보험", np.int64),
+        "TRDVAL3": ("투신", np.int64),
+        "TRDVAL4": ("사모", np.int64),
+        "TRDVAL5": ("은행", np.int64),
+        "TRDVAL6": ("기타금융", np.int64),
+        "TRDVAL7": ("연기금", np.int64),
+        "TRDVAL8": ("기타법인", np.int64),
+        "TRDVAL9": ("개인", np.int64),
+        "TRDVAL10": ("외국인", np.int64),
+        "TRDVAL11": ("기타외국인", np.int64),
+        "TRDVAL_TOT": ("전체", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT02203"
@@ -453,7 +521,8 @@ class 투자자별_거래실적_전체시장_일별추이_상세(KrxWebIo):
             askBid     (int): 1: 매도 / 2: 매수 / 3: 순매수
 
         Returns:
-            DataFrame:
+            DataFrame: 응답 구간별로 TRD_DD는 날짜, TRDVAL은 int64로
+                       변환된다. (KrxWebIo.read_frame)
 
                 >> 투자자별_거래실적_전체시장_일별추이_상세().fetch(
                     "20210115", "20210122", "STK", "", "", "", 1, 1)
@@ -479,10 +548,9 @@ class 투자자별_거래실적_전체시장_일별추이_상세(KrxWebIo):
                    103,967,576  2,680,194  1,353,312,434
                    120,350,740  3,173,967  1,472,048,573
         """
-        result = self.read(strtDd=strtDd, endDd=endDd, mktId=mktId, etf=etf,
-                           etn=etn, elw=els, trdVolVal=trdVolVal,
-                           askBid=askBid, detailView=1)
-        return DataFrame(result['output'])
+        return self.read_frame(strtDd=strtDd, endDd=endDd, mktId=mktId,
+                               etf=etf, etn=etn, elw=els, trdVolVal=trdVolVal,
+                               askBid=askBid, detailView=1)
 
 
 class 투자자별_거래실적_개별종목_기간합계(KrxWebIo):
@@ -520,6 +588,15 @@ class 투자자별_거래실적_개별종목_기간합계(KrxWebIo):
 
 
 class 투자자별_거래실적_개별종목_일별추이_일반(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TRDVAL1": ("기관합계", np.int64),
+        "TRDVAL2": ("기타법인", np.int64),
+        "TRDVAL3": ("개인", np.int64),
+        "TRDVAL4": ("외국인합계", np.int64),
+        "TRDVAL_TOT": ("전체", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT02302"
@@ -536,7 +613,8 @@ class 투자자별_거래실적_개별종목_일별추이_일반(KrxWebIo):
             askBid     (int): 1: 매도 / 2: 매수 / 3: 순매수
 
         Returns:
-            DataFrame:
+            DataFrame: 응답 구간별로 TRD_DD는 날짜, TRDVAL은 int64로
+                       변환된다. (KrxWebIo.read_frame)
                        TRD_DD     TRDVAL1  TRDVAL2     TRDVAL3    TRDVAL4
                 0  2021/01/20  13,121,791  114,341   7,346,474  4,628,521
                 1  2021/01/19  13,912,581  323,382  20,956,376  4,702,705
@@ -551,12 +629,27 @@ class 투자자별_거래실적_개별종목_일별추이_일반(KrxWebIo):
                    33,431,809
                    26,393,970
         """
-        result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd, inqTpCd=2,
-                           trdVolVal=trdVolVal, askBid=askBid)
-        return DataFrame(result['output'])
+        return self.read_frame(strtDd=strtDd, endDd=endDd, isuCd=isuCd,
+                               inqTpCd=2, trdVolVal=trdVolVal, askBid=askBid)
 
 
 class 투자자별_거래실적_개별종목_일별추이_상세(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TRDVAL1": ("금융투자", np.int64),
+        "TRDVAL2": ("보험", np.int64),
+        "TRDVAL3": ("투신", np.int64),
+        "TRDVAL4": ("사모", np.int64),
+        "TRDVAL5": ("은행", np.int64),
+        "TRDVAL6": ("기타금융", np.int64),
+        "TRDVAL7": ("연기금", np.int64),
+        "TRDVAL8": ("기타법인", np.int64),
+        "TRDVAL9": ("개인", np.int64),
+        "TRDVAL10": ("외국인", np.int64),
+        "TRDVAL11": ("기타외국인", np.int64),
+        "TRDVAL_TOT": ("전체", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT02303"
@@ -573,7 +666,8 @@ class 투자자별_거래실적_개별종목_일별추이_상세(KrxWebIo):
             askBid     (int): 1: 매도 / 2: 매수 / 3: 순매수
 
         Returns:
-            DataFrame:
+            DataFrame: 응답 구간별로 TRD_DD는 날짜, TRDVAL은 int64로
+                       변환된다. (KrxWebIo.read_frame)
                        TRD_DD    TRDVAL1  TRDVAL2    TRDVAL3  TRDVAL4 TRDVAL5
                 0  2021/01/20  5,328,172  259,546    313,812   58,992   3,449
                 1  2021/01/19  2,835,217  119,057    312,695   42,163  10,100
@@ -598,9 +692,9 @@ class 투자자별_거래실적_개별종목_일별추이_상세(KrxWebIo):
                     17,660  26,393,970
                     27,034  36,068,848
         """
-        result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd, inqTpCd=2,
-                           trdVolVal=trdVolVal, askBid=askBid, detailView=1)
-        return DataFrame(result['output'])
+        return self.read_frame(strtDd=strtDd, endDd=endDd, isuCd=isuCd,
+                               inqTpCd=2, trdVolVal=trdVolVal, askBid=askBid,
+                               detailView=1)
 
 
 class 투자자별_순매수상위종목(KrxWebIo):
@@ -657,6 +751,17 @@ class 투자자별_순매수상위종목(KrxWebIo):
 
 
 class 전체지수기본정보(KrxWebIo):
+    schema = Schema("output", {
+        "IDX_NM": ("지수명", str),
+        "BAS_TM_CONTN": ("기준시점", str),
+        "ANNC_TM_CONTN": ("발표시점", str),
+        "BAS_IDX_CONTN": ("기준지수", np.float64),
+        "COMPST_ISU_CNT": ("종목수", np.int16),
+        # IndexTicker가 지수 티커를 만드는 데 사용한다.
+        "IDX_IND_CD": ("지수코드", str),
+        "IND_TP_CD": ("지수구분", str),
+    }, index="지수명")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00401"
@@ -673,23 +778,18 @@ class 전체지수기본정보(KrxWebIo):
 
         Returns:
             DataFrame: [description]
-                    IDX_NM   IDX_ENG_NM BAS_TM_CONTN ANNC_TM_CONTN
-            0      KRX 300      KRX 300   2010.01.04    2018.02.05
-            1      KTOP 30      KTOP 30   1996.01.03    2015.07.13
-            2      KRX 100      KRX 100   2001.01.02    2005.06.01
-
-                BAS_IDX_CONTN CALC_CYCLE_CONTN        CALC_TM_CONTN
-                     1,000.00              1초  09:00:10 ~ 15:30:00
-                       888.85              2초  09:00:10 ~ 15:30:00
-                     1,000.00              1초  09:00:10 ~ 15:30:00
-
-                COMPST_ISU_CNT IND_TP_CD IDX_IND_CD
-                           300         5        300
-                            30         5        600
-                           100         5        042
+                IDX_NM  BAS_TM_CONTN  ANNC_TM_CONTN  BAS_IDX_CONTN
+            0  KRX 300    2010.01.04     2018.02.05       1,000.00
+            1  KTOP 30    1996.01.03     2015.07.13         888.85
+            2  KRX 100    2001.01.02     2005.06.01       1,000.00
+
+            COMPST_ISU_CNT  IND_TP_CD  IDX_IND_CD
+                       300          5         300
+                        30          5         600
+                       100          5         042
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 주가지수검색(KrxWebIo):
@@ -725,6 +825,17 @@ class 주가지수검색(KrxWebIo):
 
 
 class 개별지수시세(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "OPNPRC_IDX": ("시가", np.float64),
+        "HGPRC_IDX": ("고가", np.float64),
+        "LWPRC_IDX": ("저가", np.float64),
+        "CLSPRC_IDX": ("종가", np.float64),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+        "MKTCAP": ("상장시가총액", np.int64),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00301"
@@ -741,33 +852,37 @@ class 개별지수시세(KrxWebIo):
 
         Returns:
             DataFrame:
-                       TRD_DD CLSPRC_IDX FLUC_TP_CD PRV_DD_CMPR UPDN_RATE
-                0  2021/01/15   2,298.05          2      -68.84     -2.91
-                1  2021/01/14   2,366.89          2      -23.88     -1.00
-                2  2021/01/13   2,390.77          1       25.68      1.09
-                3  2021/01/12   2,365.09          2      -48.63     -2.01
-                4  2021/01/11   2,413.72          1       33.32      1.40
-
-                    OPNPRC_IDX HGPRC_IDX LWPRC_IDX  ACC_TRDVOL
-                      2,369.94  2,400.69  2,292.92  22,540,416
-                      2,390.59  2,393.24  2,330.76  23,685,783
-                      2,367.94  2,455.05  2,300.10  33,690,790
-                      2,403.51  2,428.76  2,295.91  41,777,076
-                      2,403.37  2,613.83  2,352.21  50,975,686
-
-                           ACC_TRDVAL               MKTCAP
-                    1,967,907,809,615  137,712,088,395,380
-                    2,058,155,913,335  142,206,993,223,695
-                    3,177,416,322,985  144,549,058,033,310
-                    3,933,263,957,150  143,250,319,286,660
-                    6,602,833,901,895  146,811,113,380,140
+                       TRD_DD  CLSPRC_IDX  OPNPRC_IDX  HGPRC_IDX  LWPRC_IDX
+                0  2021/01/15    2,298.05    2,369.94   2,400.69   2,292.92
+                1  2021/01/14    2,366.89    2,390.59   2,393.24   2,330.76
+                2  2021/01/13    2,390.77    2,367.94   2,455.05   2,300.10
+                3  2021/01/12    2,365.09    2,403.51   2,428.76   2,295.91
+                4  2021/01/11    2,413.72    2,403.37   2,613.83   2,352.21
+
+                ACC_TRDVOL         ACC_TRDVAL               MKTCAP
+                22,540,416  1,967,907,809,615  137,712,088,395,380
+                23,685,783  2,058,155,913,335  142,206,993,223,695
+                33,690,790  3,177,416,322,985  144,549,058,033,310
+                41,777,076  3,933,263,957,150  143,250,319,286,660
+                50,975,686  6,602,833,901,895  146,811,113,380,140
         """
         result = self.read(indIdx2=ticker, indIdx=group_id, strtDd=fromdate,
                            endDd=todate)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전체지수시세(KrxWebIo):
+    schema = Schema("output", {
+        "IDX_NM": ("지수명", str),
+        "OPNPRC_IDX": ("시가", np.float64),
+        "HGPRC_IDX": ("고가", np.float64),
+        "LWPRC_IDX": ("저가", np.float64),
+        "CLSPRC_IDX": ("종가", np.float64),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+        "MKTCAP": ("상장시가총액", np.int64),
+    }, index="지수명")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00101"
@@ -788,55 +903,57 @@ class 전체지수시세(KrxWebIo):
 
             >> 전체지수시세().fetch("20211126", "01")
 
-                        IDX_NM CLSPRC_IDX FLUC_TP_CD CMPPREVDD_IDX FLUC_RT
-                0      KRX 300   1,770.31          2        -28.95   -1.61
-                1      KTOP 30  10,474.88          2       -194.69   -1.82
-                2      KRX 100   6,099.23          2        -98.21   -1.58
-                3   KRX 자동차   2,072.14          2        -55.88   -2.63
-                4   KRX 반도체   3,689.43          2        -55.31   -1.48
-
-                    OPNPRC_IDX  HGPRC_IDX  LWPRC_IDX   ACC_TRDVOL
-                      1,794.31   1,804.44   1,765.64  195,701,215
-                     10,621.85  10,677.23  10,448.27   35,084,853
-                      6,177.12   6,213.58   6,083.65  118,353,920
-                      2,122.03   2,122.81   2,067.39    8,993,829
-                      3,736.03   3,776.01   3,664.35   24,833,578
-
-                            ACC_TRDVAL                 MKTCAP
-                    12,073,173,651,861  2,021,911,406,190,965
-                     3,590,583,333,556  1,110,875,284,982,930
-                     8,948,592,533,231  1,705,817,023,537,590
-                       490,044,360,120    125,029,489,225,115
-                     1,050,786,237,050    124,684,859,892,510
+                       IDX_NM  CLSPRC_IDX  OPNPRC_IDX  HGPRC_IDX  LWPRC_IDX
+                0     KRX 300    1,770.31    1,794.31   1,804.44   1,765.64
+                1     KTOP 30   10,474.88   10,621.85  10,677.23  10,448.27
+                2     KRX 100    6,099.23    6,177.12   6,213.58   6,083.65
+                3  KRX 자동차    2,072.14    2,122.03   2,122.81   2,067.39
+                4  KRX 반도체    3,689.43    3,736.03   3,776.01   3,664.35
+
+                 ACC_TRDVOL          ACC_TRDVAL                 MKTCAP
+                195,701,215  12,073,173,651,861  2,021,911,406,190,965
+                 35,084,853   3,590,583,333,556  1,110,875,284,982,930
+                118,353,920   8,948,592,533,231  1,705,817,023,537,590
+                  8,993,829     490,044,360,120    125,029,489,225,115
+                 24,833,578   1,050,786,237,050    124,684,859,892,510
 
             >> 전체지수시세().fetch("20211126", "02")
 
-                               IDX_NM CLSPRC_IDX FLUC_TP_CD CMPPREVDD_IDX
-                0  코스피 (외국주포함)         -                        -
-                1              코스피   2,936.44          2        -43.83
-                2          코스피 200     385.07          2         -6.86
-                3          코스피 100   2,906.68          2        -50.79
-                4           코스피 50   2,700.81          2        -45.96
-
-                  FLUC_RT OPNPRC_IDX  HGPRC_IDX  LWPRC_IDX   ACC_TRDVOL
-                        -          -          -          -  595,597,647
-                    -1.47   2,973.04   2,985.77   2,930.31  594,707,257
-                    -1.75     390.61     392.81     384.19  145,771,166
-                    -1.72   2,947.18   2,963.27   2,900.41  100,357,121
-                    -1.67   2,736.77   2,752.70   2,693.90   52,627,040
-
-                           ACC_TRDVAL                 MKTCAP
-                   11,901,297,731,572  2,167,444,597,231,403
-                   11,894,910,355,357  2,165,631,236,658,233
-                    8,625,603,922,656  1,831,345,766,736,180
-                    7,370,285,846,691  1,661,265,294,441,780
-                    5,768,837,287,881  1,453,136,066,992,400
+                                IDX_NM  CLSPRC_IDX  OPNPRC_IDX  HGPRC_IDX
+                0  코스피 (외국주포함)           -           -          -
+                1               코스피    2,936.44    2,973.04   2,985.77
+                2           코스피 200      385.07      390.61     392.81
+                3           코스피 100    2,906.68    2,947.18   2,963.27
+                4            코스피 50    2,700.81    2,736.77   2,752.70
+
+                LWPRC_IDX   ACC_TRDVOL          ACC_TRDVAL
+                        -  595,597,647  11,901,297,731,572
+                 2,930.31  594,707,257  11,894,910,355,357
+                   384.19  145,771,166   8,625,603,922,656
+                 2,900.41  100,357,121   7,370,285,846,691
+                 2,693.90   52,627,040   5,768,837,287,881
+
+                               MKTCAP
+                2,167,444,597,231,403
+                2,165,631,236,658,233
+                1,831,345,766,736,180
+                1,661,265,294,441,780
+                1,453,136,066,992,400
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, trdDd=trdDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 전체지수등락률(KrxWebIo):
+    schema = Schema("output", {
+        "IDX_IND_NM": ("지수명", str),
+        "OPN_DD_INDX": ("시가", np.float64),
+        "END_DD_INDX": ("종가", np.float64),
+        "FLUC_RT": ("등락률", np.float16),
+        "ACC_TRDVOL": ("거래량", np.int64),
+        "ACC_TRDVAL": ("거래대금", np.int64),
+    }, index="지수명")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00201"
@@ -856,26 +973,36 @@ class 전체지수등락률(KrxWebIo):
 
         Returns:
             DataFrame:
-                        IDX_IND_NM OPN_DD_INDX END_DD_INDX FLUC_TP
-                    0      KRX 300    1,845.82    1,920.52       1
-                    1      KTOP 30   10,934.77   11,589.88       1
-                    2      KRX 100    6,418.50    6,695.11       1
-                    3  KRX Mid 200    1,751.19    1,722.32       2
-                    4   KRX 자동차    2,046.67    2,298.05       1
-
-                       PRV_DD_CMPR FLUC_RT     ACC_TRDVOL           ACC_TRDVAL
-                             74.70    4.05  3,293,520,227  201,056,395,899,602
-                            655.11    5.99    820,597,395  109,126,566,806,196
-                            276.61    4.31  1,563,383,456  154,154,503,633,541
-                            -28.87   -1.65  2,807,696,801   27,059,313,040,039
-                            251.38   12.28    288,959,592   29,886,192,965,797
+                        IDX_IND_NM  OPN_DD_INDX  END_DD_INDX  FLUC_RT
+                    0      KRX 300     1,845.82     1,920.52     4.05
+                    1      KTOP 30    10,934.77    11,589.88     5.99
+                    2      KRX 100     6,418.50     6,695.11     4.31
+                    3  KRX Mid 200     1,751.19     1,722.32    -1.65
+                    4   KRX 자동차     2,046.67     2,298.05    12.28
+
+                       ACC_TRDVOL           ACC_TRDVAL
+                    3,293,520,227  201,056,395,899,602
+                      820,597,395  109,126,566,806,196
+                    1,563,383,456  154,154,503,633,541
+                    2,807,696,801   27,059,313,040,039
+                      288,959,592   29,886,192,965,797
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, strtDd=strtDd,
                            endDd=endDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class PER_PBR_배당수익률_전지수(KrxWebIo):
+    schema = Schema("output", {
+        "IDX_NM": ("지수명", str),
+        "CLSPRC_IDX": ("종가", np.float64),
+        "FLUC_RT": ("등락률", np.float64),
+        "WT_PER": ("PER", np.float32),
+        "FWD_PER": ("선행PER", np.float32),
+        "WT_STKPRC_NETASST_RTO": ("PBR", np.float32),
+        "DIV_YD": ("배당수익률", np.float32),
+    }, index="지수명")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00701"
@@ -893,25 +1020,35 @@ class PER_PBR_배당수익률_전지수(KrxWebIo):
 
         Returns:
             DataFrame:
-                     IDX_NM   CLSPRC_IDX FLUC_TP_CD PRV_DD_CMPR FLUC_RT WT_PER
-            0       KRX 300     1,753.96          2      -16.35   -0.92  13.61
-            1       KTOP 30    10,348.84          2     -126.04   -1.20  12.67
-            2       KRX 100     6,045.16          2      -54.07   -0.89  13.42
-            3     KRX 자동차     2,030.72         2      -41.42   -2.00  11.94
-            4     KRX 반도체     3,649.78         2      -39.65   -1.07  21.48
-
-                FWD_PER WT_STKPRC_NETASST_RTO DIV_YD
-                      -                  1.24   2.01
-                      -                  1.22   2.33
-                      -                  1.22   1.97
-                      -                  0.79   1.42
-                      -                  2.59   0.61
+                   IDX_NM  CLSPRC_IDX  FLUC_RT  WT_PER  FWD_PER
+            0     KRX 300    1,753.96    -0.92   13.61        -
+            1     KTOP 30   10,348.84    -1.20   12.67        -
+            2     KRX 100    6,045.16    -0.89   13.42        -
+            3  KRX 자동차    2,030.72    -2.00   11.94        -
+            4  KRX 반도체    3,649.78    -1.07   21.48        -
+
+            WT_STKPRC_NETASST_RTO  DIV_YD
+                             1.24    2.01
+                             1.22    2.33
+                             1.22    1.97
+                             0.79    1.42
+                             2.59    0.61
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, trdDd=trdDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class PER_PBR_배당수익률_개별지수(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "CLSPRC_IDX": ("종가", np.float64),
+        "FLUC_RT": ("등락률", np.float64),
+        "WT_PER": ("PER", np.float32),
+        "FWD_PER": ("선행PER", np.float32),
+        "WT_STKPRC_NETASST_RTO": ("PBR", np.float32),
+        "DIV_YD": ("배당수익률", np.float32),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00702"
@@ -931,23 +1068,23 @@ class PER_PBR_배당수익률_개별지수(KrxWebIo):
 
                 > PER_PBR_배당수익률_개별지수().fetch("20211122", "20211129", 5, 300)
 
-                       TRD_DD CLSPRC_IDX FLUC_TP_CD PRV_DD_CMPR FLUC_RT
-                0  2021/11/29   1,753.96          2      -16.35   -0.92
-                1  2021/11/26   1,770.31          2      -28.95   -1.61
-                2  2021/11/25   1,799.26          2      -16.10   -0.89
-                3  2021/11/24   1,815.36          2       -2.39   -0.13
-                4  2021/11/23   1,817.75          2      -14.91   -0.81
-
-                    WT_PER FWD_PER WT_STKPRC_NETASST_RTO DIV_YD
-                     13.61       -                  1.24   2.01
-                     13.73       -                  1.26   1.99
-                     13.96       -                  1.28   1.96
-                     14.08       -                  1.29   1.94
-                     14.10       -                  1.29   1.94
+                       TRD_DD  CLSPRC_IDX  FLUC_RT  WT_PER  FWD_PER
+                0  2021/11/29    1,753.96    -0.92   13.61        -
+                1  2021/11/26    1,770.31    -1.61   13.73        -
+                2  2021/11/25    1,799.26    -0.89   13.96        -
+                3  2021/11/24    1,815.36    -0.13   14.08        -
+                4  2021/11/23    1,817.75    -0.81   14.10        -
+
+                WT_STKPRC_NETASST_RTO  DIV_YD
+                                 1.24    2.01
+                                 1.26    1.99
+                                 1.28    1.96
+                                 1.29    1.94
+                                 1.29    1.94
         """
         result = self.read(indTpCd=indTpCd, indTpCd2=indTpCd2, strtDd=strtDd,
                            endDd=endDd)
-        return DataFrame(result['output'])
+        return self.schema.frame(result)
 
 
 class 지수구성종목(KrxWebIo):
@@ -986,26 +1123,30 @@ class 지수구성종목(KrxWebIo):
 
 
 class 업종분류현황(KrxWebIo):
+    schema = Schema("block1", {
+        "ISU_SRT_CD": ("종목코드", str),
+        "ISU_ABBRV": ("종목명", str),
+        "IDX_IND_NM": ("업종명", str),
+        "TDD_CLSPRC": ("종가", np.int32),
+        "CMPPREVDD_PRC": ("대비", np.float64),
+        "FLUC_RT": ("등락률", np.float64),
+        "MKTCAP": ("시가총액", np.int64),
+    }, index="종목코드")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03901"
 
     def fetch(self, trdDd: str, mktId: str) -> DataFrame:
         """
-                ISU_SRT_CD      ISU_ABBRV MKT_TP_NM    IDX_IND_NM  TDD_CLSPRC CMPPREVDD_PRC FLUC_RT             MKTCAP FLUC_TP_CD
-            0       095570     AJ네트웍스     KOSPI       서비스업      7,280            80    1.11    340,866,307,600          1
-            1       006840       AK홀딩스     KOSPI       기타금융     15,900           150    0.95    210,636,219,900          1
-            2       027410            BGF     KOSPI       기타금융      3,990             0    0.00    381,909,996,090          3
-            3       282330      BGF리테일     KOSPI        유통업     156,000        -1,500   -0.95  2,696,289,336,000          2
-            4       138930    BNK금융지주     KOSPI       기타금융      6,560           -40   -0.61  2,138,135,213,760          2
-            ..         ...       ...       ...        ...        ...           ...     ...                ...        ...
-            934     005010         휴스틸     KOSPI       철강금속      7,430          -470   -5.95    291,167,397,250          2
-            935     000540       흥국화재     KOSPI         보험        3,295           -40   -1.20    211,679,515,275          2
-            936     000547   흥국화재2우B     KOSPI         보험       21,750           100    0.46      3,340,800,000          1
-            937     000545      흥국화재우     KOSPI         보험       7,000           -30   -0.43      5,376,000,000          2
-            938     003280        흥아해운     KOSPI      운수창고업    1,660            -5   -0.30    399,105,332,340          2
+               ISU_SRT_CD    ISU_ABBRV  IDX_IND_NM  TDD_CLSPRC  CMPPREVDD_PRC  FLUC_RT             MKTCAP
+            0      095570   AJ네트웍스    서비스업       7,280             80     1.11    340,866,307,600
+            1      006840     AK홀딩스    기타금융      15,900            150     0.95    210,636,219,900
+            2      027410          BGF    기타금융       3,990              0     0.00    381,909,996,090
+            3      282330    BGF리테일      유통업     156,000         -1,500    -0.95  2,696,289,336,000
+            4      138930  BNK금융지주    기타금융       6,560            -40    -0.61  2,138,135,213,760
         """
-        return DataFrame(self.read(trdDd=trdDd, mktId=mktId)['block1'])
+        return self.schema.frame(self.read(trdDd=trdDd, mktId=mktId))
 
 
 # -----------------------------------------------------------------------------
@@ -1186,6 +1327,19 @@ class 투자자별_공매도_거래(KrxWebIo):
 
 
 class 공매도_거래상위_50종목(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "RANK": ("순위", np.int32),
+        "ISU_CD": ("티커", str),
+        "CVSRTSELL_TRDVAL": ("공매도거래대금", np.int64),
+        "ACC_TRDVAL": ("총거래대금", np.int64),
+        "TDD_SRTSELL_WT": ("공매도비중", np.float64),
+        "STR_CONST_VAL1": ("직전40일거래대금평균", np.int64),
+        "STR_CONST_VAL2": ("공매도거래대금증가율", np.float64),
+        "VALU_PD_AVG_SRTSELL_WT": ("직전40일공매도평균비중", np.float64),
+        "VALU_PD_CMP_TDD_SRTSELL_RTO": ("공매도비중증가율", np.float64),
+        "PRC_YD": ("주가수익률", np.float64),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30401"
@@ -1203,32 +1357,42 @@ class 공매도_거래상위_50종목(KrxWebIo):
 
             DataFrame:
 
-                   RANK  ISU_CD            ISU_ABBRV CVSRTSELL_TRDVAL
-                0     1  003545           대신증권우       38,510,030
-                1     2  267290         경동도시가스       13,265,200
-                2     3  015890             태경산업       15,865,860
-                3     4  005945         NH투자증권우       25,401,240
-                4     5  227840 현대코퍼레이션홀딩스       13,784,400
-
-                     ACC_TRDVAL TDD_SRTSELL_WT STR_CONST_VAL1 STR_CONST_VAL2
-                    915,824,030           4.21      5,814,411           6.62
-                    329,805,000           4.02      2,755,259           4.82
-                    428,852,660           3.70      8,316,412           1.91
-                    908,915,950           2.79      4,610,634           5.51
-                    546,597,900           2.52      3,084,294           4.47
-
-                    VALU_PD_AVG_SRTSELL_WT VALU_PD_CMP_TDD_SRTSELL_RTO PRC_YD
-                                      0.51                        8.33  -1.25
-                                      0.66                        6.14  -2.46
-                                      1.30                        2.85  -4.46
-                                      0.44                        6.40  -0.35
-                                      0.51                        4.91  -2.37
+                   RANK  ISU_CD  CVSRTSELL_TRDVAL   ACC_TRDVAL  TDD_SRTSELL_WT
+                0     1  003545        38,510,030  915,824,030            4.21
+                1     2  267290        13,265,200  329,805,000            4.02
+                2     3  015890        15,865,860  428,852,660            3.70
+                3     4  005945        25,401,240  908,915,950            2.79
+                4     5  227840        13,784,400  546,597,900            2.52
+
+                STR_CONST_VAL1  STR_CONST_VAL2  VALU_PD_AVG_SRTSELL_WT
+                     5,814,411            6.62                    0.51
+                     2,755,259            4.82                    0.66
+                     8,316,412            1.91                    1.30
+                     4,610,634            5.51                    0.44
+                     3,084,294            4.47                    0.51
+
+                VALU_PD_CMP_TDD_SRTSELL_RTO  PRC_YD
+                                       8.33   -1.25
+                                       6.14   -2.46
+                                       2.85   -4.46
+                                       6.40   -0.35
+                                       4.91   -2.37
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class 공매도_잔고상위_50종목(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "RANK": ("순위", np.int32),
+        "ISU_CD": ("티커", str),
+        "BAL_QTY": ("공매도잔고", np.int64),
+        "LIST_SHRS": ("상장주식수", np.int64),
+        "BAL_AMT": ("공매도금액", np.int64),
+        "MKTCAP": ("시가총액", np.float64),
+        "BAL_RTO": ("비중", np.float16),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30801"
@@ -1246,32 +1410,34 @@ class 공매도_잔고상위_50종목(KrxWebIo):
 
                 >> 공매도_잔고상위_50종목().fetch("20210129", 1))
 
-                       RANK  ISU_CD       ISU_CD2       ISU_ABBRV     BAL_QTY
-                    0     1  032350  KR7032350001    롯데관광개발   4,693,027
-                    1     2  042670  KR7042670000  두산인프라코어  10,846,251
-                    2     3  068270  KR7068270008        셀트리온   6,523,965
-                    3     4  008770  KR7008770000        호텔신라   1,269,261
-                    4     5  011690  KR7011690005      유양디앤유   1,604,890
-
-                          LIST_SHRS            BAL_AMT              MKTCAP
-                         69,275,662     74,853,780,650   1,104,946,808,900
-                        215,931,625     92,843,908,560   1,848,374,710,000
-                        134,997,805  2,146,384,485,000  44,414,277,845,000
-                         39,248,121    106,237,145,700   3,285,067,727,700
-                         58,494,201      1,957,965,800      71,362,925,220
-
-                         BAL_RTO
-                            6.77
-                            5.02
-                            4.83
-                            3.23
-                            2.74
+                       RANK  ISU_CD     BAL_QTY    LIST_SHRS            BAL_AMT
+                    0     1  032350   4,693,027   69,275,662     74,853,780,650
+                    1     2  042670  10,846,251  215,931,625     92,843,908,560
+                    2     3  068270   6,523,965  134,997,805  2,146,384,485,000
+                    3     4  008770   1,269,261   39,248,121    106,237,145,700
+                    4     5  011690   1,604,890   58,494,201      1,957,965,800
+
+                                MKTCAP  BAL_RTO
+                     1,104,946,808,900     6.77
+                     1,848,374,710,000     5.02
+                    44,414,277,845,000     4.83
+                     3,285,067,727,700     3.23
+                        71,362,925,220     2.74
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class 전종목_공매도_잔고(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "ISU_CD": ("티커", str),
+        "BAL_QTY": ("공매도잔고", np.int64),
+        "LIST_SHRS": ("상장주식수", np.int64),
+        "BAL_AMT": ("공매도금액", np.int64),
+        "MKTCAP": ("시가총액", np.float64),
+        "BAL_RTO": ("비중", np.float16),
+    }, index="티커")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30501"
@@ -1289,25 +1455,34 @@ class 전종목_공매도_잔고(KrxWebIo):
 
                 >> 전종목_공매도_잔고().fetch("20210127", 1)
 
-                     ISU_CD      ISU_ABBRV  BAL_QTY    LIST_SHRS
-                0    095570     AJ네트웍스   33,055   46,822,295
-                1    006840       AK홀딩스    4,575   13,247,561
-                2    027410            BGF   68,060   95,716,791
-                3    282330      BGF리테일    4,794   17,283,906
-                4    138930    BNK금융지주  596,477  325,935,246
-
-                          BAL_AMT             MKTCAP BAL_RTO
-                      134,864,400    191,034,963,600    0.07
-                      131,760,000    381,529,756,800    0.03
-                      449,196,000    631,730,820,600    0.07
-                      757,452,000  2,730,857,148,000    0.03
-                    3,340,271,200  1,825,237,377,600    0.18
+                   ISU_CD  BAL_QTY    LIST_SHRS        BAL_AMT
+                0  095570   33,055   46,822,295    134,864,400
+                1  006840    4,575   13,247,561    131,760,000
+                2  027410   68,060   95,716,791    449,196,000
+                3  282330    4,794   17,283,906    757,452,000
+                4  138930  596,477  325,935,246  3,340,271,200
+
+                           MKTCAP  BAL_RTO
+                  191,034,963,600     0.07
+                  381,529,756,800     0.03
+                  631,730,820,600     0.07
+                2,730,857,148,000     0.03
+                1,825,237,377,600     0.18
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class 개별종목_공매도_잔고(KrxWebIo):
+    schema = Schema("OutBlock_1", {
+        "RPT_DUTY_OCCR_DD": ("날짜", "datetime"),
+        "BAL_QTY": ("공매도잔고", np.int64),
+        "LIST_SHRS": ("상장주식수", np.int64),
+        "BAL_AMT": ("공매도금액", np.int64),
+        "MKTCAP": ("시가총액", np.float64),
+        "BAL_RTO": ("비중", np.float32),
+    }, index="날짜")
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30502"
@@ -1327,22 +1502,22 @@ class 개별종목_공매도_잔고(KrxWebIo):
                 >> 개별종목_공매도_잔고().fetch(
                     "20200106", "20200110", "KR7005930003")
 
-                  RPT_DUTY_OCCR_DD    BAL_QTY      LIST_SHRS          BAL_AMT
-                0       2020/01/10  5,489,240  5,969,782,550  326,609,780,000
-                1       2020/01/09  5,387,073  5,969,782,550  315,682,477,800
-                2       2020/01/08  5,224,233  5,969,782,550  296,736,434,400
-                3       2020/01/07  5,169,745  5,969,782,550  288,471,771,000
-                4       2020/01/06  5,630,893  5,969,782,550  312,514,561,500
-
-                             MKTCAP BAL_RTO
-                        355,202,061,725,000    0.09
-                        349,829,257,430,000    0.09
-                        339,083,648,840,000    0.09
-                        333,113,866,290,000    0.09
-                        331,322,931,525,000    0.09
+                   RPT_DUTY_OCCR_DD    BAL_QTY      LIST_SHRS          BAL_AMT
+                0        2020/01/10  5,489,240  5,969,782,550  326,609,780,000
+                1        2020/01/09  5,387,073  5,969,782,550  315,682,477,800
+                2        2020/01/08  5,224,233  5,969,782,550  296,736,434,400
+                3        2020/01/07  5,169,745  5,969,782,550  288,471,771,000
+                4        2020/01/06  5,630,893  5,969,782,550  312,514,561,500
+
+                             MKTCAP  BAL_RTO
+                355,202,061,725,000     0.09
+                349,829,257,430,000     0.09
+                339,083,648,840,000     0.09
+                333,113,866,290,000     0.09
+                331,322,931,525,000     0.09
         """
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result['OutBlock_1'])
+        return self.schema.frame(result)
 
 
 class 기업주요변동사항(KrxWebIo):
@@ -1,16 +1,134 @@
 from pykrx.website.comm import dataframe_empty_handler, singleton
+from pykrx.website.comm.snapshot import load_snapshot, save_snapshot
 from pykrx.website.krx.market.core import (
     상장종목검색, 상폐종목검색, 전체지수기본정보
 )
+from pykrx.website.krx.krxio import gather_results
 from pandas import DataFrame
+import numpy as np
 import pandas as pd
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+
+
+class _TickerIndex:
+    """티커 -> (종목, ISIN, 시장) 조회 테이블
+
+    같은 티커가 여러 번 나오면 (상폐 종목의 티커 재사용 등) ISIN 순으로
+    정렬해서 첫 번째 종목을 사용한다.
+    """
+
+    def __init__(self, df: DataFrame):
+        if len(df) == 0:
+            df = DataFrame(columns=['종목', 'ISIN', '시장'],
+                           index=pd.Index([], name='티커'))
+        df = df.reset_index().sort_values(['티커', 'ISIN'], kind="stable")
+        df = df.drop_duplicates('티커')
+        self.tickers = pd.Index(df['티커'].to_numpy(dtype=object))
+        self.names = df['종목'].to_numpy(dtype=object)
+        self.isins = df['ISIN'].to_numpy(dtype=object)
+        self.markets = df['시장'].to_numpy(dtype=object)
+        self.rows = dict(zip(self.tickers,
+                             zip(self.names, self.isins, self.markets)))
 
 
 @singleton
 class StockTicker:
+    """상장/상폐 종목 마스터
+
+    각 마스터는 처음 필요할 때 조회하며, 조회 결과는 디스크에 저장해서
+    ttl(초) 동안 다른 프로세스에서도 재사용한다. 만료된 마스터를 다시
+    조회하지 못하면 저장된 마스터를 그대로 사용한다.
+    """
+
+    # 디스크에 저장된 종목 마스터의 유효 시간 (초)
+    ttl = 24 * 60 * 60
+    _sources = {"stock_listed": 상장종목검색, "stock_delisted": 상폐종목검색}
+
     def __init__(self):
-        self.listed = self.__fetch(상장종목검색)
-        self.delisted = self.__fetch(상폐종목검색)
+        self._lock = threading.RLock()
+        self._tables = {}
+        self._indexes = {}
+
+    @property
+    def listed(self) -> DataFrame:
+        return self._table("stock_listed")
+
+    @property
+    def delisted(self) -> DataFrame:
+        return self._table("stock_delisted")
+
+    def _table(self, name):
+        df = self._tables.get(name)
+        if df is not None:
+            return df
+        # 여러 스레드가 동시에 요청해도 한 번만 조회한다.
+        with self._lock:
+            df = self._tables.get(name)
+            if df is None:
+                df = load_snapshot(name, self.ttl)
+                if df is None:
+                    df = self.__fetch(self._sources[name])
+                    if len(df) > 0:
+                        save_snapshot(name, df)
+                    else:
+                        df = load_snapshot(name)
+                        if df is None:
+                            return DataFrame()
+                self._tables[name] = df
+            return df
+
+    def _index(self, name) -> _TickerIndex:
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is None:
+                df = self._table(name)
+                index = _TickerIndex(df)
+                if len(df) > 0:
+                    self._indexes[name] = index
+            return index
+
+    def refresh(self):
+        """종목 마스터를 다시 조회해서 저장한다."""
+        with self._lock:
+            for name, what in self._sources.items():
+                df = self.__fetch(what)
+                if len(df) > 0:
+                    save_snapshot(name, df)
+                    self._tables[name] = df
+                    self._indexes.pop(name, None)
+
+    def lookup(self, ticker: str):
+        """입력된 종목(ticker)의 (종목, ISIN, 시장). 없으면 None"""
+        row = self._index("stock_listed").rows.get(ticker)
+        if row is None:
+            row = self._index("stock_delisted").rows.get(ticker)
+        return row
+
+    def get_isins(self, tickers: list) -> np.ndarray:
+        """여러 종목의 ISIN을 한 번에 조회
+
+        Args:
+            tickers (list): 6자리 종목 구분 정보 목록
+
+        Returns:
+            ndarray: tickers와 같은 순서의 ISIN. 없는 종목은 None
+        """
+        tickers = np.asarray(tickers, dtype=object)
+        result = np.full(len(tickers), None, dtype=object)
+        for name in ("stock_listed", "stock_delisted"):
+            missing = np.flatnonzero(pd.isna(result))
+            if len(missing) == 0:
+                break
+            index = self._index(name)
+            pos = index.tickers.get_indexer(tickers[missing])
+            found = pos >= 0
+            result[missing[found]] = index.isins[pos[found]]
+        return result
 
     @dataframe_empty_handler
     def __fetch(self, what, market="전체"):
@@ -38,35 +156,30 @@ class StockTicker:
                 시장          코스피
         """
 
-        df = self.listed
-        if ticker not in df.index:
-            df = self.delisted
-            if ticker not in df.index:
-                return None
-            # 030270 에스마크	KR7030270003
-            # 030270 가희 11R	KRA030270151
-            elif isinstance(df.loc[ticker], DataFrame):
-                # ISIN을 기준으로 sorting 후 첫 번째 데이터를 선택
-                df = df.loc[ticker].sort_values('ISIN').iloc[:1]
-        return df.loc[ticker]
+        row = self.lookup(ticker)
+        if row is None:
+            return None
+        return pd.Series(row, index=['종목', 'ISIN', '시장'], name=ticker)
 
 
 @dataframe_empty_handler
 def get_stock_name(ticker):
-    s = StockTicker().get(ticker)
-    return s['종목']
+    return StockTicker().lookup(ticker)[0]
 
 
 @dataframe_empty_handler
 def get_stock_ticker_isin(ticker):
-    s = StockTicker().get(ticker)
-    return s['ISIN']
+    return StockTicker().lookup(ticker)[1]
 
 
 @dataframe_empty_handler
 def get_stock_ticekr_market(ticker):
-    s = StockTicker().get(ticker)
-    return s['시장']
+    return StockTicker().lookup(ticker)[2]
+
+
+def get_stock_ticker_isins(tickers: list) -> list:
+    """여러 종목의 ISIN을 한 번에 조회. 없는 종목은 None"""
+    return StockTicker().get_isins(tickers).tolist()
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -75,8 +188,44 @@ def get_stock_ticekr_market(ticker):
 
 @singleton
 class IndexTicker:
+    """지수 마스터
+
+    KRX/KOSPI/KOSDAQ/테마 그룹을 동시에 조회하고, 조회 결과는 디스크에
+    저장해서 ttl(초) 동안 재사용한다. 시장별로 기준일 순으로 정렬한 색인을
+    미리 만들어 get_ticker는 이진 탐색으로 처리한다.
+    """
+
+    # 디스크에 저장된 지수 마스터의 유효 시간 (초)
+    ttl = 24 * 60 * 60
+
     def __init__(self):
-        self.df = self.__fetch()
+        df = load_snapshot("index_master", self.ttl)
+        if df is None:
+            df = self.__fetch()
+            if len(df) > 0:
+                save_snapshot("index_master", df)
+            else:
+                stale = load_snapshot("index_master")
+                df = df if stale is None else stale
+        self.df = df
+        self._build_index()
+
+    def _build_index(self):
+        # {시장: (정렬된 기준일, 기준일 순서의 티커 위치)}
+        self._markets = {}
+        self._names = {}
+        if len(self.df) == 0:
+            return
+        self._tickers = self.df.index.to_numpy()
+        self._names = dict(zip(self.df.index, self.df['지수명']))
+        # 기준일 (YYYY.MM.DD)을 YYYYMMDD로 맞춰서 비교한다.
+        keys = self.df['기준일'].str.replace(r'\D', '', regex=True).to_numpy()
+        markets = self.df['시장'].to_numpy()
+        for market in pd.unique(markets):
+            positions = np.flatnonzero(markets == market)
+            order = np.argsort(keys[positions], kind="stable")
+            self._markets[market] = (keys[positions][order],
+                                     positions[order])
 
     @dataframe_empty_handler
     def __fetch(self):
@@ -84,18 +233,17 @@ class IndexTicker:
         # - 02 : KOSPI
         # - 03 : KOSDAQ
         # - 04 : 테마
-        data = []
-        for market in ["01", "02", "03", "04"]:
+        code2market = {
+            "01": "KRX",
+            "02": "KOSPI",
+            "03": "KOSDAQ",
+            "04": "테마"
+        }
+
+        def _fetch(market):
             df = 전체지수기본정보().fetch(market)
             df = df[['IDX_IND_CD', 'IDX_NM', 'BAS_TM_CONTN', 'IND_TP_CD']]
             df.columns = ['티커', '지수명', '기준일', '그룹']
-
-            code2market = {
-                "01": "KRX",
-                "02": "KOSPI",
-                "03": "KOSDAQ",
-                "04": "테마"
-            }
             df['시장'] = code2market[market]
             # 다른 지수에 같은 티커가 존재함. 중복 문제를 피하기 위해 코스피
             # 1xxx 코스닥 2xxx로 내부에서 사용함
@@ -103,16 +251,27 @@ class IndexTicker:
             # 29         1        001      코스피        STK      KOSPI
             # 75         2        001      코스닥        KSQ     KOSDAQ
             df['티커'] = df['그룹'] + df['티커']
-            data.append(df.set_index('티커'))
+            return df.set_index('티커')
 
+        # 작업 스레드도 호출한 곳의 context (deferred_requests)에서 실행한다.
+        with ThreadPoolExecutor(max_workers=len(code2market)) as executor:
+            futures = [executor.submit(contextvars.copy_context().run,
+                                       _fetch, market)
+                       for market in code2market]
+            data = gather_results(futures)
         return pd.concat(data).sort_index(ascending=True)
 
     def get_ticker(self, market, date):
-        cond = (self.df['시장'] == market) & (self.df['기준일'] <= date)
-        return self.df[cond].index.tolist()
+        """market에서 date 이전에 기준일이 있는 지수의 티커 (티커 순)"""
+        index = self._markets.get(market)
+        if index is None:
+            return []
+        keys, positions = index
+        pos = np.searchsorted(keys, str(date).replace("-", ""), side="right")
+        return self._tickers[np.sort(positions[:pos])].tolist()
 
     def get_name(self, ticker):
-        return self.df.loc[ticker, '지수명']
+        return self._names[ticker]
 
     def get_market(self, ticker):
         return self.df.loc[ticker].index['시장']
@@ -0,0 +1,195 @@
+from pykrx.website.comm.snapshot import load_snapshot, save_snapshot
+from pykrx.website.krx.market.wrap import get_market_ticker_and_name
+from pykrx.website.krx.calendar import TradingCalendar
+from pykrx.website.krx.krxio import gather_results, batch_requests
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from pandas import DataFrame
+import threading
+import pandas as pd
+
+
+class UniverseIndex:
+    """시장별 종목의 상장 구간 (시점별 종목 구성) 색인
+
+    일정 간격(step 영업일)의 전종목 스냅샷을 조회하고, 종목 구성이 달라진
+    두 스냅샷 사이는 이분 탐색으로 변경일을 찾아 종목별 [시작, 종료] 구간을
+    만든다. 구간은 디스크에 저장되며, 조회 범위를 벗어난 날짜를 요청하면
+    필요한 범위만 추가로 만든다.
+
+    NOTE: step 영업일보다 짧은 기간 안에 상장과 폐지가 모두 일어난 종목은
+          찾지 못할 수 있다.
+
+    Args:
+        market (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        step   (int, optional): 스냅샷 간격 (영업일)
+    """
+
+    max_workers = 4
+
+    def __init__(self, market: str = "KOSPI", step: int = 20):
+        self.market = market
+        self.step = step
+        self._lock = threading.RLock()
+        self._name = f"universe_{market.lower()}"
+        self.intervals = DataFrame(columns=['시작', '종료'],
+                                   index=pd.Index([], name='티커'))
+        self.first = self.last = None
+        df = load_snapshot(self._name)
+        if df is not None and 'first' in df.attrs:
+            self.first = df.attrs['first']
+            self.last = df.attrs['last']
+            self.intervals = df
+
+    def _save(self):
+        df = self.intervals.copy()
+        df.attrs = {"first": self.first, "last": self.last}
+        save_snapshot(self._name, df)
+
+    def _fetch(self, day: pd.Timestamp) -> set:
+        date = day.strftime("%Y%m%d")
+        s = get_market_ticker_and_name(date, self.market)
+        # 조회에 실패한 날을 종목이 없는 날로 취급하면 잘못된 폐지/재상장
+        # 구간이 만들어져 저장된다.
+        if len(s) == 0:
+            raise ValueError(f"empty {self.market} snapshot on {date}")
+        return set(s.index)
+
+    def _build(self, days: pd.DatetimeIndex) -> DataFrame:
+        """days 구간의 종목별 상장 구간 (양 끝 포함)"""
+        snapshots = {}
+
+        def fetch_all(positions):
+            positions = [p for p in positions if p not in snapshots]
+            workers = max(1, min(self.max_workers, len(positions)))
+            with batch_requests(), \
+                    ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(contextvars.copy_context().run,
+                                           self._fetch, days[p])
+                           for p in positions]
+                snapshots.update(zip(positions, gather_results(futures)))
+
+        checkpoints = sorted(set(range(0, len(days), self.step)) |
+                             {len(days) - 1})
+        fetch_all(checkpoints)
+
+        # 종목 구성이 다른 구간을 반으로 나눠가며 변경일을 찾는다.
+        pending = [(a, b) for a, b in zip(checkpoints, checkpoints[1:])]
+        while len(pending) > 0:
+            pending = [(a, b) for a, b in pending
+                       if b - a > 1 and snapshots[a] != snapshots[b]]
+            mids = [(a + b) // 2 for a, b in pending]
+            fetch_all(mids)
+            pending = [half for (a, b), m in zip(pending, mids)
+                       for half in ((a, m), (m, b))]
+
+        # 조회한 스냅샷 사이는 구성이 같거나 하루 차이이므로 순서대로
+        # 훑으면서 구간을 만든다.
+        rows, opened, prev = [], {}, set()
+        positions = sorted(snapshots)
+        for i, p in enumerate(positions):
+            curr = snapshots[p]
+            for ticker in curr - prev:
+                opened[ticker] = days[p]
+            for ticker in prev - curr:
+                rows.append((ticker, opened.pop(ticker),
+                             days[positions[i - 1]]))
+            prev = curr
+        for ticker, start in opened.items():
+            rows.append((ticker, start, days[-1]))
+
+        df = DataFrame(rows, columns=['티커', '시작', '종료'])
+        df['시작'] = df['시작'].dt.strftime("%Y%m%d")
+        df['종료'] = df['종료'].dt.strftime("%Y%m%d")
+        return df.set_index('티커').sort_index()
+
+    def ensure(self, fromdate: str, todate: str):
+        """fromdate ~ todate 구간의 색인을 만든다. 이미 있는 구간은 다시
+        조회하지 않는다.
+
+        Raises:
+            ValueError: 구간 안의 스냅샷 조회에 실패한 경우. 색인과 저장된
+                        파일은 바뀌지 않는다.
+        """
+        with self._lock:
+            calendar = TradingCalendar()
+            if self.first is None:
+                days = calendar.business_days(fromdate, todate)
+                if len(days) == 0:
+                    return
+                self.intervals = self._build(days)
+                self.first = days[0].strftime("%Y%m%d")
+                self.last = days[-1].strftime("%Y%m%d")
+                self._save()
+                return
+
+            if fromdate < self.first:
+                days = calendar.business_days(fromdate, self.first)
+                if len(days) > 1:
+                    self._merge(self._build(days), self.first, after=False)
+                    self.first = days[0].strftime("%Y%m%d")
+                    self._save()
+            if todate > self.last:
+                days = calendar.business_days(self.last, todate)
+                if len(days) > 1:
+                    self._merge(self._build(days), self.last, after=True)
+                    self.last = days[-1].strftime("%Y%m%d")
+                    self._save()
+
+    def _merge(self, new: DataFrame, edge: str, after: bool):
+        """edge 일자를 공유하는 기존 구간과 새 구간을 이어 붙인다."""
+        old = self.intervals.reset_index()
+        new = new.reset_index()
+        if after:
+            old_key, new_key = '종료', '시작'
+        else:
+            old_key, new_key = '시작', '종료'
+        joined = old[old[old_key] == edge].merge(
+            new[new[new_key] == edge], on='티커', suffixes=('', '_new'))
+        for _, row in joined.iterrows():
+            mask = (old['티커'] == row['티커']) & (old[old_key] == edge)
+            old.loc[mask, old_key] = row[f"{old_key}_new"]
+        linked = new['티커'].isin(joined['티커']) & (new[new_key] == edge)
+        df = pd.concat([old, new[~linked]])
+        self.intervals = df.set_index('티커').sort_index()
+
+    def covers(self, fromdate: str, todate: str) -> bool:
+        return self.first is not None and \
+            self.first <= fromdate and todate <= self.last
+
+    def get_tickers(self, date: str) -> list:
+        """date에 상장되어 있던 종목 (티커 순)"""
+        date = str(date).replace("-", "")
+        self.ensure(date, date)
+        start = self.intervals['시작'].to_numpy()
+        end = self.intervals['종료'].to_numpy()
+        mask = (start <= date) & (date <= end)
+        return self.intervals.index[mask].unique().tolist()
+
+    def membership(self, fromdate: str, todate: str) -> DataFrame:
+        """날짜 x 티커 상장 여부 (bool)"""
+        fromdate = str(fromdate).replace("-", "")
+        todate = str(todate).replace("-", "")
+        self.ensure(fromdate, todate)
+        days = TradingCalendar().business_days(fromdate, todate)
+        keys = days.strftime("%Y%m%d").to_numpy(dtype=object)[:, None]
+        start = self.intervals['시작'].to_numpy(dtype=object)[None, :]
+        end = self.intervals['종료'].to_numpy(dtype=object)[None, :]
+        values = (start <= keys) & (keys <= end)
+        df = DataFrame(values, index=days, columns=self.intervals.index)
+        # 같은 종목의 여러 구간은 하나의 열로 합친다.
+        return df.T.groupby(level=0).any().T
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_universe_index(market: str = "KOSPI") -> UniverseIndex:
+    """시장별 UniverseIndex (프로세스에서 하나씩 공유)"""
+    with _indexes_lock:
+        index = _indexes.get(market)
+        if index is None:
+            index = UniverseIndex(market)
+            _indexes[market] = index
+        return index
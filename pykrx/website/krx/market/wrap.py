@@ -1,4 +1,6 @@
 from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm.parser import parse_frame, parse_date
+from pykrx.website.comm.framecache import FrameCache
 from pykrx.website.krx.market.ticker import get_stock_ticker_isin
 from pykrx.website.krx.market.core import (
     개별종목시세, 전종목등락률, PER_PBR_배당수익률_전종목,
@@ -16,13 +18,139 @@ from pykrx.website.krx.market.core import (
     PER_PBR_배당수익률_전지수, PER_PBR_배당수익률_개별지수, 기업주요변동사항
 )
 
+import datetime
 import numpy as np
 import pandas as pd
 from pandas import Series, DataFrame
 
 
+# 일자/시장별 전종목시세 (get_market_snapshot)와
+# 종목/기간별 개별종목시세 (get_market_history_by_date)
+_snapshot_cache = FrameCache(max_bytes=64 * 1024 * 1024)
+# 오늘 이후를 포함하는 조회 결과의 메모리 캐시 유지 시간(초). 장중 시세는
+# 계속 바뀌므로 기본값은 캐싱하지 않는 것 (0)
+_intraday_ttl = 0
+
+
+def configure_snapshot_cache(max_bytes: int = None,
+                             intraday_ttl: float = None):
+    """전종목시세/개별종목시세 메모리 캐시를 설정한다. 입력하지 않은 값은
+    바뀌지 않는다.
+
+    Args:
+        max_bytes    (int  , optional): 최대 크기 (DataFrame.memory_usage
+                                        기준). 0이면 캐싱하지 않는다.
+        intraday_ttl (float, optional): 오늘 이후를 포함하는 조회 결과의 유지
+                                        시간(초). 0(기본값)이면 캐싱하지 않는다.
+    """
+    global _intraday_ttl
+    if max_bytes is not None:
+        _snapshot_cache.configure(max_bytes)
+    if intraday_ttl is not None:
+        _intraday_ttl = intraday_ttl
+
+
+def _cached(key, load, io, params: dict) -> DataFrame:
+    """과거 일자의 결과는 디스크 캐시와 같은 기준으로, 오늘 이후를 포함하는
+    결과는 _intraday_ttl 동안만 메모리에 캐싱한다.
+    """
+    today = datetime.date.today().strftime("%Y%m%d")
+    if max(str(v).replace("-", "") for v in params.values()) >= today:
+        if _intraday_ttl <= 0:
+            return load()
+        return _snapshot_cache.get(key, load, _intraday_ttl)
+    return _snapshot_cache.get(key, load, io._cache_ttl(params))
+
+
+def clear_snapshot_cache():
+    """전종목시세/개별종목시세 메모리 캐시를 비운다."""
+    _snapshot_cache.clear()
+
+
+def get_snapshot_cache_stats() -> dict:
+    """전종목시세/개별종목시세 메모리 캐시의 적중/실패 횟수와 저장된 항목 수,
+    크기
+    """
+    return _snapshot_cache.stats()
+
+
+@dataframe_empty_handler
+def get_market_snapshot(date: str, market: str = "KOSPI") -> DataFrame:
+    """특정 일자의 전종목시세 전체 컬럼
+
+    일자/시장별로 한 번만 조회해서 메모리에 캐싱한다. OHLCV, 시가총액,
+    티커 목록 조회는 모두 이 결과에서 필요한 컬럼만 복사해서 만든다.
+    반환된 DataFrame은 캐시와 공유되므로 수정하지 않아야 한다. 오늘의
+    (장중) 시세는 기본적으로 캐싱하지 않는다 (configure_snapshot_cache 참고).
+
+    Args:
+        date   (str): 조회 일자 (YYYYMMDD)
+        market (str): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+    Returns:
+        DataFrame:
+                      종목명   시가   고가   저가   종가   거래량  ...  상장주식수
+            티커
+            060310        3S   2150   2390   2150   2190   981348  ...   44802511
+            095570  AJ네트웍스   3135   3200   3100   3130    89871  ...   46822295
+    """
+    market2mktid = {
+        "ALL": "ALL",
+        "KOSPI": "STK",
+        "KOSDAQ": "KSQ",
+        "KONEX": "KNX"
+    }
+    mktid = market2mktid[market]
+
+    def _load():
+        df = 전종목시세().fetch(date, mktid)
+        return 전종목시세.schema.parse(df)
+
+    return _cached(("전종목시세", date, mktid), _load, 전종목시세,
+                   {'trdDd': date})
+
+
 # -----------------------------------------------------------------------------
 # stock
+@dataframe_empty_handler
+def get_market_history_by_date(fromdate: str, todate: str, ticker: str,
+                               adjusted: bool = True) -> DataFrame:
+    """일자별로 정렬된 특정 종목의 개별종목시세 전체 컬럼
+    (OHLCV, 등락률, 시가총액, 상장주식수)
+
+    종목/기간별로 한 번만 조회해서 메모리에 캐싱한다. 같은 기간의
+    get_market_ohlcv_by_date와 get_market_cap_by_date는 이 결과에서 필요한
+    컬럼만 복사해서 만든다. 반환된 DataFrame은 캐시와 공유되므로 수정하지
+    않아야 한다. 오늘을 포함하는 기간은 기본적으로 캐싱하지 않는다.
+
+    Args:
+        fromdate    (str): 조회 시작 일자 (YYYYMMDD)
+        todate      (str): 조회 종료 일자 (YYYYMMDD)
+        ticker      (str): 조회 종목의 ticker
+        adjusted    (bool, optional): 수정 종가 여부 (True/False)
+
+    Returns:
+        DataFrame:
+
+        >> get_market_history_by_date("20150720", "20150721", "005930")
+
+                           시가     고가     저가     종가  거래량      거래대금    등락률         시가총액 상장주식수
+            날짜
+            2015-07-20  1291000  1304000  1273000  1275000  128928  165366199000 -2.300781  187806654675000  147299337
+            2015-07-21  1275000  1277000  1247000  1263000  194055  244129106000 -0.939941  186039062631000  147299337
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    isin = get_stock_ticker_isin(ticker)
+    adjusted = 2 if adjusted else 1
+
+    def _load():
+        df = 개별종목시세().fetch(fromdate, todate, isin, adjusted)
+        return 개별종목시세.schema.parse(df).sort_index()
+
+    key = ("개별종목시세", isin, fromdate, todate, adjusted)
+    return _cached(key, _load, 개별종목시세, {'endDd': todate})
+
+
 @dataframe_empty_handler
 def get_market_ohlcv_by_date(fromdate: str, todate: str, ticker: str,
                              adjusted: bool = True) -> DataFrame:
@@ -47,23 +175,9 @@ def get_market_ohlcv_by_date(fromdate: str, todate: str, ticker: str,
             2015-07-23  1244000  1253000  1234000  1234000  208965  259446564000 -1.519531
     """  # pylint: disable=line-too-long # noqa: E501
 
-    isin = get_stock_ticker_isin(ticker)
-    adjusted = 2 if adjusted else 1
-    df = 개별종목시세().fetch(fromdate, todate, isin, adjusted)
-
-    df = df[['TRD_DD', 'TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC', 'TDD_CLSPRC',
-             'ACC_TRDVOL', 'ACC_TRDVAL', 'FLUC_RT']]
-    df.columns = ['날짜', '시가', '고가', '저가', '종가', '거래량', '거래대금',
-                  '등락률']
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0')
-    df = df.astype({"시가": np.int32, "고가": np.int32, "저가": np.int32,
-                    "종가": np.int32, "거래량": np.int32, "거래대금": np.int64,
-                    "등락률": np.float32})
-    return df.sort_index()
+    df = get_market_history_by_date(fromdate, todate, ticker, adjusted)
+    return df[['시가', '고가', '저가', '종가', '거래량', '거래대금', '등락률']] \
+        .astype({'거래량': np.int32})
 
 
 @dataframe_empty_handler
@@ -85,32 +199,9 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             265520  22150  23100  22050  22400  255846  5798313650
     """
 
-    market2mktid = {
-        "ALL": "ALL",
-        "KOSPI": "STK",
-        "KOSDAQ": "KSQ",
-        "KONEX": "KNX"
-    }
-
-    df = 전종목시세().fetch(date, market2mktid[market])
-    df = df[['ISU_SRT_CD', 'TDD_OPNPRC', 'TDD_HGPRC', 'TDD_LWPRC',
-             'TDD_CLSPRC', 'ACC_TRDVOL', 'ACC_TRDVAL', 'FLUC_RT']]
-    df.columns = ['티커', '시가', '고가', '저가', '종가', '거래량', '거래대금',
-                  '등락률']
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0')
-    df = df.set_index('티커')
-    df = df.astype({
-        "시가": np.int32,
-        "고가": np.int32,
-        "저가": np.int32,
-        "종가": np.int32,
-        "거래량": np.int32,
-        "거래대금": np.int64,
-        "등락률": np.float32
-    })
-    return df
+    df = get_market_snapshot(date, market)
+    return df[['시가', '고가', '저가', '종가', '거래량', '거래대금', '등락률']] \
+        .astype({'거래량': np.int32})
 
 
 @dataframe_empty_handler
@@ -134,18 +225,8 @@ def get_market_cap_by_date(fromdate: str, todate: str, ticker: str,
             2015-07-24  181030885173000  196584  241383636000  147299337
     """
 
-    isin = get_stock_ticker_isin(ticker)
-    adjusted = 2 if adjusted else 1
-    df = 개별종목시세().fetch(fromdate, todate, isin, adjusted)
-    df = df[['TRD_DD', 'MKTCAP', 'ACC_TRDVOL', 'ACC_TRDVAL', 'LIST_SHRS']]
-    df.columns = ['날짜', '시가총액', '거래량', '거래대금', '상장주식수']
-
-    df = df.replace('/', '', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.set_index('날짜')
-    df = df.astype(np.int64)
-    df.index = pd.to_datetime(df.index, format='%Y%m%d')
-    return df.sort_index()
+    df = get_market_history_by_date(fromdate, todate, ticker, adjusted)
+    return df[['시가총액', '거래량', '거래대금', '상장주식수']].copy()
 
 
 @dataframe_empty_handler
@@ -170,23 +251,9 @@ def get_market_cap_by_ticker(date: str, market: str = "KOSPI",
             068270  316000   42640845660000    918369   42640845660000   134939385
     """  # pylint: disable=line-too-long # noqa: E501
 
-    market2mktid = {
-        "ALL": "ALL",
-        "KOSPI": "STK",
-        "KOSDAQ": "KSQ",
-        "KONEX": "KNX"
-    }
-
-    df = 전종목시세().fetch(date, market2mktid[market])
-    df = df[['ISU_SRT_CD', 'TDD_CLSPRC', 'MKTCAP', 'ACC_TRDVOL', 'ACC_TRDVAL',
-             'LIST_SHRS']]
-    df.columns = ['티커', '종가', '시가총액', '거래량', '거래대금',
-                  '상장주식수']
-
-    df = df.set_index('티커')
-    df = df.replace(r'\W', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype(np.int64)
+    df = get_market_snapshot(date, market)
+    df = df[['종가', '시가총액', '거래량', '거래대금', '상장주식수']] \
+        .astype({'종가': np.int64})
     return df.sort_values('시가총액', ascending=ascending)
 
 
@@ -217,23 +284,7 @@ def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") \
         "KONEX": "KNX"
     }
     df = PER_PBR_배당수익률_전종목().fetch(date, market2mktid[market])
-
-    df = df[['ISU_SRT_CD', 'BPS', 'PER', 'PBR', 'EPS', 'DVD_YLD', 'DPS']]
-    df.columns = ['티커', 'BPS', 'PER', 'PBR', 'EPS', 'DIV', 'DPS']
-    df.set_index('티커', inplace=True)
-
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
-        "BPS": np.int32,
-        "PER": np.float64,
-        "PBR": np.float64,
-        "EPS": np.int32,
-        "DIV": np.float64,
-        "DPS": np.int32
-    })
-    return df
+    return PER_PBR_배당수익률_전종목.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -261,20 +312,7 @@ def get_market_fundamental_by_date(fromdate: str, todate: str, ticker: str) \
     # market = get_stock_ticekr_market(ticker)
 
     df = PER_PBR_배당수익률_개별().fetch(fromdate, todate, "ALL", isin)
-
-    df = df[['TRD_DD', 'BPS', 'PER', 'PBR', 'EPS', 'DVD_YLD', 'DPS']]
-    df.columns = ['날짜', 'BPS', 'PER', 'PBR', 'EPS', 'DIV', 'DPS']
-
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('/', '', regex=True)
-    df = df.replace('', '0', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({"BPS": np.int32, "PER": np.float64,
-                    "PBR": np.float32, "EPS": np.int32, "DIV": np.float32,
-                    "DPS": np.int32}, )
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y%m%d')
-    return df.sort_index()
+    return PER_PBR_배당수익률_개별.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -297,18 +335,7 @@ def get_market_ticker_and_name(date: str, market: str = "KOSPI") -> Series:
             282330    BGF리테일
     """
 
-    market2code = {
-        "ALL": "ALL",
-        "KOSPI": "STK",
-        "KOSDAQ": "KSQ",
-        "KONEX": "KNX"
-    }
-
-    df = 전종목시세().fetch(date, market2code[market])
-    df = df[['ISU_SRT_CD', 'ISU_ABBRV']]
-    df.columns = ['티커', '종목명']
-    df = df.set_index('티커')
-    return df['종목명']
+    return get_market_snapshot(date, market)['종목명'].copy()
 
 
 @dataframe_empty_handler
@@ -336,24 +363,7 @@ def get_market_price_change_by_ticker(fromdate: str, todate: str,
     adjusted = 2 if adjusted else 1
 
     df = 전종목등락률().fetch(fromdate, todate, market2mktid[market], adjusted)
-    df = df[['ISU_ABBRV', 'ISU_SRT_CD', 'BAS_PRC', 'TDD_CLSPRC',
-             'CMPPREVDD_PRC', 'FLUC_RT', 'ACC_TRDVOL', 'ACC_TRDVAL']]
-    df.columns = ['종목명', '티커', '시가', '종가', '변동폭',
-                  '등락률', '거래량', '거래대금']
-    df = df.set_index('티커')
-
-    df = df.replace(r'[^-.\w]', '', regex=True)
-    df = df.replace(r'\-$', '', regex=True)
-    df = df.replace('', '0')
-    df = df.astype({
-        "시가": np.int32,
-        "종가": np.int32,
-        "변동폭": np.int32,
-        "등락률": np.float64,
-        "거래량": np.int64,
-        "거래대금": np.int64
-    })
-    return df
+    return 전종목등락률.schema.parse(df)
 
 
 def get_exhaustion_rates_of_foreign_investment_by_date(
@@ -379,25 +389,7 @@ def get_exhaustion_rates_of_foreign_investment_by_date(
     isin = get_stock_ticker_isin(ticker)
 
     df = 외국인보유량_개별추이().fetch(fromdate, todate, isin)
-
-    df = df[['TRD_DD', 'LIST_SHRS', 'FORN_HD_QTY', 'FORN_SHR_RT',
-             'FORN_ORD_LMT_QTY', 'FORN_LMT_EXHST_RT']]
-    df.columns = ['날짜', '상장주식수', '보유수량', '지분율', '한도수량',
-                  '한도소진률']
-
-    df = df.replace('/', '', regex=True)
-    df = df.replace('', '0', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
-        "상장주식수": np.int64,
-        "보유수량": np.int64,
-        "지분율": np.float16,
-        "한도수량": np.int64,
-        "한도소진률": np.float16
-    })
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y%m%d')
-    return df.sort_index()
+    return 외국인보유량_개별추이.schema.parse(df).sort_index()
 
 
 def get_exhaustion_rates_of_foreign_investment_by_ticker(
@@ -431,22 +423,7 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
 
     balance_limit = 1 if balance_limit else 0
     df = 외국인보유량_전종목().fetch(date, market2mktid[market], balance_limit)
-
-    df = df[['ISU_SRT_CD', 'LIST_SHRS', 'FORN_HD_QTY', 'FORN_SHR_RT',
-             'FORN_ORD_LMT_QTY', 'FORN_LMT_EXHST_RT']]
-    df.columns = ['티커', '상장주식수', '보유수량', '지분율', '한도수량',
-                  '한도소진률']
-    df = df.replace('', '0', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
-        "상장주식수": np.int64,
-        "보유수량": np.int64,
-        "지분율": np.float16,
-        "한도수량": np.int64,
-        "한도소진률": np.float16
-    })
-    df = df.set_index('티커')
-    return df.sort_index()
+    return 외국인보유량_전종목.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -489,9 +466,7 @@ def get_market_trading_value_and_volume_on_ticker_by_investor(
     df.index.name = '투자자구분'
     df.columns = pd.MultiIndex.from_product([['거래량', '거래대금'],
                                              ['매도', '매수', '순매수']])
-    df = df.replace(r'[^-\w]', '', regex=True)
-    df = df.replace('', '0')
-    return df.astype(np.int64)
+    return parse_frame(df, np.int64)
 
 
 @dataframe_empty_handler
@@ -562,9 +537,7 @@ def get_market_trading_value_and_volume_on_market_by_investor(
     df.index.name = '투자자구분'
     df.columns = pd.MultiIndex.from_product([['거래량', '거래대금'],
                                              ['매도', '매수', '순매수']])
-    df = df.replace(r'[^-\w]', '', regex=True)
-    df = df.replace('', '0')
-    return df.astype(np.int64)
+    return parse_frame(df, np.int64)
 
 
 @dataframe_empty_handler
@@ -607,25 +580,12 @@ def get_market_trading_value_and_volume_on_market_by_date(
     }
 
     if detail_view:
-        df = 투자자별_거래실적_전체시장_일별추이_상세().fetch(
-            fromdate, todate, market2mktid[market], etf, etn, elw, option_a,
-            option_b)
-        df.columns = ['날짜', '금융투자', '보험', '투신', '사모', '은행',
-                      '기타금융', '연기금', '기타법인', '개인', '외국인',
-                      '기타외국인', '전체']
+        core = 투자자별_거래실적_전체시장_일별추이_상세
     else:
-        df = 투자자별_거래실적_전체시장_일별추이_일반().fetch(
-            fromdate, todate, market2mktid[market], etf, etn, elw, option_a,
-            option_b)
-        df.columns = ['날짜', '기관합계', '기타법인', '개인', '외국인합계',
-                      '전체']
-
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    df = df.replace(r'[^-\w]', '', regex=True)
-    df = df.replace('', '0')
-    df = df.astype(np.int64)
-    return df.sort_index()
+        core = 투자자별_거래실적_전체시장_일별추이_일반
+    df = core().fetch(fromdate, todate, market2mktid[market], etf, etn, elw,
+                      option_a, option_b)
+    return core.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -656,23 +616,11 @@ def get_market_trading_value_and_volume_on_ticker_by_date(
     option_b = {"매도": 1, "매수": 2, "순매수": 3}.get(option_b, 3)
 
     if detail_view:
-        df = 투자자별_거래실적_개별종목_일별추이_상세().fetch(
-            fromdate, todate, isin, option_a, option_b)
-        df.columns = ['날짜', '금융투자', '보험', '투신', '사모', '은행',
-                      '기타금융', '연기금', '기타법인', '개인', '외국인',
-                      '기타외국인', '전체']
+        core = 투자자별_거래실적_개별종목_일별추이_상세
     else:
-        df = 투자자별_거래실적_개별종목_일별추이_일반().fetch(
-            fromdate, todate, isin, option_a, option_b)
-        df.columns = ['날짜', '기관합계', '기타법인', '개인', '외국인합계',
-                      '전체']
-
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    df = df.replace(r'[^-\w]', '', regex=True)
-    df = df.replace('', '0')
-    df = df.astype(np.int64)
-    return df.sort_index()
+        core = 투자자별_거래실적_개별종목_일별추이_일반
+    df = core().fetch(fromdate, todate, isin, option_a, option_b)
+    return core.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -738,9 +686,7 @@ def get_market_net_purchases_of_equities_by_ticker(
 
     df.columns = ['티커', '종목명', '매도거래량', '매수거래량', '순매수거래량',
                   '매도거래대금', '매수거래대금', '순매수거래대금']
-    df = df.replace('/', '', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
+    df = parse_frame(df, {
         '티커': str, '종목명': str, '매수거래량': np.int32,
         '매도거래량': np.int32, '순매수거래량': np.int32,
         '매수거래대금': np.int64, '매도거래대금': np.int64,
@@ -776,21 +722,7 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
         "KOSDAQ": "KSQ",
     }
     df = 업종분류현황().fetch(date, market2mktid[market])
-
-    df = df[["ISU_SRT_CD", "ISU_ABBRV", "IDX_IND_NM", "TDD_CLSPRC",
-             "CMPPREVDD_PRC", "FLUC_RT", "MKTCAP"]]
-    df.columns = ["종목코드", "종목명", "업종명", "종가", "대비", "등락률",
-                  "시가총액"]
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0', regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.astype({
-        "종가": np.int32,
-        "대비": np.float64,
-        "등락률": np.float64,
-        "시가총액": np.int64
-    })
-    return df.set_index("종목코드")
+    return 업종분류현황.schema.parse(df)
 
 
 # -----------------------------------------------------------------------------
@@ -817,28 +749,7 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) \
     """  # pylint: disable=line-too-long # noqa: E501
 
     df = 개별지수시세().fetch(ticker[1:], ticker[0], fromdate, todate)
-    df = df[['TRD_DD', 'OPNPRC_IDX', 'HGPRC_IDX', 'LWPRC_IDX',
-             'CLSPRC_IDX', 'ACC_TRDVOL', 'ACC_TRDVAL', 'MKTCAP']]
-    df.columns = [
-        '날짜', '시가', '고가', '저가', '종가', '거래량', '거래대금',
-        '상장시가총액'
-    ]
-
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0')
-    df = df.set_index('날짜')
-    df = df.astype({
-        '시가': np.float64,
-        '고가': np.float64,
-        '저가': np.float64,
-        '종가': np.float64,
-        '거래량': np.int64,
-        '거래대금': np.int64,
-        '상장시가총액': np.int64
-    })
-    df.index = pd.to_datetime(df.index, format='%Y%m%d')
-    return df.sort_index()
+    return 개별지수시세.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -870,24 +781,7 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
         "테마": "04"
     }
     df = 전체지수시세().fetch(date, market2idx[market])
-    df = df[['IDX_NM', 'OPNPRC_IDX', 'HGPRC_IDX', 'LWPRC_IDX',
-             'CLSPRC_IDX', 'ACC_TRDVOL', 'ACC_TRDVAL', 'MKTCAP']]
-    df.columns = ['지수명', '시가', '고가', '저가', '종가', '거래량',
-                  '거래대금', '상장시가총액']
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace(r'\-$', '0', regex=True)
-    df = df.replace('', '0')
-    df = df.set_index('지수명')
-    df = df.astype({
-        '시가': np.float64,
-        '고가': np.float64,
-        '저가': np.float64,
-        '종가': np.float64,
-        '거래량': np.int64,
-        '거래대금': np.int64,
-        '상장시가총액': np.int64
-    })
-    return df
+    return 전체지수시세.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -915,17 +809,8 @@ def get_index_listing_date(market: str = "KOSPI") -> DataFrame:
         "테마": "04"
     }
     df = 전체지수기본정보().fetch(market2idx[market])
-    df = df[['IDX_NM', 'BAS_TM_CONTN', 'ANNC_TM_CONTN', 'BAS_IDX_CONTN',
-             'COMPST_ISU_CNT']]
-    df.columns = ['지수명', '기준시점', '발표시점', '기준지수', '종목수']
-    df = df.set_index('지수명')
-    df = df.replace(',', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "기준지수": np.float64,
-        "종목수": np.int16
-    })
-    return df
+    return 전체지수기본정보.schema.parse(
+        df, ['기준시점', '발표시점', '기준지수', '종목수'])
 
 
 @dataframe_empty_handler
@@ -959,21 +844,7 @@ def get_index_price_change_by_ticker(fromdate: str, todate: str, market: str) \
         "테마": "04"
     }
     df = 전체지수등락률().fetch(fromdate, todate, market2idx[market])
-    df = df[['IDX_IND_NM', 'OPN_DD_INDX', 'END_DD_INDX', 'FLUC_RT',
-             'ACC_TRDVOL', 'ACC_TRDVAL']]
-    df.columns = ['지수명', '시가', '종가', '등락률', '거래량', '거래대금']
-    df = df.set_index('지수명')
-    df = df.replace(r'[^\w\.-]', '', regex=True)
-    df = df.replace('', 0)
-    df = df.replace('-', 0)
-    df = df.astype({
-        "시가": np.float64,
-        "종가": np.float64,
-        "등락률": np.float16,
-        "거래량": np.int64,
-        "거래대금": np.int64
-    })
-    return df
+    return 전체지수등락률.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -1007,23 +878,7 @@ def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") \
         "테마": "04"
     }
     df = PER_PBR_배당수익률_전지수().fetch(date, market2idx[market])
-    df = df[['IDX_NM', 'CLSPRC_IDX', 'FLUC_RT', 'WT_PER', 'FWD_PER',
-             'WT_STKPRC_NETASST_RTO', 'DIV_YD']]
-    df.columns = ['지수명', '종가', '등락률', 'PER', '선행PER', 'PBR',
-                  '배당수익률']
-    df = df.set_index('지수명')
-    df = df.replace('^-$', 0, regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "종가": np.float64,
-        "등락률": np.float64,
-        "PER": np.float32,
-        "선행PER": np.float32,
-        "PBR": np.float32,
-        "배당수익률": np.float32
-    })
-    return df
+    return PER_PBR_배당수익률_전지수.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -1052,24 +907,7 @@ def get_index_fundamental_by_date(fromdate: str, todate: str, ticker: str) \
 
     df = PER_PBR_배당수익률_개별지수().fetch(
         fromdate, todate, ticker[0], ticker[1:])
-    df = df[['TRD_DD', 'CLSPRC_IDX', 'FLUC_RT', 'WT_PER',
-             'FWD_PER', 'WT_STKPRC_NETASST_RTO', 'DIV_YD']]
-    df.columns = ['날짜', '종가', '등락률', 'PER', '선행PER', 'PBR',
-                  '배당수익률']
-    df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index)
-    df = df.replace('^-$', 0, regex=True)
-    df = df.replace(',', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "종가": np.float64,
-        "등락률": np.float64,
-        "PER": np.float32,
-        "선행PER": np.float32,
-        "PBR": np.float32,
-        "배당수익률": np.float32
-    })
-    return df.sort_index()
+    return PER_PBR_배당수익률_개별지수.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -1112,16 +950,14 @@ def get_shorting_status_by_date(fromdate, todate, ticker):
              'CVSRTSELL_TRDVAL', 'STR_CONST_VAL2']]
     df.columns = ['날짜', '거래량', '잔고수량', '거래대금', '잔고금액']
     df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
+    df.index = parse_date(df.index)
 
     # '-'는 데이터가 집계되지 않은 것을 의미한다.
     # 최근 2일 간의 데이터 ([:2])에서 '-'가 하나는 행의 갯수를 계산함
     idx = (df.iloc[:2] == '-').any(axis=1).sum()
     df = df.iloc[idx:]
 
-    df = df.replace(r'\D', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
+    df = parse_frame(df, {
         "거래량": np.int32,
         "잔고수량": np.int32,
         "거래대금": np.int64,
@@ -1164,8 +1000,7 @@ def get_shorting_trading_value_and_volume_by_date(
              'ACC_TRDVAL', 'TRDVAL_WT']]
     df.columns = pd.MultiIndex.from_product([['거래량', '거래대금'],
                                              ['공매도', '매수', '비중']])
-    df = df.replace(r'[^-\w\.]', '', regex=True).replace('', '0')
-    df = df.astype({
+    df = parse_frame(df, {
         ("거래량", "공매도"): np.int64,
         ("거래량", "매수"): np.int64,
         ("거래량", "비중"): np.float32,
@@ -1173,7 +1008,7 @@ def get_shorting_trading_value_and_volume_by_date(
         ("거래대금", "매수"): np.int64,
         ("거래대금", "비중"): np.float32
     })
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
+    df.index = parse_date(df.index)
     return df.sort_index()
 
 
@@ -1221,8 +1056,7 @@ def get_shorting_trading_value_and_volume_by_ticker(
              'ACC_TRDVAL', 'TRDVAL_WT']]
     df.columns = pd.MultiIndex.from_product([['거래량', '거래대금'],
                                              ['공매도', '매수', '비중']])
-    df = df.replace(r'[^-\w\.]', '', regex=True).replace('', '0')
-    df = df.astype({
+    df = parse_frame(df, {
         ("거래량", "공매도"): np.int64,
         ("거래량", "매수"): np.int64,
         ("거래량", "비중"): np.float32,
@@ -1284,11 +1118,9 @@ def get_shorting_investor_by_date(fromdate: str, todate: str,
         fromdate, todate, inquery2idx[inquery], market2idx[market])
 
     df.columns = ['날짜', '기관', '개인', '외국인', '기타', '합계']
-    df = df.replace(r'[^\w\.]', '', regex=True)
-    df = df.replace('', 0)
     df = df.set_index('날짜')
-    df.index = pd.to_datetime(df.index, format='%Y%m%d')
-    return df.astype(np.int64).sort_index()
+    df.index = parse_date(df.index)
+    return parse_frame(df, np.int64).sort_index()
 
 
 @dataframe_empty_handler
@@ -1319,29 +1151,7 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
         "KONEX": 3
     }
     df = 공매도_거래상위_50종목().fetch(date, market2idx[market])
-
-    df = df[["RANK", "ISU_CD", "CVSRTSELL_TRDVAL", "ACC_TRDVAL",
-             "TDD_SRTSELL_WT", "STR_CONST_VAL1", "STR_CONST_VAL2",
-             "VALU_PD_AVG_SRTSELL_WT", "VALU_PD_CMP_TDD_SRTSELL_RTO",
-             "PRC_YD"]]
-    df.columns = ['순위', '티커', '공매도거래대금', '총거래대금', '공매도비중',
-                  '직전40일거래대금평균', '공매도거래대금증가율',
-                  '직전40일공매도평균비중', '공매도비중증가율', '주가수익률']
-    df = df.set_index('티커')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "순위": np.int32,
-        "공매도거래대금": np.int64,
-        "총거래대금": np.int64,
-        "직전40일거래대금평균": np.int64,
-        "공매도비중": np.float64,
-        "공매도거래대금증가율": np.float64,
-        "직전40일공매도평균비중": np.float64,
-        "공매도비중증가율": np.float64,
-        "주가수익률": np.float64
-    })
-    return df
+    return 공매도_거래상위_50종목.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -1373,23 +1183,7 @@ def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
         "KONEX": 3
     }
     df = 공매도_잔고상위_50종목().fetch(date, market2idx[market])
-
-    df = df[["RANK", "ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP",
-             "BAL_RTO"]]
-    df.columns = ['순위', '티커', '공매도잔고', '상장주식수', '공매도금액',
-                  '시가총액', '비중']
-    df = df.set_index('티커')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "순위": np.int32,
-        "공매도잔고": np.int64,
-        "상장주식수": np.int64,
-        "공매도금액": np.int64,
-        "시가총액": np.float64,
-        "비중": np.float16
-    })
-    return df
+    return 공매도_잔고상위_50종목.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -1421,21 +1215,7 @@ def get_shorting_balance_by_ticker(date: str, market: str) -> DataFrame:
         "KONEX": 3
     }
     df = 전종목_공매도_잔고().fetch(date, market2idx[market])
-
-    df = df[["ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
-    df.columns = ['티커', '공매도잔고', '상장주식수', '공매도금액',
-                  '시가총액', '비중']
-    df = df.set_index('티커')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace('', 0)
-    df = df.astype({
-        "공매도잔고": np.int64,
-        "상장주식수": np.int64,
-        "공매도금액": np.int64,
-        "시가총액": np.float64,
-        "비중": np.float16
-    })
-    return df
+    return 전종목_공매도_잔고.schema.parse(df)
 
 
 @dataframe_empty_handler
@@ -1465,23 +1245,7 @@ def get_shorting_balance_by_date(fromdate: str, todate: str, ticker: str) \
 
     isin = get_stock_ticker_isin(ticker)
     df = 개별종목_공매도_잔고().fetch(fromdate, todate, isin)
-
-    df = df[["RPT_DUTY_OCCR_DD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP",
-             "BAL_RTO"]]
-    df.columns = ['날짜', '공매도잔고', '상장주식수', '공매도금액', '시가총액',
-                  '비중']
-    df = df.set_index('날짜')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df = df.replace('', 0)
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    df = df.astype({
-        "공매도잔고": np.int64,
-        "상장주식수": np.int64,
-        "공매도금액": np.int64,
-        "시가총액": np.float64,
-        "비중": np.float32
-    })
-    return df.sort_index()
+    return 개별종목_공매도_잔고.schema.parse(df).sort_index()
 
 
 @dataframe_empty_handler
@@ -1505,12 +1269,13 @@ def get_stock_major_changes(ticker: str) -> DataFrame:
                   '업종변경후', '액면변경전', '액면변경후', '대표이사변경전',
                   '대표이사변경후']
     df = df.set_index('날짜')
-    df = df.replace(r'[^-\w\.]', '', regex=True)
-    df[['액면변경전', '액면변경후']] = df[['액면변경전', '액면변경후']] \
-        .replace('', 0)
-    df = df.replace('', '-')
-    df.index = pd.to_datetime(df.index, format='%Y/%m/%d')
-    df = df.astype({"액면변경전": np.int16})
+    df = parse_frame(df, {"액면변경전": np.int16, "액면변경후": np.int16})
+    # 문자열 컬럼만 기호를 제거하고, 변동이 없는 값은 '-'로 표시한다.
+    for column in ['상호변경전', '상호변경후', '업종변경전', '업종변경후',
+                   '대표이사변경전', '대표이사변경후']:
+        s = df[column].astype(str).str.replace(r'[^-\w\.]', '', regex=True)
+        df[column] = s.mask(s == '', '-')
+    df.index = parse_date(df.index)
     return df.sort_index()
 
 
@@ -0,0 +1,184 @@
+"""KRX 조회(bld)별 응답 스키마
+
+KrxWebIo 하위 클래스에 schema를 선언하면 클래스가 정의될 때(import 시점)
+한 번 검증되어 bld별로 등록된다. wrap 함수는 컬럼 선택, 이름 변경, 타입
+변환, 인덱스 지정을 Schema.parse 하나로 처리한다.
+
+    class 전종목시세(KrxWebIo):
+        schema = Schema("OutBlock_1", {
+            "ISU_SRT_CD": ("티커", str),
+            "TDD_CLSPRC": ("종가", np.int32),
+        }, index="티커")
+"""
+from pandas import DataFrame
+from pykrx.website.comm.parser import parse_frame
+from operator import itemgetter
+import numpy as np
+
+
+def _kind(dtype) -> str:
+    try:
+        return np.dtype(dtype).kind
+    except TypeError:
+        return "?"
+
+
+class Schema:
+    """KRX 응답 블록 하나의 구조
+
+    Args:
+        block  (str): 응답 JSON에서 데이터가 담긴 키 (output, OutBlock_1, ...)
+        fields (dict): {KRX 필드: (컬럼명, 타입)}. 타입은 str (문자열 그대로),
+                       "datetime" (날짜) 또는 numpy 숫자 타입
+        index  (str, optional): 인덱스로 사용할 컬럼명
+
+    Raises:
+        ValueError: 스키마가 잘못 정의된 경우
+    """
+
+    def __init__(self, block: str, fields: dict, index: str = None):
+        if not isinstance(block, str) or len(block) == 0:
+            raise ValueError(f"invalid block key: {block!r}")
+        if len(fields) == 0:
+            raise ValueError("schema has no fields")
+
+        names, dtypes = [], {}
+        for field, (name, dtype) in fields.items():
+            if name in dtypes:
+                raise ValueError(f"duplicated column name: {name}")
+            if dtype is not str and dtype != "datetime" and \
+                    _kind(dtype) not in "iuf":
+                raise ValueError(f"unsupported dtype for {field}: {dtype!r}")
+            names.append(name)
+            dtypes[name] = dtype
+        if index is not None and index not in dtypes:
+            raise ValueError(f"index {index!r} is not a column")
+
+        self.bld = None
+        self.block = block
+        self.fields = list(fields)
+        self.names = names
+        self.rename = dict(zip(self.fields, names))
+        # 행(dict)에서 필드 값들을 tuple로 꺼낸다.
+        if len(self.fields) == 1:
+            field = self.fields[0]
+            self._getter = lambda row: (row[field],)
+        else:
+            self._getter = itemgetter(*self.fields)
+        self.dtypes = dtypes
+        self.index = index
+        # KRX 필드 기준의 변환 타입 (문자열 필드 제외)
+        self._field_dtypes = {
+            field: dtypes[name] for field, name in self.rename.items()
+            if dtypes[name] is not str}
+
+    def __repr__(self):
+        return f"Schema({self.bld!r}, block={self.block!r}, " \
+               f"columns={self.names!r}, index={self.index!r})"
+
+    def frame(self, result: dict) -> DataFrame:
+        """응답 JSON의 데이터 블록에서 스키마의 필드만 컬럼 단위로 꺼내
+        DataFrame을 만든다. 나머지 필드는 DataFrame에 담지 않는다.
+
+        Args:
+            result (dict): KrxWebIo.read의 결과
+
+        Returns:
+            DataFrame: KRX 필드명을 컬럼으로 갖는 DataFrame. 데이터가 없으면
+                       빈 DataFrame
+        """
+        rows = result[self.block]
+        if len(rows) == 0:
+            return DataFrame()
+        try:
+            columns = zip(*map(self._getter, rows))
+            return DataFrame(dict(zip(self.fields, map(list, columns))))
+        except KeyError:
+            pass
+
+        # 일부 행에만 있는 필드는 빈 값으로 채운다.
+        data = {}
+        for field in self.fields:
+            if not any(field in row for row in rows):
+                raise KeyError(field)
+            data[field] = [row.get(field) for row in rows]
+        return DataFrame(data)
+
+    def chunk(self, result: dict) -> DataFrame:
+        """frame과 같지만 숫자와 날짜 필드를 스키마의 타입으로 변환해서
+        반환한다. 컬럼명은 KRX 필드명 그대로이며, 변환된 DataFrame에 parse를
+        다시 적용해도 된다.
+
+        Args:
+            result (dict): KrxWebIo.read의 결과 (구간 하나의 응답)
+
+        Returns:
+            DataFrame: 타입이 변환된 DataFrame. 데이터가 없으면 빈 DataFrame
+        """
+        df = self.frame(result)
+        if len(df) == 0:
+            return df
+        return parse_frame(df, self._field_dtypes)
+
+    def select(self, columns: list = None) -> list:
+        """columns (컬럼명)와 인덱스에 해당하는 KRX 필드 목록"""
+        if columns is None:
+            return self.fields
+        unknown = set(columns) - set(self.names)
+        if len(unknown) > 0:
+            raise KeyError(f"unknown columns: {sorted(unknown)}")
+        wanted = set(columns) | {self.index}
+        return [field for field, name in zip(self.fields, self.names)
+                if name in wanted]
+
+    def parse(self, df: DataFrame, columns: list = None,
+              dtypes: dict = None) -> DataFrame:
+        """fetch가 반환한 DataFrame을 스키마대로 변환
+
+        Args:
+            df      (DataFrame): KRX 필드명을 컬럼으로 갖는 DataFrame
+            columns (list, optional): 반환할 컬럼명. 입력하지 않으면 전체
+            dtypes  (dict, optional): 스키마와 다른 타입이 필요한 컬럼의 타입
+
+        Returns:
+            DataFrame: 컬럼명과 타입이 변환된 DataFrame
+        """
+        fields = self.select(columns)
+        names = [self.rename[field] for field in fields]
+        df = df[fields]
+        df.columns = names
+
+        targets = {name: self.dtypes[name] for name in names
+                   if self.dtypes[name] is not str}
+        targets.update(dtypes or {})
+        df = parse_frame(df, targets)
+        if self.index is not None:
+            df = df.set_index(self.index)
+        if columns is not None:
+            df = df[[c for c in columns if c != self.index]]
+        return df
+
+
+# {bld: Schema}
+_schemas = {}
+
+
+def register_schema(bld: str, schema: Schema):
+    """bld의 스키마를 등록한다. 다른 스키마가 이미 등록되어 있으면
+    ValueError가 발생한다.
+    """
+    registered = _schemas.get(bld)
+    if registered is not None and registered is not schema:
+        raise ValueError(f"schema for {bld} is already registered")
+    schema.bld = bld
+    _schemas[bld] = schema
+
+
+def get_schema(bld: str) -> Schema:
+    """등록된 스키마 (없으면 None)"""
+    return _schemas.get(bld)
+
+
+def get_schemas() -> dict:
+    """등록된 전체 스키마 {bld: Schema}"""
+    return dict(_schemas)
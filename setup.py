@@ -22,6 +22,7 @@ setup(
     long_description_content_type="text/markdown",
     install_requires=['requests', 'pandas', 'datetime', 'numpy', 'xlrd',
                       'deprecated', 'multipledispatch', 'matplotlib'],
+    extras_require={'aio': ['aiohttp'], 'orjson': ['orjson']},
     license='MIT',
     packages=find_packages(include=['pykrx', 'pykrx.*', 'pykrx.stock.*']),
     package_data={
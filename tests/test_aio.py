@@ -0,0 +1,74 @@
+import unittest
+import asyncio
+import json
+import time
+from unittest import mock
+from pykrx import aio
+from pykrx.website.comm.webio import AsyncPost
+from pykrx.website.comm.ratelimit import RequestScheduler
+from pykrx.website.krx.krxio import KrxWebIo, PendingRequests, deferred_requests
+# pylint: disable-all
+# flake8: noqa
+
+
+class _Sample(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01701"
+
+    def fetch(self, strtDd, endDd):
+        return self.read(strtDd=strtDd, endDd=endDd)
+
+
+class AioTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+        self.calls = []
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+
+    def _fake_read(self, delay=0.0):
+        async def read(io, **params):
+            self.calls.append(params)
+            await asyncio.sleep(delay)
+            rows = [{"TRD_DD": params['endDd']}, {"TRD_DD": params['strtDd']}]
+            return json.dumps({"output": rows}).encode()
+        return read
+
+    def test_deferred_raises_pending_requests(self):
+        with deferred_requests({}):
+            with self.assertRaises(PendingRequests) as cm:
+                _Sample().fetch("20000101", "20200101")
+        self.assertEqual(len(cm.exception.requests), 10)
+
+    def test_run_fetches_windows_concurrently(self):
+        with mock.patch.object(AsyncPost, "read", self._fake_read(0.2)):
+            start = time.monotonic()
+            result = asyncio.run(
+                aio.run(lambda: _Sample().fetch("20000101", "20200101")))
+            elapsed = time.monotonic() - start
+        self.assertEqual(len(result['output']), 20)
+        self.assertEqual(len(self.calls), 10)
+        self.assertLess(elapsed, 1.0)
+
+    def test_many_calls_from_one_loop(self):
+        async def main():
+            dates = [f"202101{d:02d}" for d in range(1, 29)]
+            return await asyncio.gather(
+                *(aio.run(_Sample().fetch, d, d) for d in dates),
+                *(aio.run(_Sample().fetch, d, d) for d in dates))
+
+        with mock.patch.object(AsyncPost, "read", self._fake_read(0.2)):
+            start = time.monotonic()
+            results = asyncio.run(main())
+            elapsed = time.monotonic() - start
+        self.assertEqual(len(results), 56)
+        # 같은 요청은 하나로 합쳐진다.
+        self.assertEqual(len(self.calls), 28)
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
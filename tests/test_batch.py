@@ -0,0 +1,153 @@
+import unittest
+import time
+import pandas as pd
+from unittest import mock
+from pykrx.stock import stock_api
+# pylint: disable-all
+# flake8: noqa
+
+
+def _fake_ohlcv(fromdate, todate, ticker, freq='d', adjusted=True):
+    time.sleep(0.1)
+    if ticker == "999999":
+        return pd.DataFrame()
+    if ticker == "000000":
+        raise ConnectionError("reset")
+    index = pd.to_datetime([fromdate, todate]).rename('날짜')
+    return pd.DataFrame({'시가': [1, 2], '종가': [3, int(ticker[-1])]},
+                        index=index)
+
+
+def _fake_isins(tickers):
+    return [None if t == "888888" else "KR7" + t for t in tickers]
+
+
+class MarketOhlcvBatchTest(unittest.TestCase):
+    def setUp(self):
+        patches = [mock.patch.object(stock_api, "get_market_ohlcv_by_date",
+                                     _fake_ohlcv),
+                   mock.patch.object(stock_api.krx, "get_stock_ticker_isins",
+                                     _fake_isins)]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_long_layout(self):
+        df = stock_api.get_market_ohlcv_batch(
+            "20210104", "20210105",
+            ["005930", "000660", "999999", "000000", "888888"])
+        self.assertEqual(df.index.names, ['티커', '날짜'])
+        self.assertEqual(len(df), 4)
+        self.assertEqual(df.loc["000660"]['종가'].iloc[-1], 0)
+        self.assertEqual(set(df.attrs['failed']),
+                         {"999999", "000000", "888888"})
+        self.assertEqual(df.attrs['failed']["888888"], "unknown ticker")
+        self.assertIn("ConnectionError", df.attrs['failed']["000000"])
+
+    def test_wide_layout(self):
+        df = stock_api.get_market_ohlcv_batch(
+            "20210104", "20210105", ["005930", "000660"], layout="wide")
+        self.assertEqual(df.columns.names, ['티커', '항목'])
+        self.assertEqual(df[("005930", '종가')].tolist(), [3, 0])
+        self.assertEqual(df.attrs['failed'], {})
+
+    def test_bounded_concurrency(self):
+        tickers = [f"{i:06d}" for i in range(1, 17)]
+        start = time.monotonic()
+        df = stock_api.get_market_ohlcv_batch(
+            "20210104", "20210105", tickers, max_workers=8)
+        elapsed = time.monotonic() - start
+        self.assertEqual(len(df), 32)
+        self.assertGreater(elapsed, 0.2)
+        self.assertLess(elapsed, 0.6)
+
+
+def _fake_snapshot(date, market="KOSPI", **kwargs):
+    time.sleep(0.1)
+    if date == "20210106":
+        raise ConnectionError("reset")
+    return pd.DataFrame({'종가': [int(date[-2:])]},
+                        index=pd.Index([market], name='티커'))
+
+
+class MarketSnapshotIterTest(unittest.TestCase):
+    def setUp(self):
+        days = pd.DatetimeIndex(
+            pd.to_datetime(["20210104", "20210105", "20210107", "20210108"]),
+            name='날짜')
+        patches = [mock.patch.object(stock_api, "get_market_cap_by_ticker",
+                                     _fake_snapshot),
+                   mock.patch.object(stock_api, "get_business_days_index",
+                                     lambda f, t: days)]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_yields_in_date_order(self):
+        items = list(stock_api.iter_market_snapshots(
+            "20210104", "20210108", "cap", "KOSDAQ", prefetch=2))
+        self.assertEqual([d.day for d, _ in items], [4, 5, 7, 8])
+        self.assertEqual([df['종가'].iloc[0] for _, df in items], [4, 5, 7, 8])
+        self.assertEqual(items[0][1].index[0], "KOSDAQ")
+
+    def test_prefetch_overlaps_requests(self):
+        start = time.monotonic()
+        for _ in stock_api.iter_market_snapshots(
+                "20210104", "20210108", "cap", prefetch=4):
+            pass
+        self.assertLess(time.monotonic() - start, 0.3)
+
+        start = time.monotonic()
+        for _ in stock_api.iter_market_snapshots(
+                "20210104", "20210108", "cap", prefetch=0):
+            pass
+        self.assertGreater(time.monotonic() - start, 0.35)
+
+    def test_prefetch_bounds_outstanding_snapshots(self):
+        import threading
+        lock = threading.Lock()
+        started, consumed, peak = [0], [0], [0]
+
+        def snapshot(date, market="KOSPI", **kwargs):
+            with lock:
+                started[0] += 1
+                peak[0] = max(peak[0], started[0] - consumed[0])
+            return pd.DataFrame({'종가': [1]})
+
+        days = pd.DatetimeIndex(pd.bdate_range("20210104", "20210129"))
+        with mock.patch.object(stock_api, "get_market_cap_by_ticker",
+                               snapshot), \
+                mock.patch.object(stock_api, "get_business_days_index",
+                                  lambda f, t: days):
+            for _ in stock_api.iter_market_snapshots(
+                    "20210104", "20210129", "cap", prefetch=2):
+                time.sleep(0.01)
+                with lock:
+                    consumed[0] += 1
+        self.assertEqual(started[0], len(days))
+        # 조회 중이거나 소비 중인 결과는 prefetch개를 넘지 않는다.
+        self.assertLessEqual(peak[0], 2)
+
+    def test_stop_early(self):
+        it = stock_api.iter_market_snapshots(
+            "20210104", "20210108", "cap", prefetch=1)
+        day, _ = next(it)
+        self.assertEqual(day.day, 4)
+        it.close()
+
+    def test_error_raised_at_its_date(self):
+        days = pd.DatetimeIndex(pd.to_datetime(["20210105", "20210106"]))
+        with mock.patch.object(stock_api, "get_business_days_index",
+                               lambda f, t: days):
+            it = stock_api.iter_market_snapshots(
+                "20210105", "20210106", "cap", prefetch=2)
+            self.assertEqual(next(it)[0].day, 5)
+            self.assertRaises(ConnectionError, next, it)
+
+    def test_unknown_kind(self):
+        it = stock_api.iter_market_snapshots("20210104", "20210108", "per")
+        self.assertRaises(ValueError, next, it)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import os
+import tempfile
+import time
+from unittest import mock
+from pykrx.website.comm.cache import DiskCache
+from pykrx.website.comm.webio import Post
+from pykrx.website.comm.ratelimit import RequestScheduler
+from pykrx.website.krx import krxio
+from pykrx.website.krx.krxio import KrxWebIo
+# pylint: disable-all
+# flake8: noqa
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_set(self):
+        cache = DiskCache(self.path)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", b'{"output": []}')
+        self.assertEqual(cache.get("a"), b'{"output": []}')
+        self.assertEqual(cache.stats()['hits'], 1)
+        cache.close()
+
+        # 파일에 영속적으로 저장된다.
+        cache = DiskCache(self.path)
+        self.assertEqual(cache.get("a"), b'{"output": []}')
+        cache.close()
+
+    def test_ttl(self):
+        cache = DiskCache(self.path)
+        cache.set("a", b"1", ttl=0.05)
+        cache.set("b", b"2")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), b"2")
+        cache.close()
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.path, max_bytes=3000)
+        for key in "abcd":
+            cache.set(key, os.urandom(1000))
+            time.sleep(0.01)
+            cache.get("a")
+        # 가장 오래 사용하지 않은 b가 삭제됨
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("d"))
+        self.assertLessEqual(cache.stats()['bytes'], 3000)
+        cache.close()
+
+    def test_size_is_tracked_across_replace_and_reopen(self):
+        cache = DiskCache(self.path, max_bytes=2500)
+        cache.set("a", os.urandom(1000))
+        for _ in range(5):
+            # 같은 키를 덮어쓰면 크기가 중복으로 더해지지 않는다.
+            cache.set("b", os.urandom(1000))
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertEqual(cache._bytes, cache.stats()['bytes'])
+        cache.close()
+
+        cache = DiskCache(self.path, max_bytes=2500)
+        cache.set("c", os.urandom(1000))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache._bytes, cache.stats()['bytes'])
+        cache.clear()
+        self.assertEqual(cache._bytes, 0)
+        cache.close()
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = payload.encode()
+
+    def json(self):
+        import json
+        return json.loads(self.content)
+
+
+class _Sample(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+    def fetch(self, trdDd):
+        return self.read(mktId="ALL", trdDd=trdDd)
+
+
+class KrxWebIoCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+        krxio.enable_cache(os.path.join(self.tmp.name, "cache.sqlite3"))
+        self.calls = 0
+
+        def read(io, **params):
+            self.calls += 1
+            return _Response('{"OutBlock_1": [{"TRD_DD": "%s"}]}' % params['trdDd'])
+        self.patch = mock.patch.object(Post, "read", read)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        krxio.disable_cache()
+        KrxWebIo.scheduler = self.scheduler
+        self.tmp.cleanup()
+
+    def test_past_date_is_not_fetched_again(self):
+        first = _Sample().fetch("20210104")
+        second = _Sample().fetch("20210104")
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+        _Sample().fetch("20210105")
+        self.assertEqual(self.calls, 2)
+
+    def test_ttl(self):
+        self.assertIsNone(KrxWebIo._cache_ttl({"trdDd": "20210104"}))
+        self.assertEqual(KrxWebIo._cache_ttl({"trdDd": "99991231"}), KrxWebIo.cache_ttl)
+        self.assertEqual(KrxWebIo._cache_ttl({"mktsel": "ALL"}), KrxWebIo.cache_ttl)
+
+    def test_recent_or_empty_results_expire(self):
+        import datetime
+        recent = datetime.date.today() - datetime.timedelta(days=2)
+        recent = recent.strftime("%Y%m%d")
+        # 공매도처럼 며칠 늦게 집계되는 데이터는 확정되기 전에 만료된다.
+        self.assertEqual(KrxWebIo._cache_ttl({"endDd": recent}), KrxWebIo.cache_ttl)
+        self.assertEqual(KrxWebIo._cache_ttl({"trdDd": "20210104"}, {"OutBlock_1": []}),
+                         KrxWebIo.cache_ttl)
+        self.assertEqual(KrxWebIo._cache_ttl({"trdDd": "20210104"}, {"error": "x"}),
+                         KrxWebIo.cache_ttl)
+        self.assertIsNone(KrxWebIo._cache_ttl({"trdDd": "20210104"},
+                                              {"OutBlock_1": [{"a": 1}]}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+import os
+import tempfile
+import shutil
+import datetime
+import pandas as pd
+from unittest import mock
+from pykrx.website import krx
+from pykrx.website.krx import calendar
+from pykrx.website.krx.calendar import TradingCalendar
+# pylint: disable-all
+# flake8: noqa
+
+# 2021-01-01(금) 신정, 2021-02-11 ~ 02-12 설날
+_HOLIDAYS = {"20210101", "20210211", "20210212"}
+
+
+def _fake_index(calls):
+    def get_index_ohlcv_by_date(fromdate, todate, ticker):
+        calls.append((fromdate, todate))
+        fromdate = max(fromdate, "20201201")
+        days = [d for d in pd.bdate_range(fromdate, todate)
+                if d.strftime("%Y%m%d") not in _HOLIDAYS]
+        return pd.DataFrame({'종가': range(len(days))},
+                            index=pd.DatetimeIndex(days, name='날짜'))
+    return get_index_ohlcv_by_date
+
+
+class _CalendarTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.calls = []
+        patches = [
+            mock.patch.dict(os.environ, {"PYKRX_CACHE_DIR": self.root}),
+            mock.patch.object(calendar, "get_index_ohlcv_by_date",
+                              _fake_index(self.calls)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        TradingCalendar._instance = None
+        self.addCleanup(setattr, TradingCalendar, "_instance", None)
+
+
+class TradingCalendarTest(_CalendarTestCase):
+    def test_queries_are_served_from_one_bulk_load(self):
+        cal = TradingCalendar()
+        self.assertEqual(cal.nearest("20210101"), "20201231")
+        self.assertEqual(cal.nearest("20210101", prev=False), "20210104")
+        self.assertEqual(cal.nearest("20210213"), "20210210")
+        self.assertEqual(cal.nearest("20210210", prev=False), "20210210")
+        self.assertTrue(cal.is_business_day("20210104"))
+        self.assertFalse(cal.is_business_day("2021-02-11"))
+        self.assertEqual(len(cal.business_days("20210201", "20210228")), 18)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_persisted_and_reused(self):
+        TradingCalendar().nearest("20210101")
+        self.assertTrue(os.path.exists(
+            os.path.join(self.root, "trading_days.json")))
+
+        TradingCalendar._instance = None
+        self.assertEqual(TradingCalendar().nearest("20210213"), "20210210")
+        self.assertEqual(len(self.calls), 1)
+
+    def test_incremental_refresh(self):
+        cal = TradingCalendar()
+        cal.nearest("20210101")
+        until = cal._until
+        cal.refresh(force=True)
+        # 저장된 마지막 날짜부터 다시 조회한다.
+        self.assertEqual(self.calls[-1][0], until)
+        self.assertEqual(len(cal._days), len(set(cal._days)))
+
+    def test_dates_after_today_are_served_from_calendar(self):
+        today = datetime.date.today()
+        last = pd.bdate_range(today - datetime.timedelta(days=7), today)[-1]
+        last = last.strftime("%Y%m%d")
+        cal = TradingCalendar()
+        for days in [1, 2, 30]:
+            future = today + datetime.timedelta(days=days)
+            future = future.strftime("%Y%m%d")
+            self.assertEqual(cal.nearest(future), last)
+            self.assertFalse(cal.is_business_day(future))
+        self.assertEqual(
+            cal.nearest_many([future])[0], pd.Timestamp(last))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_dates_after_until_refresh_once_a_day(self):
+        # 2021-02-06 (토)에 조회한 달력을 다음 주 월요일에 사용
+        with mock.patch.object(calendar, "_today", lambda: "20210206"):
+            cal = TradingCalendar()
+            cal.nearest()
+        with mock.patch.object(calendar, "_today", lambda: "20210208"):
+            for _ in range(3):
+                self.assertEqual(cal.nearest("20210207"), "20210205")
+                self.assertEqual(cal.nearest("20210213"), "20210208")
+            self.assertEqual(len(self.calls), 2)
+
+    def test_today_is_served_within_ttl(self):
+        # 2021-02-07 (일)
+        with mock.patch.object(calendar, "_today", lambda: "20210207"):
+            cal = TradingCalendar()
+            for _ in range(5):
+                self.assertEqual(cal.nearest(), "20210205")
+            self.assertEqual(len(self.calls), 1)
+
+        # 날짜가 바뀌면 오늘까지 다시 조회한다.
+        with mock.patch.object(calendar, "_today", lambda: "20210208"):
+            self.assertEqual(cal.nearest(), "20210208")
+            self.assertEqual(cal.nearest(), "20210208")
+            self.assertEqual(len(self.calls), 2)
+
+    def test_nearest_business_day_in_a_week(self):
+        self.assertEqual(
+            krx.get_nearest_business_day_in_a_week("20210212"), "20210210")
+
+
+class BusinessDaysTest(_CalendarTestCase):
+    def test_previous_business_days(self):
+        from pykrx import stock
+        days = stock.get_previous_business_days(year=2021, month=2)
+        self.assertEqual(len(days), 18)
+        self.assertEqual(days[0], pd.Timestamp("20210201"))
+        days = stock.get_previous_business_days(fromdate="20201228",
+                                                todate="20210105")
+        self.assertEqual(len(days), 6)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_current_month_is_served_from_calendar(self):
+        from pykrx import stock
+        today = datetime.date.today()
+        expected = [d for d in pd.bdate_range(today.replace(day=1), today)]
+        for _ in range(3):
+            days = stock.get_previous_business_days(year=today.year,
+                                                    month=today.month)
+            self.assertEqual(days, expected)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_business_days_index(self):
+        from pykrx import stock
+        index = stock.get_business_days_index("20210101", "20210108")
+        self.assertIsInstance(index, pd.DatetimeIndex)
+        self.assertEqual(index[0], pd.Timestamp("20210104"))
+        self.assertEqual(len(index), 5)
+
+    def test_nearest_business_days(self):
+        from pykrx import stock
+        dates = ["20210101", "20210104", "20210211", "20210213"]
+        prev = stock.get_nearest_business_days(dates)
+        self.assertEqual(prev.strftime("%Y%m%d").tolist(),
+                         ["20201231", "20210104", "20210210", "20210210"])
+        nxt = stock.get_nearest_business_days(dates, prev=False)
+        self.assertEqual(nxt.strftime("%Y%m%d").tolist(),
+                         ["20210104", "20210104", "20210215", "20210215"])
+        self.assertEqual(len(self.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
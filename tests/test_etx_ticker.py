@@ -0,0 +1,77 @@
+import unittest
+import os
+import tempfile
+import shutil
+import pandas as pd
+from unittest import mock
+from pykrx.website.krx.etx import ticker
+from pykrx.website.krx.etx.ticker import EtxTicker
+# pylint: disable-all
+# flake8: noqa
+
+_MASTERS = {
+    "ETF": [["KR7069500007", "069500", "KODEX 200", "2002/10/14"],
+            ["KR7360750004", "360750", "TIGER 미국S&P500", "2020/08/07"]],
+    "ETN": [["KRG580000011", "580011", "신한 레버리지 WTI원유 선물 ETN",
+             "2016/12/26"]],
+    "ELW": [["KRA5800A1234", "58A123", "KB A123삼성전자콜", "2021/01/04"]],
+}
+
+
+class EtxTickerTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.calls = []
+        calls = self.calls
+
+        def _source(category):
+            class _Fetch:
+                def fetch(self):
+                    calls.append(category)
+                    return pd.DataFrame(_MASTERS[category], columns=[
+                        "ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"])
+            return _Fetch
+
+        sources = {c: _source(c) for c in _MASTERS}
+        patches = [
+            mock.patch.dict(os.environ, {"PYKRX_CACHE_DIR": self.root}),
+            mock.patch.object(EtxTicker, "_sources", sources),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        EtxTicker._instance = None
+        self.addCleanup(setattr, EtxTicker, "_instance", None)
+
+    def test_etf_lookups_fetch_only_etf(self):
+        self.assertEqual(ticker.get_etx_isin("069500"), "KR7069500007")
+        self.assertTrue(ticker.is_etf("069500"))
+        self.assertEqual(ticker.get_etx_name("360750"), "TIGER 미국S&P500")
+        self.assertEqual(ticker.get_etx_ticker_list("20210104", "ETF"),
+                         ["069500", "360750"])
+        self.assertEqual(self.calls, ["ETF"])
+
+    def test_categories_searched_in_order(self):
+        self.assertEqual(ticker.get_etx_isin("580011"), "KRG580000011")
+        self.assertFalse(ticker.is_etf("580011"))
+        self.assertTrue(ticker.is_etn("580011"))
+        self.assertEqual(self.calls, ["ETF", "ETN"])
+        self.assertEqual(EtxTicker().get_market("580011"), "ETN")
+
+    def test_listing_date_filter(self):
+        self.assertEqual(ticker.get_etx_ticker_list("20200101", "ETF"),
+                         ["069500"])
+        self.assertEqual(len(ticker.get_etx_ticker_list("20210104", "ALL")),
+                         4)
+        self.assertRaises(KeyError, ticker.get_etx_isin, "999999")
+
+    def test_persisted_per_category(self):
+        ticker.get_etx_isin("069500")
+        EtxTicker._instance = None
+        ticker.is_etf("069500")
+        self.assertEqual(self.calls, ["ETF"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import unittest
+import json
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from pykrx.website.comm.framecache import FrameCache
+from pykrx.website.comm.ratelimit import RequestScheduler
+from pykrx.website.comm.webio import Post
+from pykrx.website.krx.krxio import KrxWebIo
+from pykrx.website.krx.market import wrap
+# pylint: disable-all
+# flake8: noqa
+
+
+def _frame(n):
+    return pd.DataFrame({'a': np.arange(n, dtype=np.int64)})
+
+
+class FrameCacheTest(unittest.TestCase):
+    def test_load_once(self):
+        cache = FrameCache(max_bytes=1 << 20)
+        calls = []
+        load = lambda: calls.append(1) or _frame(10)
+        df = cache.get("k", load)
+        self.assertIs(cache.get("k", load), df)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evicts_least_recently_used(self):
+        size = int(_frame(100).memory_usage(index=True, deep=True).sum())
+        cache = FrameCache(max_bytes=size * 2)
+        cache.get(1, lambda: _frame(100))
+        cache.get(2, lambda: _frame(100))
+        cache.get(1, lambda: _frame(100))
+        cache.get(3, lambda: _frame(100))
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertLessEqual(stats['bytes'], size * 2)
+        # 2가 삭제되고 1은 남아 있다.
+        hits = stats['hits']
+        cache.get(1, lambda: _frame(100))
+        self.assertEqual(cache.stats()['hits'], hits + 1)
+        cache.get(2, lambda: _frame(100))
+        self.assertEqual(cache.stats()['hits'], hits + 1)
+
+    def test_too_large_is_not_stored(self):
+        cache = FrameCache(max_bytes=10)
+        self.assertEqual(len(cache.get("k", lambda: _frame(100))), 100)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_ttl(self):
+        cache = FrameCache(max_bytes=1 << 20)
+        cache.get("k", lambda: _frame(1), ttl=0.05)
+        time.sleep(0.1)
+        df = cache.get("k", lambda: _frame(2), ttl=0.05)
+        self.assertEqual(len(df), 2)
+
+    def test_error_is_not_cached(self):
+        cache = FrameCache(max_bytes=1 << 20)
+
+        def fail():
+            raise ConnectionError()
+
+        self.assertRaises(ConnectionError, cache.get, "k", fail)
+        self.assertEqual(len(cache.get("k", lambda: _frame(3))), 3)
+
+    def test_concurrent_misses_load_once(self):
+        cache = FrameCache(max_bytes=1 << 20)
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.1)
+            return _frame(5)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            frames = list(executor.map(lambda _: cache.get("k", load),
+                                       range(4)))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(df is frames[0] for df in frames))
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+def _snapshot_read(calls):
+    def read(self, **params):
+        calls.append(params)
+        rows = [{"ISU_SRT_CD": ticker, "ISU_ABBRV": name,
+                 "TDD_OPNPRC": "1,000", "TDD_HGPRC": "1,100",
+                 "TDD_LWPRC": "900", "TDD_CLSPRC": "1,050",
+                 "ACC_TRDVOL": "10", "ACC_TRDVAL": "10,500",
+                 "FLUC_RT": "5.00", "MKTCAP": cap, "LIST_SHRS": "100"}
+                for ticker, name, cap in [("000001", "A", "105,000"),
+                                          ("000002", "B", "205,000")]]
+        return _Response({"OutBlock_1": rows})
+    return read
+
+
+class MarketSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+        wrap.clear_snapshot_cache()
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+        wrap.clear_snapshot_cache()
+
+    def test_views_share_one_request(self):
+        calls = []
+        with mock.patch.object(Post, "read", _snapshot_read(calls)):
+            ohlcv = wrap.get_market_ohlcv_by_ticker("20210104", "KOSPI")
+            cap = wrap.get_market_cap_by_ticker("20210104", "KOSPI")
+            names = wrap.get_market_ticker_and_name("20210104", "KOSPI")
+        self.assertEqual(len(calls), 1)
+
+        self.assertEqual(list(ohlcv.columns),
+                         ['시가', '고가', '저가', '종가', '거래량', '거래대금',
+                          '등락률'])
+        self.assertEqual(ohlcv['거래량'].dtype, np.int32)
+        self.assertEqual(cap.index.tolist(), ["000002", "000001"])
+        self.assertEqual(cap['종가'].dtype, np.int64)
+        self.assertEqual(names.to_dict(), {"000001": "A", "000002": "B"})
+
+    def test_markets_are_cached_separately(self):
+        calls = []
+        with mock.patch.object(Post, "read", _snapshot_read(calls)):
+            wrap.get_market_ohlcv_by_ticker("20210104", "KOSPI")
+            wrap.get_market_ohlcv_by_ticker("20210104", "KOSDAQ")
+        self.assertEqual([c['mktId'] for c in calls], ["STK", "KSQ"])
+
+    def test_today_is_not_cached_by_default(self):
+        import datetime
+        today = datetime.date.today().strftime("%Y%m%d")
+        calls = []
+        self.addCleanup(wrap.configure_snapshot_cache, intraday_ttl=0)
+        with mock.patch.object(Post, "read", _snapshot_read(calls)):
+            wrap.get_market_ohlcv_by_ticker(today, "KOSPI")
+            wrap.get_market_ohlcv_by_ticker(today, "KOSPI")
+            self.assertEqual(len(calls), 2)
+
+            wrap.configure_snapshot_cache(intraday_ttl=5)
+            wrap.get_market_ohlcv_by_ticker(today, "KOSPI")
+            wrap.get_market_ohlcv_by_ticker(today, "KOSPI")
+            self.assertEqual(len(calls), 3)
+
+    def test_views_do_not_modify_snapshot(self):
+        with mock.patch.object(Post, "read", _snapshot_read([])):
+            df = wrap.get_market_ohlcv_by_ticker("20210104", "KOSPI")
+            df['종가'] = 0
+            names = wrap.get_market_ticker_and_name("20210104", "KOSPI")
+            names[:] = ""
+            snapshot = wrap.get_market_snapshot("20210104", "KOSPI")
+        self.assertEqual(snapshot['종가'].tolist(), [1050, 1050])
+        self.assertEqual(snapshot['종목명'].tolist(), ["A", "B"])
+
+
+def _history_read(calls):
+    def read(self, **params):
+        calls.append(params)
+        rows = [{"TRD_DD": day, "TDD_OPNPRC": "1,000", "TDD_HGPRC": "1,100",
+                 "TDD_LWPRC": "900", "TDD_CLSPRC": close,
+                 "ACC_TRDVOL": "10", "ACC_TRDVAL": "10,500",
+                 "FLUC_RT": "5.00", "MKTCAP": "105,000", "LIST_SHRS": "100"}
+                for day, close in [("2021/01/05", "1,050"),
+                                   ("2021/01/04", "1,000")]]
+        return _Response({"output": rows})
+    return read
+
+
+class MarketHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+        wrap.clear_snapshot_cache()
+        patch = mock.patch.object(wrap, "get_stock_ticker_isin",
+                                  lambda ticker: "KR7" + ticker + "003")
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+        wrap.clear_snapshot_cache()
+
+    def test_ohlcv_and_cap_share_one_request(self):
+        calls = []
+        with mock.patch.object(Post, "read", _history_read(calls)):
+            ohlcv = wrap.get_market_ohlcv_by_date("20210104", "20210105",
+                                                  "005930")
+            cap = wrap.get_market_cap_by_date("20210104", "20210105",
+                                              "005930")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(ohlcv['종가'].tolist(), [1000, 1050])
+        self.assertEqual(ohlcv['거래량'].dtype, np.int32)
+        self.assertEqual(list(cap.columns),
+                         ['시가총액', '거래량', '거래대금', '상장주식수'])
+        self.assertTrue(cap.index.is_monotonic_increasing)
+
+    def test_adjusted_is_part_of_the_key(self):
+        calls = []
+        with mock.patch.object(Post, "read", _history_read(calls)):
+            wrap.get_market_ohlcv_by_date("20210104", "20210105", "005930")
+            wrap.get_market_ohlcv_by_date("20210104", "20210105", "005930",
+                                          adjusted=False)
+        self.assertEqual([c['adjStkPrc'] for c in calls], [2, 1])
+
+    def test_history_has_all_fields(self):
+        with mock.patch.object(Post, "read", _history_read([])):
+            df = wrap.get_market_history_by_date("20210104", "20210105",
+                                                 "005930")
+        self.assertEqual(list(df.columns),
+                         ['시가', '고가', '저가', '종가', '거래량', '거래대금',
+                          '등락률', '시가총액', '상장주식수'])
+
+
+if __name__ == '__main__':
+    unittest.main()
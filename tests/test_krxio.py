@@ -0,0 +1,215 @@
+import unittest
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from pykrx.website.comm.webio import Post
+from pykrx.website.comm.ratelimit import RequestScheduler
+from pykrx.website.comm.singleflight import SingleFlight
+from pykrx.website.krx.krxio import KrxWebIo, batch_requests
+from pykrx.website.krx.schema import Schema
+import numpy as np
+# pylint: disable-all
+# flake8: noqa
+
+
+class _Response:
+    def __init__(self, payload):
+        self.payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _fake_read(delay=0.0):
+    def read(self, **params):
+        time.sleep(delay)
+        rows = [{"TRD_DD": params['endDd']}, {"TRD_DD": params['strtDd']}]
+        return _Response({"output": rows, "CURRENT_DATETIME": "now"})
+    return read
+
+
+class _Sample(KrxWebIo):
+    @property
+    def bld(self):
+        return "dbms/MDC/STAT/standard/MDCSTAT01701"
+
+    def fetch(self, strtDd, endDd):
+        return self.read(strtDd=strtDd, endDd=endDd)
+
+
+def _fake_trading_read(self, **params):
+    end = params['endDd']
+    rows = [{"TRD_DD": f"{end[:4]}/{end[4:6]}/{end[6:]}",
+             "TRDVAL1": "1,234", "TRDVAL_TOT": "-", "ISU_NM": "x"}]
+    return _Response({"output": rows})
+
+
+class _TypedSample(KrxWebIo):
+    schema = Schema("output", {
+        "TRD_DD": ("날짜", "datetime"),
+        "TRDVAL1": ("기관합계", np.int64),
+        "TRDVAL_TOT": ("전체", np.int64),
+    }, index="날짜")
+
+    @property
+    def bld(self):
+        return "test/krxio/typed_sample"
+
+    def fetch(self, strtDd, endDd):
+        return self.read_frame(strtDd=strtDd, endDd=endDd)
+
+
+class KrxWebIoWindowTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+
+    def test_split_period(self):
+        windows = KrxWebIo._split_period("20000101", "20200101")
+        self.assertEqual(windows[0], ("20000101", "20011231"))
+        self.assertEqual(windows[1], ("20020101", "20040101"))
+        self.assertEqual(windows[-1][1], "20200101")
+        self.assertEqual(len(windows), 10)
+        self.assertEqual(KrxWebIo._split_period("20200102", "20200101"), [])
+
+    def test_single_window(self):
+        with mock.patch.object(Post, "read", _fake_read()):
+            result = _Sample().fetch("20210101", "20210131")
+        self.assertEqual(len(result['output']), 2)
+
+    def test_windows_merged_in_date_order(self):
+        with mock.patch.object(Post, "read", _fake_read()):
+            result = _Sample().fetch("20000101", "20200101")
+        starts = [row['TRD_DD'] for row in result['output'][1::2]]
+        self.assertEqual(starts, sorted(starts))
+        self.assertEqual(len(result['output']), 20)
+        self.assertEqual(result['CURRENT_DATETIME'], "now")
+
+    def test_windows_fetched_concurrently(self):
+        with mock.patch.object(Post, "read", _fake_read(0.2)):
+            start = time.monotonic()
+            _Sample().fetch("20000101", "20200101")
+            elapsed = time.monotonic() - start
+        # 10개 구간을 4개씩 동시에 조회 -> 3회 분량의 지연
+        self.assertLess(elapsed, 1.0)
+
+    def test_requests_go_through_scheduler(self):
+        KrxWebIo.scheduler = RequestScheduler(rate=20, capacity=1)
+        with mock.patch.object(Post, "read", _fake_read()):
+            start = time.monotonic()
+            _Sample().fetch("20000101", "20200101")
+            elapsed = time.monotonic() - start
+        # 첫 요청 이후 9개의 요청이 초당 20회로 제한됨
+        self.assertGreater(elapsed, 0.4)
+
+    def test_single_requests_are_not_throttled(self):
+        KrxWebIo.scheduler = RequestScheduler(rate=1, capacity=1)
+        with mock.patch.object(Post, "read", _fake_read()):
+            start = time.monotonic()
+            for _ in range(5):
+                _Sample().fetch("20210101", "20210131")
+            self.assertLess(time.monotonic() - start, 0.5)
+
+            # batch_requests 블록 안의 단건 조회는 속도 제한을 받는다.
+            KrxWebIo.scheduler = RequestScheduler(rate=20, capacity=1)
+            start = time.monotonic()
+            with batch_requests():
+                for _ in range(5):
+                    _Sample().fetch("20210101", "20210131")
+            self.assertGreater(time.monotonic() - start, 0.15)
+
+
+class KrxWebIoReadFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+
+    def test_windows_are_typed_and_concatenated(self):
+        with mock.patch.object(Post, "read", _fake_trading_read):
+            df = _TypedSample().fetch("20000101", "20200101")
+        self.assertEqual(len(df), 10)
+        self.assertEqual(list(df.columns), ["TRD_DD", "TRDVAL1", "TRDVAL_TOT"])
+        self.assertEqual(df['TRD_DD'].dtype.kind, "M")
+        self.assertEqual(df['TRDVAL1'].dtype, np.int64)
+        self.assertEqual(df['TRDVAL1'].iloc[0], 1234)
+        self.assertEqual(df['TRDVAL_TOT'].iloc[0], 0)
+        self.assertTrue(df['TRD_DD'].is_monotonic_increasing)
+        self.assertEqual(list(df.index), list(range(10)))
+
+    def test_each_window_converted_once(self):
+        chunk = _TypedSample.schema.chunk
+        with mock.patch.object(Post, "read", _fake_trading_read), \
+                mock.patch.object(_TypedSample.schema, "chunk",
+                                  side_effect=chunk) as converted:
+            _TypedSample().fetch("20000101", "20200101")
+        self.assertEqual(converted.call_count, 10)
+
+    def test_parse_after_read_frame(self):
+        with mock.patch.object(Post, "read", _fake_trading_read):
+            df = _TypedSample().fetch("20210101", "20210131")
+        df = _TypedSample.schema.parse(df)
+        self.assertEqual(list(df.columns), ["기관합계", "전체"])
+        self.assertEqual(df.index[0], np.datetime64("2021-01-31"))
+
+    def test_empty_windows(self):
+        def read(self, **params):
+            return _Response({"output": []})
+
+        with mock.patch.object(Post, "read", read):
+            df = _TypedSample().fetch("20000101", "20200101")
+        self.assertTrue(df.empty)
+
+
+class KrxWebIoSingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = KrxWebIo.scheduler
+        self.single_flight = KrxWebIo.single_flight
+        KrxWebIo.scheduler = RequestScheduler(rate=None)
+        KrxWebIo.single_flight = SingleFlight()
+
+    def tearDown(self):
+        KrxWebIo.scheduler = self.scheduler
+        KrxWebIo.single_flight = self.single_flight
+
+    def test_identical_requests_are_coalesced(self):
+        with mock.patch.object(Post, "read", _fake_read(0.2)):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(
+                    lambda _: _Sample().fetch("20210104", "20210108"), range(8)))
+        self.assertTrue(all(r == results[0] for r in results))
+        # 각 호출은 서로 다른 객체를 받는다.
+        self.assertIsNot(results[0], results[1])
+        stats = KrxWebIo.single_flight.stats()
+        self.assertEqual(stats['executed'], 1)
+        self.assertEqual(stats['coalesced'], 7)
+
+    def test_different_requests_are_not_coalesced(self):
+        with mock.patch.object(Post, "read", _fake_read(0.1)):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda d: _Sample().fetch(d, d),
+                                  ["20210104", "20210105"]))
+        self.assertEqual(KrxWebIo.single_flight.stats()['executed'], 2)
+
+    def test_error_is_shared(self):
+        def read(self, **params):
+            time.sleep(0.1)
+            raise ConnectionError()
+
+        with mock.patch.object(Post, "read", read):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(_Sample().fetch, "20210104", "20210108")
+                           for _ in range(4)]
+                for future in futures:
+                    self.assertRaises(ConnectionError, future.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
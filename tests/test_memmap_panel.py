@@ -0,0 +1,97 @@
+import unittest
+import os
+import tempfile
+import threading
+import time
+import shutil
+import numpy as np
+import pandas as pd
+from unittest import mock
+from pykrx.store import MemmapPanel
+from pykrx.store import panel
+# pylint: disable-all
+# flake8: noqa
+
+
+def _ohlcv(date, market="ALL"):
+    day = int(date[-2:])
+    tickers = ["005930", "000660"] if day < 6 else ["005930", "000660", "035420"]
+    return pd.DataFrame({f: [day] * len(tickers) for f in
+                         ['시가', '고가', '저가', '종가', '거래량', '거래대금']},
+                        index=pd.Index(tickers, name='티커'))
+
+
+def _cap(date, market="ALL"):
+    df = _ohlcv(date, market)
+    return pd.DataFrame({'종가': df['종가'], '시가총액': df['종가'] * 1000})
+
+
+class MemmapPanelTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        patches = [
+            mock.patch.object(panel.krx, "get_market_ohlcv_by_ticker", _ohlcv),
+            mock.patch.object(panel.krx, "get_market_cap_by_ticker", _cap),
+            mock.patch.object(panel.stock, "get_previous_business_days",
+                              lambda fromdate, todate:
+                              list(pd.bdate_range(fromdate, todate))),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_build(self):
+        p = MemmapPanel.build(self.path, "20210104", "20210108")
+        self.assertEqual(list(p.tickers), ["000660", "005930", "035420"])
+        self.assertEqual(p['종가'].shape, (5, 3))
+        self.assertIsInstance(p['종가'], np.memmap)
+        self.assertEqual(p['시가총액'][0, 1], 4000)
+        # 상장 전에는 NaN
+        self.assertTrue(np.isnan(p['종가'][0, 2]))
+        self.assertEqual(p['종가'][3, 2], 7)
+
+    def test_date_slice_is_a_view(self):
+        MemmapPanel.build(self.path, "20210104", "20210108")
+        p = MemmapPanel(self.path)
+        view = p.get('종가', "20210105", "20210107")
+        self.assertEqual(view.shape, (3, 3))
+        self.assertTrue(np.shares_memory(view, p['종가']))
+        self.assertFalse(view.flags.writeable)
+
+    def test_to_frame(self):
+        p = MemmapPanel.build(self.path, "20210104", "20210108")
+        df = p.to_frame('시가', fromdate="20210107", tickers=["035420"])
+        self.assertEqual(df['035420'].tolist(), [7, 8])
+        self.assertEqual(df.index[0], pd.Timestamp("20210107"))
+        self.assertRaises(KeyError, p.get, '시가', tickers=["999999"])
+
+    def test_build_bounds_in_flight_fetches(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def ohlcv(date, market="ALL"):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return _ohlcv(date, market)
+
+        with mock.patch.object(panel.krx, "get_market_ohlcv_by_ticker", ohlcv):
+            p = MemmapPanel.build(self.path, "20210104", "20210129",
+                                  tickers=["005930", "035420"],
+                                  max_workers=2)
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual(list(p.tickers), ["005930", "035420"])
+        self.assertEqual(p['종가'][-1, 0], 29)
+        self.assertTrue(np.isnan(p['종가'][0, 1]))
+
+    def test_build_removes_spilled_rows(self):
+        MemmapPanel.build(self.path, "20210104", "20210108", max_workers=2)
+        self.assertFalse(os.path.exists(os.path.join(self.path, ".rows")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import pandas as pd
+from unittest import mock
+from pykrx.stock import panel_api
+# pylint: disable-all
+# flake8: noqa
+
+
+def _snapshot(date, market="ALL"):
+    if date == "20210105":
+        # 휴장일
+        return pd.DataFrame({'시가': [0, 0], '고가': [0, 0], '저가': [0, 0],
+                             '종가': [0, 0], '거래량': [0, 0],
+                             '거래대금': [0, 0], '등락률': [0.0, 0.0]},
+                            index=pd.Index(["005930", "000660"], name='티커'))
+    day = int(date[-2:])
+    return pd.DataFrame({'시가': [day, day * 10], '고가': [day, day * 10],
+                         '저가': [day, day * 10], '종가': [day, day * 10],
+                         '거래량': [1, 2], '거래대금': [3, 4],
+                         '등락률': [0.1, 0.2]},
+                        index=pd.Index(["005930", "000660"], name='티커'))
+
+
+def _batch(fromdate, todate, tickers, adjusted=True, max_workers=8,
+           layout="long"):
+    index = pd.to_datetime([fromdate, todate]).rename('날짜')
+    frames = {t: pd.DataFrame({'시가': [7, 7], '종가': [8, 8]}, index=index)
+              for t in tickers if t != "999999"}
+    df = pd.concat(frames, axis=1, names=['티커', '항목'])
+    df.attrs['failed'] = {t: "empty result" for t in tickers
+                          if t == "999999"}
+    return df
+
+
+class _Calendar:
+    holidays = {pd.Timestamp("20200101"), pd.Timestamp("20210101")}
+
+    def business_days(self, fromdate, todate):
+        days = pd.bdate_range(fromdate, todate, name='날짜')
+        return days[~days.isin(self.holidays)]
+
+
+class PanelPlanTest(unittest.TestCase):
+    def setUp(self):
+        patch = mock.patch.object(panel_api.krx, "TradingCalendar", _Calendar)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_few_tickers_long_range_uses_history(self):
+        plan = panel_api.plan_market_ohlcv_panel(
+            "20200101", "20201231", ["005930", "000660"])
+        self.assertEqual(plan['strategy'], "history")
+        self.assertEqual(plan['history'], 2)
+        # 휴장일은 요청 수에 포함되지 않는다.
+        self.assertEqual(plan['snapshot'], 261)
+
+    def test_many_tickers_short_range_uses_snapshot(self):
+        tickers = [f"{i:06d}" for i in range(200)]
+        plan = panel_api.plan_market_ohlcv_panel("20210104", "20210108",
+                                                 tickers)
+        self.assertEqual(plan, {'strategy': "snapshot", 'snapshot': 5,
+                                'history': 200})
+
+    def test_adjusted_forces_history(self):
+        tickers = [f"{i:06d}" for i in range(200)]
+        plan = panel_api.plan_market_ohlcv_panel("20210104", "20210108",
+                                                 tickers, adjusted=True)
+        self.assertEqual(plan['strategy'], "history")
+
+
+class PanelFetchTest(unittest.TestCase):
+    def setUp(self):
+        patches = [mock.patch.object(panel_api.krx,
+                                     "get_market_ohlcv_by_ticker", _snapshot),
+                   mock.patch.object(panel_api, "get_market_ohlcv_batch",
+                                     _batch),
+                   mock.patch.object(panel_api.krx, "TradingCalendar",
+                                     _Calendar)]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_snapshot_panel(self):
+        df = panel_api.get_market_ohlcv_panel(
+            "20210104", "20210106", ["000660", "005930"], strategy="snapshot")
+        self.assertEqual(df.attrs['strategy'], "snapshot")
+        self.assertEqual(df.columns.names, ['항목', '티커'])
+        self.assertEqual(list(df['종가'].columns), ["000660", "005930"])
+        # 휴장일은 제외된다.
+        self.assertEqual(df['종가']['005930'].tolist(), [4, 6])
+        self.assertEqual(df['종가']['000660'].tolist(), [40, 60])
+
+    def test_snapshot_skips_calendar_holidays(self):
+        dates = []
+
+        def snapshot(date, market="ALL"):
+            dates.append(date)
+            return _snapshot(date, market)
+
+        with mock.patch.object(panel_api.krx, "get_market_ohlcv_by_ticker",
+                               snapshot):
+            df = panel_api.get_market_ohlcv_panel(
+                "20201231", "20210104", ["005930"], strategy="snapshot")
+        self.assertEqual(sorted(dates), ["20201231", "20210104"])
+        self.assertEqual(df['종가']['005930'].tolist(), [31, 4])
+
+    def test_snapshot_falls_back_to_history_for_missing(self):
+        df = panel_api.get_market_ohlcv_panel(
+            "20210104", "20210106", ["005930", "069500", "999999"],
+            strategy="snapshot")
+        self.assertEqual(df.attrs['strategy'], "mixed")
+        self.assertEqual(list(df['종가'].columns), ["005930", "069500"])
+        self.assertEqual(df.attrs['failed'], {"999999": "empty result"})
+
+    def test_history_panel(self):
+        df = panel_api.get_market_ohlcv_panel(
+            "20210104", "20210106", ["005930"], adjusted=True)
+        self.assertEqual(df.attrs['strategy'], "history")
+        self.assertEqual(df['종가']['005930'].tolist(), [8, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import numpy as np
+import pandas as pd
+from unittest import mock
+from pykrx.website.comm.parser import parse_numeric, parse_date, parse_frame
+from pykrx.website.krx.market import wrap
+from pykrx.website.krx.market.core import 전종목시세, 기업주요변동사항
+# pylint: disable-all
+# flake8: noqa
+
+
+class ParseNumericTest(unittest.TestCase):
+    def test_krx_strings(self):
+        values = parse_numeric(["1,234", "-", "", "-12.5", None], np.float64)
+        np.testing.assert_array_equal(values, [1234, 0, 0, -12.5, 0])
+
+    def test_large_integers_are_exact(self):
+        values = parse_numeric(["9,007,199,254,740,993", "-"], np.int64)
+        self.assertEqual(values[0], 9007199254740993)
+        self.assertEqual(values.dtype, np.int64)
+
+    def test_other_characters_are_removed(self):
+        values = parse_numeric(["12 %", " 3 "], np.int32)
+        np.testing.assert_array_equal(values, [12, 3])
+
+    def test_numeric_input(self):
+        values = parse_numeric(pd.Series([1, 2]), np.float32)
+        self.assertEqual(values.dtype, np.float32)
+
+    def test_negative_unsigned_raises(self):
+        self.assertRaises(ValueError, parse_numeric, ["1,000", "-5"],
+                          np.uint64)
+        self.assertRaises(ValueError, parse_numeric, pd.Series([1, -5]),
+                          np.uint32)
+        self.assertRaises(ValueError, parse_frame,
+                          pd.DataFrame({'a': ["1,000", "-5"]}), np.uint64)
+        np.testing.assert_array_equal(
+            parse_numeric(["1,000", "-"], np.uint64), [1000, 0])
+
+    def test_invalid_value_raises(self):
+        self.assertRaises(ValueError, parse_numeric, ["1.2.3"], np.int32)
+
+
+class ParseDateTest(unittest.TestCase):
+    def test_formats(self):
+        index = parse_date(["2021/01/04", "2021.01.05", "20210106"])
+        self.assertEqual(list(index.strftime("%Y%m%d")),
+                         ["20210104", "20210105", "20210106"])
+
+
+class ParseFrameTest(unittest.TestCase):
+    def test_block_and_fallback_columns(self):
+        df = pd.DataFrame({
+            '이름': ["가", "나", "다"],
+            '종가': ["1,000", "-", "2,500"],
+            '등락률': ["-0.21", "", "3.45"],
+            '비중': ["1 %", "2 %", "-"],
+        })
+        result = parse_frame(df, {'종가': np.int32, '등락률': np.float32,
+                                  '비중': np.float64})
+        self.assertEqual(list(result['이름']), ["가", "나", "다"])
+        np.testing.assert_array_equal(result['종가'], [1000, 0, 2500])
+        self.assertEqual(result['종가'].dtype, np.int32)
+        np.testing.assert_allclose(result['등락률'], [-0.21, 0, 3.45],
+                                   rtol=1e-6)
+        np.testing.assert_array_equal(result['비중'], [1, 2, 0])
+        # 원본은 변경되지 않는다.
+        self.assertEqual(df['종가'][0], "1,000")
+
+    def test_single_dtype_and_multiindex_columns(self):
+        df = pd.DataFrame([["1,000", "-"], ["2", "3"]])
+        df.columns = pd.MultiIndex.from_product([['거래량'], ['매도', '매수']])
+        result = parse_frame(df, np.int64)
+        self.assertEqual(result.values.tolist(), [[1000, 0], [2, 3]])
+
+    def test_same_result_as_regex_replace(self):
+        df = pd.DataFrame({
+            '시가': ["1,234", "-", "56,700"],
+            '거래대금': ["309,831,714,345,000", "0", ""],
+            '등락률': ["-2.30", "-", "0.00"],
+        })
+        dtypes = {'시가': np.int32, '거래대금': np.int64, '등락률': np.float32}
+        legacy = df.replace(r'[^-\w\.]', '', regex=True)
+        legacy = legacy.replace(r'\-$', '0', regex=True)
+        legacy = legacy.replace('', '0').astype(dtypes)
+        pd.testing.assert_frame_equal(parse_frame(df, dtypes), legacy)
+
+
+class WrapParseTest(unittest.TestCase):
+    def test_market_ohlcv_by_ticker(self):
+        payload = pd.DataFrame({
+            'ISU_SRT_CD': ["060310", "095570"], 'ISU_ABBRV': ["3S", "AJ네트웍스"],
+            'TDD_OPNPRC': ["2,370", "-"], 'TDD_HGPRC': ["2,395", "-"],
+            'TDD_LWPRC': ["2,355", "-"], 'TDD_CLSPRC': ["2,365", "5,400"],
+            'ACC_TRDVOL': ["152,157", "0"],
+            'ACC_TRDVAL': ["361,210,535", "0"],
+            'FLUC_RT': ["-0.21", "0.00"],
+            'MKTCAP': ["105,956,038,515", "252,840,393,000"],
+            'LIST_SHRS': ["44,802,511", "46,822,295"],
+        })
+        wrap.clear_snapshot_cache()
+        self.addCleanup(wrap.clear_snapshot_cache)
+        with mock.patch.object(전종목시세, "fetch", return_value=payload):
+            df = wrap.get_market_ohlcv_by_ticker("20210104", "ALL")
+        self.assertEqual(df.loc["060310", "시가"], 2370)
+        self.assertEqual(df.loc["095570", "고가"], 0)
+        self.assertEqual(df['거래대금'].dtype, np.int64)
+        self.assertEqual(df['등락률'].dtype, np.float32)
+
+    def test_stock_major_changes(self):
+        payload = pd.DataFrame({
+            'DD': ["1984/03/23", "1979/03/13"],
+            'BFCOM': ["삼성전자공업(주)", ""], 'AFCOM': ["삼성전자(주)", ""],
+            'BFIND': ["", ""], 'AFIND': ["", ""],
+            'BFPAR': ["", "1,000"], 'AFPAR': ["", "500"],
+            'BFCEO': ["", ""], 'AFCEO': ["", ""],
+        })
+        with mock.patch.object(wrap, "get_stock_ticker_isin",
+                               lambda ticker: "KR7005930003"), \
+                mock.patch.object(기업주요변동사항, "fetch",
+                                  return_value=payload):
+            df = wrap.get_stock_major_changes("005930")
+        self.assertEqual(df.index[0], pd.Timestamp("19790313"))
+        self.assertEqual(df['액면변경전'].tolist(), [1000, 0])
+        self.assertEqual(df['액면변경후'].tolist(), [500, 0])
+        self.assertEqual(df['액면변경후'].dtype, np.int16)
+        self.assertEqual(df['상호변경전'].tolist(), ["-", "삼성전자공업주"])
+        self.assertEqual(df['업종변경후'].tolist(), ["-", "-"])
+
+
+if __name__ == '__main__':
+    unittest.main()
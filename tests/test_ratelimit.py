@@ -0,0 +1,106 @@
+import unittest
+import asyncio
+import threading
+import time
+from pykrx.website.comm.ratelimit import TokenBucket, RequestScheduler
+# pylint: disable-all
+# flake8: noqa
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertGreater(bucket.reserve(), 0)
+
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreater(time.monotonic() - start, 0.05)
+
+    def test_unlimited(self):
+        bucket = TokenBucket(rate=None)
+        self.assertTrue(all(bucket.reserve() == 0 for _ in range(100)))
+
+
+class RequestSchedulerTest(unittest.TestCase):
+    def test_rate_per_host(self):
+        scheduler = RequestScheduler(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            scheduler.acquire("data.krx.co.kr")
+        self.assertGreater(time.monotonic() - start, 0.15)
+
+        # 다른 호스트는 별도의 버킷을 사용
+        start = time.monotonic()
+        scheduler.acquire("fchart.stock.naver.com")
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_rate_per_bld(self):
+        scheduler = RequestScheduler(rate=None, bld_rates={"slow": 2})
+        start = time.monotonic()
+        for _ in range(3):
+            scheduler.acquire("data.krx.co.kr", "fast")
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        for _ in range(3):
+            scheduler.acquire("data.krx.co.kr", "slow")
+        self.assertGreater(time.monotonic() - start, 0.4)
+
+    def test_fair_queuing(self):
+        scheduler = RequestScheduler(rate=20, capacity=1)
+        order = []
+        lock = threading.Lock()
+
+        def request(caller):
+            scheduler.acquire("data.krx.co.kr", caller=caller)
+            with lock:
+                order.append(caller)
+
+        # 호출자 A가 먼저 10개의 요청을 쌓아둔다.
+        threads = [threading.Thread(target=request, args=("A",))
+                   for _ in range(10)]
+        for t in threads:
+            t.start()
+        time.sleep(0.12)
+        t = threading.Thread(target=request, args=("B",))
+        t.start()
+        threads.append(t)
+        for t in threads:
+            t.join()
+
+        # B는 A의 요청이 모두 끝날 때까지 기다리지 않는다.
+        self.assertLess(order.index("B"), 6)
+
+    def test_async_caller_is_not_starved(self):
+        scheduler = RequestScheduler(rate=20, capacity=1)
+        order = []
+        lock = threading.Lock()
+
+        def request(caller):
+            scheduler.acquire("data.krx.co.kr", caller=caller)
+            with lock:
+                order.append(caller)
+
+        async def request_async():
+            for _ in range(2):
+                await scheduler.acquire_async("data.krx.co.kr")
+                with lock:
+                    order.append("aio")
+
+        # 두 스레드 호출자가 요청을 계속 쌓아둔 상태에서 asyncio 요청
+        threads = [threading.Thread(target=request, args=(caller,))
+                   for caller in "AB" for _ in range(8)]
+        for t in threads:
+            t.start()
+        time.sleep(0.12)
+        asyncio.run(request_async())
+        for t in threads:
+            t.join()
+
+        # asyncio 요청도 라운드 로빈 차례를 받는다.
+        self.assertEqual(order.count("aio"), 2)
+        self.assertLess(len(order) - 1 - order[::-1].index("aio"), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
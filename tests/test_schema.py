@@ -0,0 +1,111 @@
+import unittest
+import numpy as np
+import pandas as pd
+from unittest import mock
+from pykrx.website.krx.schema import Schema, get_schema, get_schemas
+from pykrx.website.krx.market import wrap
+from pykrx.website.krx.market.core import 전종목시세, 개별종목_공매도_잔고
+# pylint: disable-all
+# flake8: noqa
+
+
+class SchemaValidationTest(unittest.TestCase):
+    def test_invalid_schemas(self):
+        self.assertRaises(ValueError, Schema, "", {"A": ("a", str)})
+        self.assertRaises(ValueError, Schema, "output", {})
+        self.assertRaises(ValueError, Schema, "output",
+                          {"A": ("a", str), "B": ("a", np.int32)})
+        self.assertRaises(ValueError, Schema, "output", {"A": ("a", object)})
+        self.assertRaises(ValueError, Schema, "output", {"A": ("a", "foo")})
+        self.assertRaises(ValueError, Schema, "output", {"A": ("a", str)},
+                          index="b")
+
+    def test_registered_by_bld(self):
+        schema = get_schema(전종목시세().bld)
+        self.assertIs(schema, 전종목시세.schema)
+        self.assertEqual(schema.block, "OutBlock_1")
+        for bld, schema in get_schemas().items():
+            self.assertEqual(schema.bld, bld)
+
+
+class SchemaParseTest(unittest.TestCase):
+    raw = pd.DataFrame({
+        'ISU_SRT_CD': ["005930", "000660"],
+        'ISU_ABBRV': ["삼성전자", "SK하이닉스"],
+        'MKT_NM': ["KOSPI", "KOSPI"],
+        'TDD_OPNPRC': ["81,000", "-"], 'TDD_HGPRC': ["81,300", "-"],
+        'TDD_LWPRC': ["80,000", "-"], 'TDD_CLSPRC': ["80,500", "128,000"],
+        'ACC_TRDVOL': ["18,541,624", "0"],
+        'ACC_TRDVAL': ["1,498,327,245,000", "0"],
+        'FLUC_RT': ["-0.62", "0.00"],
+        'MKTCAP': ["480,567,460,275,000", "93,184,302,720,000"],
+        'LIST_SHRS': ["5,969,782,550", "728,002,365"],
+    })
+
+    def test_parse_all_columns(self):
+        df = 전종목시세.schema.parse(self.raw)
+        self.assertEqual(df.index.name, "티커")
+        self.assertEqual(list(df.columns), 전종목시세.schema.names[1:])
+        self.assertEqual(df.loc["005930", "시가총액"], 480567460275000)
+        self.assertEqual(df.loc["000660", "시가"], 0)
+        self.assertEqual(df['종가'].dtype, np.int32)
+
+    def test_parse_selected_columns_with_dtype(self):
+        df = 전종목시세.schema.parse(self.raw, ['시가총액', '종가'],
+                                   dtypes={'종가': np.int64})
+        self.assertEqual(list(df.columns), ['시가총액', '종가'])
+        self.assertEqual(df['종가'].dtype, np.int64)
+        self.assertRaises(KeyError, 전종목시세.schema.parse, self.raw, ['없음'])
+
+    def test_date_index(self):
+        raw = pd.DataFrame({
+            'RPT_DUTY_OCCR_DD': ["2020/01/10", "2020/01/09"],
+            'BAL_QTY': ["5,489,240", "5,387,073"],
+            'LIST_SHRS': ["5,969,782,550", "5,969,782,550"],
+            'BAL_AMT': ["326,609,780,000", "315,682,477,800"],
+            'MKTCAP': ["355,202,061,725,000", "349,829,236,470,000"],
+            'BAL_RTO': ["0.09", "0.09"],
+        })
+        df = 개별종목_공매도_잔고.schema.parse(raw)
+        self.assertIsInstance(df.index, pd.DatetimeIndex)
+        self.assertEqual(df.index.name, "날짜")
+
+    def test_frame_keeps_only_schema_fields(self):
+        result = {"OutBlock_1": self.raw.to_dict("records"),
+                  "CURRENT_DATETIME": "now"}
+        df = 전종목시세.schema.frame(result)
+        self.assertEqual(list(df.columns), 전종목시세.schema.fields)
+        self.assertNotIn('MKT_NM', df.columns)
+        pd.testing.assert_frame_equal(
+            전종목시세.schema.parse(df),
+            전종목시세.schema.parse(pd.DataFrame(result["OutBlock_1"])))
+
+    def test_frame_missing_fields(self):
+        rows = self.raw.to_dict("records")
+        del rows[1]['MKTCAP']
+        df = 전종목시세.schema.frame({"OutBlock_1": rows})
+        self.assertTrue(pd.isna(df['MKTCAP'][1]))
+
+        for row in rows:
+            row.pop('LIST_SHRS')
+        self.assertRaises(KeyError, 전종목시세.schema.frame,
+                          {"OutBlock_1": rows})
+        self.assertTrue(전종목시세.schema.frame({"OutBlock_1": []}).empty)
+
+    def test_wrap_uses_schema(self):
+        with mock.patch.object(전종목시세, "fetch", return_value=self.raw):
+            df = wrap.get_market_cap_by_ticker("20210104", "ALL")
+            names = wrap.get_market_ticker_and_name("20210104", "ALL")
+        self.assertEqual(list(df.index), ["005930", "000660"])
+        self.assertEqual(df['종가'].dtype, np.int64)
+        self.assertEqual(names["000660"], "SK하이닉스")
+
+    def test_empty_response(self):
+        with mock.patch.object(전종목시세, "fetch",
+                               return_value=pd.DataFrame([])):
+            df = wrap.get_market_ohlcv_by_ticker("20210103", "ALL")
+        self.assertTrue(df.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
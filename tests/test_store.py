@@ -0,0 +1,103 @@
+import unittest
+import os
+import tempfile
+import shutil
+import pandas as pd
+from unittest import mock
+from pykrx.store import MarketStore
+from pykrx.store import market
+# pylint: disable-all
+# flake8: noqa
+
+
+def _ohlcv(date, market="ALL"):
+    day = int(date[-2:])
+    return pd.DataFrame({'시가': [day, day * 10, day * 100],
+                         '종가': [day + 1, day * 10 + 1, day * 100 + 1]},
+                        index=pd.Index(["005930", "000660", "035420"],
+                                       name='티커'))
+
+
+def _business_days(fromdate, todate):
+    days = pd.bdate_range(fromdate, todate)
+    return [d for d in days if d != pd.Timestamp("20210105")]
+
+
+class MarketStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.fetched = []
+
+        def ohlcv(date, market="ALL"):
+            self.fetched.append(date)
+            return _ohlcv(date, market)
+
+        patches = [
+            mock.patch.dict(MarketStore.datasets, {"ohlcv": ohlcv}),
+            mock.patch.object(market.stock, "get_previous_business_days",
+                              lambda fromdate, todate:
+                              _business_days(fromdate, todate)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.store = MarketStore(self.root)
+
+    def test_update_fetches_only_missing_days(self):
+        written = self.store.update("20210104", "20210108", ["ohlcv"])
+        self.assertEqual(len(written), 4)
+        self.assertEqual(len(self.store.dates("ohlcv")), 4)
+
+        self.fetched.clear()
+        written = self.store.update(todate="20210112", datasets=["ohlcv"])
+        self.assertEqual(sorted(self.fetched), ["20210111", "20210112"])
+        self.assertEqual(len(self.store.dates("ohlcv")), 6)
+
+    def test_today_is_not_stored(self):
+        today = pd.Timestamp.today().normalize()
+        fromdate = (today - pd.Timedelta(days=7)).strftime("%Y%m%d")
+        self.store.update(fromdate, today.strftime("%Y%m%d"), ["ohlcv"])
+        self.assertNotIn(today.strftime("%Y%m%d"), self.fetched)
+        self.assertTrue(all(d < today for d in self.store.dates("ohlcv")))
+
+    def test_read_date(self):
+        self.store.update("20210104", "20210106", ["ohlcv"])
+        df = self.store.read_date("20210106", columns=['종가'],
+                                  tickers=["005930", "035420"])
+        self.assertEqual(list(df.columns), ['종가'])
+        self.assertEqual(df.loc["035420", '종가'], 601)
+        self.assertEqual(len(df), 2)
+        self.assertTrue(self.store.read_date("20210105").empty)
+
+    def test_read_ticker(self):
+        self.store.update("20210104", "20210108", ["ohlcv"])
+        df = self.store.read_ticker("000660", fromdate="20210105")
+        self.assertEqual(df['시가'].tolist(), [60, 70, 80])
+        self.assertEqual(df.index[0], pd.Timestamp("20210106"))
+        self.assertTrue(self.store.read_ticker("999999").empty)
+
+    def test_read_ticker_reuses_open_partitions(self):
+        self.store.update("20210104", "20210108", ["ohlcv"])
+        self.store.read_ticker("000660")
+        with mock.patch.object(market.np, "load") as load, \
+                mock.patch("builtins.open") as open_:
+            df = self.store.read_ticker("035420")
+        load.assert_not_called()
+        open_.assert_not_called()
+        self.assertEqual(df['종가'].tolist(), [401, 601, 701, 801])
+
+        # 다른 저장소 객체가 다시 저장한 일자는 새로 읽는다.
+        MarketStore(self.root).write("ohlcv", "20210106", _ohlcv("20210109"))
+        df = self.store.read_ticker("035420")
+        self.assertEqual(df['종가'].tolist(), [401, 901, 701, 801])
+
+    def test_partition_layout(self):
+        self.store.update("20210104", "20210104", ["ohlcv"])
+        path = os.path.join(self.root, "ohlcv", "20210104")
+        self.assertEqual(sorted(os.listdir(path)),
+                         ["_index.npy", "_meta.json", "시가.npy", "종가.npy"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+import unittest
+import os
+import tempfile
+import shutil
+import threading
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from pykrx.website import krx
+from pykrx.website.comm import singleton
+from pykrx.website.krx.market import ticker
+from pykrx.website.krx.market.ticker import StockTicker, IndexTicker
+from pykrx.website.krx.krxio import (
+    KrxWebIo, PendingRequests, deferred_requests
+)
+from pykrx.website.comm.webio import Post
+from pykrx.website.comm.ratelimit import RequestScheduler
+import json
+# pylint: disable-all
+# flake8: noqa
+
+
+class _Response:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+def _master(rows, calls, name, delay=0.0):
+    class _Fetch:
+        def fetch(self, market):
+            time.sleep(delay)
+            calls.append(name)
+            return pd.DataFrame(rows, columns=['short_code', 'codeName',
+                                               'full_code', 'marketName'])
+    return _Fetch
+
+
+LISTED = [["005930", "삼성전자", "KR7005930003", "유가증권"],
+          ["035720", "카카오", "KR7035720002", "유가증권"]]
+DELISTED = [["030270", "에스마크", "KR7030270003", "코스닥"],
+            ["030270", "가희 11R", "KRA030270151", "코스닥"]]
+
+
+class _TickerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.calls = []
+        sources = {"stock_listed": _master(LISTED, self.calls, "listed"),
+                   "stock_delisted": _master(DELISTED, self.calls,
+                                             "delisted")}
+        patches = [
+            mock.patch.dict(os.environ, {"PYKRX_CACHE_DIR": self.root}),
+            mock.patch.object(StockTicker, "_sources", sources),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self._reset()
+        self.addCleanup(self._reset)
+
+    def _reset(self):
+        StockTicker._instance = None
+        IndexTicker._instance = None
+
+
+class StockTickerTest(_TickerTestCase):
+    def test_listed_lookup_fetches_only_listed(self):
+        self.assertEqual(ticker.get_stock_ticker_isin("005930"),
+                         "KR7005930003")
+        self.assertEqual(self.calls, ["listed"])
+
+    def test_delisted_fetched_on_demand(self):
+        self.assertEqual(ticker.get_stock_name("030270"), "에스마크")
+        self.assertEqual(self.calls, ["listed", "delisted"])
+
+    def test_snapshot_reused_across_processes(self):
+        ticker.get_stock_ticker_isin("005930")
+        self._reset()
+        self.assertEqual(ticker.get_stock_ticekr_market("035720"), "STK")
+        self.assertEqual(self.calls, ["listed"])
+
+    def test_expired_snapshot_is_refetched(self):
+        ticker.get_stock_ticker_isin("005930")
+        self._reset()
+        with mock.patch.object(StockTicker, "ttl", -1):
+            ticker.get_stock_ticker_isin("005930")
+        self.assertEqual(self.calls, ["listed", "listed"])
+
+    def test_stale_snapshot_used_when_fetch_fails(self):
+        ticker.get_stock_ticker_isin("005930")
+        self._reset()
+        failing = {"stock_listed": _master([], self.calls, "listed"),
+                   "stock_delisted": _master([], self.calls, "delisted")}
+        with mock.patch.object(StockTicker, "ttl", -1), \
+                mock.patch.object(StockTicker, "_sources", failing):
+            self.assertEqual(ticker.get_stock_ticker_isin("005930"),
+                             "KR7005930003")
+
+
+
+class TickerIndexTest(_TickerTestCase):
+    def test_duplicated_delisted_ticker_resolved_by_isin(self):
+        row = StockTicker().lookup("030270")
+        self.assertEqual(row, ("에스마크", "KR7030270003", "KSQ"))
+        s = StockTicker().get("030270")
+        self.assertEqual(s['ISIN'], "KR7030270003")
+        self.assertIsNone(StockTicker().get("999999"))
+
+    def test_bulk_isins(self):
+        isins = ticker.get_stock_ticker_isins(
+            ["035720", "999999", "030270", "005930"])
+        self.assertEqual(isins, ["KR7035720002", None, "KR7030270003",
+                                 "KR7005930003"])
+
+    def test_bulk_isins_skip_delisted_when_all_listed(self):
+        ticker.get_stock_ticker_isins(["035720", "005930"])
+        self.assertEqual(self.calls, ["listed"])
+
+
+
+class ConcurrentInitTest(_TickerTestCase):
+    def test_singleton_initialized_once(self):
+        inits = []
+
+        @singleton
+        class Master:
+            def __init__(self):
+                time.sleep(0.1)
+                inits.append(threading.get_ident())
+                self.ready = True
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: Master().ready, range(8)))
+        self.assertTrue(all(results))
+        self.assertEqual(len(inits), 1)
+
+    def test_singleton_retries_failed_init(self):
+        attempts = []
+
+        @singleton
+        class Master:
+            def __init__(self):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise ConnectionError()
+
+        self.assertRaises(ConnectionError, Master)
+        Master()
+        self.assertEqual(len(attempts), 2)
+
+    def test_master_fetched_once(self):
+        slow = _master(LISTED, self.calls, "listed", delay=0.1)
+        with mock.patch.dict(StockTicker._sources, {"stock_listed": slow}):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                isins = list(executor.map(ticker.get_stock_ticker_isin,
+                                          ["005930"] * 8))
+        self.assertEqual(isins, ["KR7005930003"] * 8)
+        self.assertEqual(self.calls, ["listed"])
+
+    def test_warmup(self):
+        loaded = []
+        with mock.patch.object(krx, "IndexTicker",
+                               lambda: loaded.append("index")), \
+                mock.patch.object(krx, "EtxTicker") as etx, \
+                mock.patch.object(krx, "TradingCalendar") as calendar:
+            krx.warmup()
+        self.assertEqual(loaded, ["index"])
+        self.assertEqual(etx.return_value.get_table.call_count, 3)
+        self.assertEqual(sorted(self.calls), ["delisted", "listed"])
+        calendar.return_value.nearest.assert_called_once()
+
+
+
+_INDEXES = {
+    "01": [["300", "KRX 300", "2010.01.04", "5"],
+           ["042", "KRX 100", "2001.01.02", "5"]],
+    "02": [["001", "코스피", "1980.01.04", "1"],
+           ["028", "코스피 200", "1990.01.03", "1"]],
+    "03": [["001", "코스닥", "1996.07.01", "2"]],
+    "04": [["001", "테마지수", "2020.09.18", "4"]],
+}
+
+
+class IndexTickerTest(_TickerTestCase):
+    def setUp(self):
+        super().setUp()
+        calls = self.calls
+
+        class _Fetch:
+            def fetch(self, market):
+                time.sleep(0.1)
+                calls.append(market)
+                return pd.DataFrame(_INDEXES[market], columns=[
+                    'IDX_IND_CD', 'IDX_NM', 'BAS_TM_CONTN', 'IND_TP_CD'])
+
+        p = mock.patch.object(ticker, "전체지수기본정보", _Fetch)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_groups_fetched_concurrently(self):
+        start = time.monotonic()
+        IndexTicker()
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(sorted(self.calls), ["01", "02", "03", "04"])
+
+    def test_get_ticker(self):
+        self.assertEqual(IndexTicker().get_ticker("KOSPI", "20210104"),
+                         ["1001", "1028"])
+        self.assertEqual(IndexTicker().get_ticker("KOSPI", "19850101"),
+                         ["1001"])
+        self.assertEqual(IndexTicker().get_ticker("KRX", "20210104"),
+                         ["5042", "5300"])
+        self.assertEqual(IndexTicker().get_ticker("테마", "20200917"), [])
+        self.assertEqual(IndexTicker().get_ticker("KONEX", "20200917"), [])
+        self.assertEqual(IndexTicker().get_name("2001"), "코스닥")
+
+    def test_persisted(self):
+        IndexTicker()
+        self._reset()
+        self.assertEqual(IndexTicker().get_name("1028"), "코스피 200")
+        self.assertEqual(len(self.calls), 4)
+
+
+class IndexTickerFetchTest(_TickerTestCase):
+    """전체지수기본정보().fetch의 실제 결과로 지수 마스터를 만든다."""
+
+    def test_master_from_fetch(self):
+        def read(self, **params):
+            rows = [{"IDX_NM": name, "IDX_ENG_NM": name,
+                     "BAS_TM_CONTN": base, "ANNC_TM_CONTN": base,
+                     "BAS_IDX_CONTN": "100.00", "CALC_CYCLE_CONTN": "1초",
+                     "CALC_TM_CONTN": "", "COMPST_ISU_CNT": "10",
+                     "IND_TP_CD": group, "IDX_IND_CD": code}
+                    for code, name, base, group
+                    in _INDEXES[params['idxIndMidclssCd']]]
+            return _Response({"output": rows})
+
+        with mock.patch.object(Post, "read", read), \
+                mock.patch.object(KrxWebIo, "scheduler",
+                                  RequestScheduler(rate=None)):
+            self.assertEqual(IndexTicker().get_ticker("KOSPI", "20210104"),
+                             ["1001", "1028"])
+            self.assertEqual(IndexTicker().get_name("2001"), "코스닥")
+
+    def test_deferred_requests_reach_worker_threads(self):
+        calls = []
+
+        def read(self, **params):
+            calls.append(params)
+            raise ConnectionError()
+
+        with mock.patch.object(Post, "read", read), \
+                deferred_requests({}):
+            with self.assertRaises(PendingRequests) as cm:
+                IndexTicker()
+        self.assertEqual(calls, [])
+        # 네 시장의 요청을 한 번에 모아서 발생시킨다.
+        markets = sorted(params['idxIndMidclssCd']
+                         for params in cm.exception.requests)
+        self.assertEqual(markets, ["01", "02", "03", "04"])
+
+
+if __name__ == '__main__':
+    unittest.main()
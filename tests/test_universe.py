@@ -0,0 +1,143 @@
+import unittest
+import os
+import tempfile
+import shutil
+import pandas as pd
+from unittest import mock
+from pykrx.website.krx.market import universe
+from pykrx.website.krx.market.universe import UniverseIndex
+# pylint: disable-all
+# flake8: noqa
+
+DAYS = pd.bdate_range("20200101", "20201231")
+
+
+def _members(day):
+    """가상의 시장: A 계속 상장, B 3/16 상장, C 7/1 폐지(6/30까지),
+    D 5/4 ~ 5/6만 상장, E 11/2 상장"""
+    day = pd.Timestamp(day)
+    tickers = {"A"}
+    if day >= pd.Timestamp("20200316"):
+        tickers.add("B")
+    if day <= pd.Timestamp("20200630"):
+        tickers.add("C")
+    if pd.Timestamp("20200504") <= day <= pd.Timestamp("20200506"):
+        tickers.add("D")
+    if day >= pd.Timestamp("20201102"):
+        tickers.add("E")
+    return tickers
+
+
+class _Calendar:
+    def business_days(self, fromdate, todate):
+        return DAYS[(DAYS >= pd.Timestamp(fromdate)) &
+                    (DAYS <= pd.Timestamp(todate))]
+
+
+class UniverseIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.calls = []
+
+        def get_market_ticker_and_name(date, market):
+            self.calls.append(date)
+            return pd.Series("name", index=sorted(_members(date)))
+
+        patches = [
+            mock.patch.dict(os.environ, {"PYKRX_CACHE_DIR": self.root}),
+            mock.patch.object(universe, "get_market_ticker_and_name",
+                              get_market_ticker_and_name),
+            mock.patch.object(universe, "TradingCalendar", _Calendar),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_intervals_found_by_bisection(self):
+        index = UniverseIndex("KOSPI", step=5)
+        index.ensure("20200101", "20201231")
+        iv = index.intervals
+        self.assertEqual(tuple(iv.loc["B"]), ("20200316", "20201231"))
+        self.assertEqual(tuple(iv.loc["C"]), ("20200101", "20200630"))
+        self.assertEqual(tuple(iv.loc["D"]), ("20200504", "20200506"))
+        self.assertEqual(tuple(iv.loc["E"]), ("20201102", "20201231"))
+        self.assertLess(len(self.calls), len(DAYS) // 2)
+
+    def test_queries_match_snapshots(self):
+        index = UniverseIndex("KOSPI", step=5)
+        df = index.membership("20200101", "20201231")
+        calls = len(self.calls)
+        for day in DAYS:
+            self.assertEqual(set(df.columns[df.loc[day]]), _members(day))
+        self.assertEqual(index.get_tickers("20200505"), ["A", "B", "C", "D"])
+        self.assertEqual(len(self.calls), calls)
+
+    def test_extend_and_persist(self):
+        index = UniverseIndex("KOSPI", step=5)
+        index.ensure("20200401", "20200531")
+        index.ensure("20200101", "20201231")
+        self.assertEqual(tuple(index.intervals.loc["A"]),
+                         ("20200101", "20201231"))
+        self.assertEqual(len(index.intervals), 5)
+
+        calls = len(self.calls)
+        index = UniverseIndex("KOSPI", step=5)
+        self.assertTrue(index.covers("20200101", "20201231"))
+        self.assertEqual(index.get_tickers("20201231"), ["A", "B", "E"])
+        self.assertEqual(len(self.calls), calls)
+
+    def test_market_ticker_list_uses_index(self):
+        from pykrx import stock
+        with mock.patch.object(universe, "_indexes", {}):
+            universe.get_universe_index("KOSPI").ensure("20200101",
+                                                        "20200131")
+            calls = len(self.calls)
+            self.assertEqual(stock.get_market_ticker_list(
+                "20200110", use_universe=True), ["A", "C"])
+            self.assertEqual(len(self.calls), calls)
+
+    def test_aio_market_ticker_list_uses_index(self):
+        import asyncio
+        from pykrx import aio
+        with mock.patch.object(universe, "_indexes", {}):
+            universe.get_universe_index("KOSPI").ensure("20200101",
+                                                        "20200131")
+            tickers = asyncio.run(aio.get_market_ticker_list(
+                "20200110", use_universe=True))
+        self.assertEqual(tickers, ["A", "C"])
+
+    def test_market_ticker_list_queries_by_default(self):
+        from pykrx import stock
+        with mock.patch.object(universe, "_indexes", {}), \
+                mock.patch.object(stock.stock_api.krx,
+                                  "get_market_ticker_and_name",
+                                  lambda date, market: pd.Series(
+                                      "name", index=["Z"])):
+            universe.get_universe_index("KOSPI").ensure("20200101",
+                                                        "20200131")
+            self.assertEqual(stock.get_market_ticker_list("20200110"), ["Z"])
+
+    def test_failed_snapshot_is_not_saved(self):
+        fetch = universe.get_market_ticker_and_name
+
+        def get_market_ticker_and_name(date, market):
+            if date == "20200212":
+                return pd.DataFrame()
+            return fetch(date, market)
+
+        with mock.patch.object(universe, "get_market_ticker_and_name",
+                               get_market_ticker_and_name):
+            index = UniverseIndex("KOSPI", step=5)
+            self.assertRaises(ValueError, index.ensure, "20200101",
+                              "20200331")
+        self.assertIsNone(index.first)
+        self.assertIsNone(UniverseIndex("KOSPI", step=5).first)
+
+        index.ensure("20200101", "20200331")
+        self.assertEqual(tuple(index.intervals.loc["A"]),
+                         ("20200101", "20200331"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pykrx.website.comm.webio import SessionPool, Get, Post
+# pylint: disable-all
+# flake8: noqa
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self):
+        body = b'{"output": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self._reply()
+
+    def log_message(self, *args):
+        pass
+
+
+class SessionPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _make_io(self, pool, klass):
+        url = self.url
+
+        class _Io(klass):
+            @property
+            def url(self):
+                return url
+        _Io.pool = pool
+        return _Io()
+
+    def test_keep_alive_reuses_connection(self):
+        pool = SessionPool()
+        io = self._make_io(pool, Post)
+        for _ in range(5):
+            self.assertEqual(io.read(a=1).json(), {"output": []})
+        stats = pool.stats()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['hits'], 4)
+        pool.close()
+
+    def test_without_keep_alive(self):
+        pool = SessionPool(keep_alive=False)
+        io = self._make_io(pool, Get)
+        for _ in range(3):
+            io.read(a=1)
+        self.assertEqual(pool.stats()['hits'], 0)
+        pool.close()
+
+    def test_shared_between_threads(self):
+        pool = SessionPool(pool_maxsize=2, pool_block=True)
+        io = self._make_io(pool, Get)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: io.read(), range(20)))
+        stats = pool.stats()
+        self.assertEqual(stats['requests'], 20)
+        self.assertLessEqual(stats['connections'], 2)
+        pool.close()
+
+    def test_configure_resets_stats(self):
+        pool = SessionPool()
+        io = self._make_io(pool, Get)
+        io.read()
+        pool.configure(pool_maxsize=4)
+        self.assertEqual(pool.stats()['requests'], 0)
+        io.read()
+        self.assertEqual(pool.stats()['requests'], 1)
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()